@@ -0,0 +1,328 @@
+"""
+Cache adaptativo que escolhe a política em produção
+Serve com uma política ativa e mantém cópias "sombra" das outras,
+trocando de política quando uma sombra vence com folga
+
+Aluno D - Seleção Adaptativa
+"""
+
+from typing import Dict, List, Tuple
+import time
+import sys
+from pathlib import Path
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.cache_interface import CacheInterface
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+
+
+def _shadow_loader(text_number: int) -> Tuple[None, float]:
+    """Loader das sombras: não lê nada, as sombras guardam só chaves"""
+    return None, 0.0
+
+
+class AdaptiveCache(CacheInterface):
+    """
+    Meta-cache que troca a política ativa conforme a carga muda.
+
+    Funcionamento:
+    - A política ativa guarda o conteúdo e responde às requisições
+    - Cada outra política roda como sombra só de chaves sobre o mesmo fluxo,
+      sem registrar tempos de carregamento
+    - A cada janela de `window` requisições, compara o hit rate de todas
+    - Se uma sombra supera a ativa por pelo menos `margin` pontos
+      percentuais em `patience` janelas seguidas (histerese), ela passa a
+      ser a ativa
+    - Na troca, a sombra vencedora já tem o estado da política (ordem,
+      frequências); o conteúdo dos textos do hot set que a ativa antiga
+      tinha é migrado, e os demais são lidos do disco no primeiro acesso.
+      Até lá eles não contam como residentes (is_in_cache, keys, size) e
+      só textos realmente carregados são avisados ao on_evict
+    - Antecipações (prefetch) entram em todas as políticas, mas não contam
+      nos hit rates da janela
+
+    Exemplo:
+        Durante o dia o acesso é Zipf (LFU vence); à noite, varreduras em
+        laço (FIFO/ARC vencem). O AdaptiveCache segue a melhor política sem
+        intervenção manual.
+    """
+
+    def __init__(self, capacity: int = 10, policies: List = None,
+                 window: int = 500, margin: float = 5.0, patience: int = 2):
+        """
+        Inicializa o cache adaptativo
+
+        Args:
+            capacity: capacidade máxima do cache (padrão: 10 textos)
+            policies: classes das políticas candidatas; a primeira começa ativa
+                      (padrão: LRU, LFU, FIFO, ARC)
+            window: requisições por janela de avaliação
+            margin: vantagem mínima, em pontos percentuais de hit rate
+            patience: janelas seguidas de vantagem necessárias para trocar
+        """
+        super().__init__(capacity)
+
+        self.policy_classes = policies or [LRUCache, LFUCache, FIFOCache, ARCCache]
+        self.window = window
+        self.margin = margin
+        self.patience = patience
+
+        self.switches = []   # Histórico: (requisição, de, para, hit rates da janela)
+        self._reset_policies()
+
+    def _reset_policies(self):
+        """Recria a política ativa, as sombras e os contadores da janela"""
+        self.policies = {cls.__name__: cls(capacity=self.capacity)
+                         for cls in self.policy_classes}
+        # Só os metadados das políticas internas importam: o tempo de cada
+        # requisição é registrado uma vez, pelo próprio AdaptiveCache
+        for policy in self.policies.values():
+            policy.record_load_times = False
+        self.active_name = self.policy_classes[0].__name__
+        self.active = self.policies[self.active_name]
+        self.active.on_evict = self._release
+
+        # Textos da política ativa cujo conteúdo foi carregado (os herdados
+        # de uma sombra na troca ficam de fora até o primeiro acesso)
+        self.loaded = set()
+
+        self.window_hits = dict.fromkeys(self.policies, 0)
+        self.window_requests = 0
+        self.streak_name = None
+        self.streak = 0
+
+    def get(self, text_number: int, loader_function) -> Tuple[str, float, bool]:
+        """
+        Obtém um texto pela política ativa e atualiza as sombras
+
+        Args:
+            text_number: número do texto desejado
+            loader_function: função para carregar do disco se necessário
+
+        Returns:
+            tuple: (conteúdo, tempo_de_carregamento, cache_hit)
+        """
+        self.total_requests += 1
+        start_time = time.time()
+
+        content, load_time, policy_hit = self.active.get(text_number, loader_function)
+        was_hit = policy_hit
+
+        if policy_hit and text_number not in self.loaded:
+            # Texto herdado da sombra na troca, ainda sem conteúdo
+            content, disk_load_time = loader_function(text_number)
+            self.active._replace_content(text_number, content)
+            was_hit = False
+
+        if self.active.is_in_cache(text_number):
+            self.loaded.add(text_number)
+
+        if was_hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        # As sombras veem o mesmo fluxo, só com chaves
+        self.window_hits[self.active_name] += policy_hit
+        for name, shadow in self.policies.items():
+            if shadow is not self.active:
+                self.window_hits[name] += shadow.get(text_number, _shadow_loader)[2]
+
+        self.window_requests += 1
+        if self.window_requests >= self.window:
+            self._evaluate_window()
+
+        total_time = time.time() - start_time
+        self._record_load_time(total_time)
+
+        return content, total_time, was_hit
+
+    def prefetch(self, text_number: int, loader_function) -> bool:
+        """
+        Antecipa um texto na política ativa e nas sombras
+
+        A antecipação não é uma requisição: não conta nas métricas nem nos
+        hit rates da janela que decidem a troca de política.
+
+        Args:
+            text_number: número do texto a antecipar
+            loader_function: função para carregar do disco
+
+        Returns:
+            bool: True se o texto foi carregado, False se já estava no cache
+        """
+        if self.is_in_cache(text_number):
+            return False
+
+        if self.active.is_in_cache(text_number):
+            # Herdado na troca: a política já o tem, falta só o conteúdo
+            content, disk_load_time = loader_function(text_number)
+            self.active._replace_content(text_number, content)
+        else:
+            self.active.prefetch(text_number, loader_function)
+        if self.active.is_in_cache(text_number):
+            self.loaded.add(text_number)
+
+        for shadow in self.policies.values():
+            if shadow is not self.active:
+                shadow.prefetch(text_number, _shadow_loader)
+        return True
+
+    def _evaluate_window(self):
+        """Compara os hit rates da janela e troca de política se houver vencedor estável"""
+        rates = {name: hits / self.window_requests * 100
+                 for name, hits in self.window_hits.items()}
+        best_name = max(rates, key=rates.get)
+
+        if best_name != self.active_name and rates[best_name] - rates[self.active_name] >= self.margin:
+            self.streak = self.streak + 1 if best_name == self.streak_name else 1
+            self.streak_name = best_name
+        else:
+            self.streak_name = None
+            self.streak = 0
+
+        if self.streak >= self.patience:
+            self._switch_to(best_name, rates)
+
+        self.window_hits = dict.fromkeys(self.policies, 0)
+        self.window_requests = 0
+
+    def _switch_to(self, name: str, rates: Dict[str, float]):
+        """
+        Promove uma sombra a política ativa, migrando o hot set
+
+        Args:
+            name: nome da política vencedora
+            rates: hit rates da última janela (para o histórico)
+        """
+        old = self.active
+        new = self.policies[name]
+
+        # Migra o conteúdo dos textos carregados que as duas políticas têm em comum
+        old_contents = {text_number: old.peek(text_number) for text_number in self.loaded}
+        for text_number in new.keys():
+            if text_number in old_contents:
+                new._replace_content(text_number, old_contents[text_number])
+
+        # A antiga ativa vira sombra: descarta o conteúdo, mantém o estado
+        for text_number in old.keys():
+            old._replace_content(text_number, None)
+        old.on_evict = None
+
+        # Textos que só a antiga tinha saem do cache servido; os demais da
+        # nova ficam sem conteúdo até o primeiro acesso
+        self.loaded = {text_number for text_number in old_contents
+                       if new.is_in_cache(text_number)}
+        for text_number in old_contents:
+            if text_number not in self.loaded:
+                self._notify_evict(text_number)
+
+        new.on_evict = self._release
+        self.active = new
+        self.active_name = name
+        self.switches.append((self.total_requests, old.__class__.__name__, name, rates))
+        self.streak_name = None
+        self.streak = 0
+
+    def _release(self, text_number: int):
+        """on_evict da política ativa: só avisa a remoção de textos carregados"""
+        if text_number in self.loaded:
+            self.loaded.discard(text_number)
+            self._notify_evict(text_number)
+
+    def _evict(self) -> int:
+        """
+        A remoção é feita pela política ativa dentro do seu próprio get
+
+        Returns:
+            None
+        """
+        return None
+
+    def is_in_cache(self, text_number: int) -> bool:
+        """Verifica se um texto está carregado na política ativa"""
+        return text_number in self.loaded
+
+    def is_full(self) -> bool:
+        """Verifica se a política ativa está cheia"""
+        return self.active.is_full()
+
+    def size(self) -> int:
+        """Retorna o número de textos carregados na política ativa"""
+        return len(self.loaded)
+
+    def keys(self) -> list:
+        """Retorna os textos carregados da política ativa"""
+        return [text_number for text_number in self.active.keys()
+                if text_number in self.loaded]
+
+    def _replace_content(self, text_number: int, content):
+        """Troca o conteúdo de um texto na política ativa"""
+        self.active._replace_content(text_number, content)
+
+    def clear(self):
+        """Limpa o cache, volta à política inicial e reseta as métricas"""
+        super().clear()
+        self.switches = []
+        self._reset_policies()
+
+    def get_metrics(self) -> Dict:
+        """
+        Retorna as métricas, incluindo a política ativa e o número de trocas
+
+        Returns:
+            dict: métricas do CacheInterface + 'active_policy' e 'switches'
+        """
+        metrics = super().get_metrics()
+        metrics['active_policy'] = self.active_name
+        metrics['switches'] = len(self.switches)
+        return metrics
+
+    def __str__(self) -> str:
+        """Representação em string do cache"""
+        return (f"AdaptiveCache(capacity={self.capacity}, size={self.size()}, "
+                f"active={self.active_name})")
+
+
+# Testes e exemplos de uso
+if __name__ == "__main__":
+    import numpy as np
+
+    print("="*70)
+    print("TESTE DO CACHE ADAPTATIVO")
+    print("="*70)
+
+    def mock_loader(text_number):
+        """Simula carregamento do disco"""
+        return f"Conteúdo do texto {text_number}", 0.0
+
+    # Carga que muda: hot set estável (frequência importa) e depois um
+    # laço cíclico um pouco maior que o cache (recência atrapalha)
+    rng = np.random.default_rng(0)
+    hot_phase = np.where(rng.random(6000) < 0.7, rng.integers(1, 9, 6000),
+                         rng.integers(1, 101, 6000))
+    loop_phase = np.tile(np.arange(1, 13), 500)
+    requests = np.concatenate([hot_phase, loop_phase, hot_phase]).tolist()
+
+    cache = AdaptiveCache(capacity=10, window=500)
+    for text_number in requests:
+        cache.get(text_number, mock_loader)
+
+    print(f"\nTrocas de política ({len(cache.switches)}):")
+    for request_num, old, new, rates in cache.switches:
+        print(f"  requisição {request_num:>6}: {old} → {new} "
+              f"({rates[old]:.1f}% → {rates[new]:.1f}% na janela)")
+
+    print("\nComparação com políticas fixas:")
+    for cls in cache.policy_classes:
+        fixed = cls(capacity=10)
+        for text_number in requests:
+            fixed.get(text_number, mock_loader)
+        print(f"  {cls.__name__:<14} {fixed.get_metrics()['hit_rate']:.2f}%")
+
+    cache.print_metrics()
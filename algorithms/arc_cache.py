@@ -83,7 +83,7 @@ class ARCCache(CacheInterface):
                 content = self.LFU[text_number]
                 
             load_time = time.time() - start_time
-            self.load_times.append(load_time)
+            self._record_load_time(load_time)
             return content, load_time, True
         
         # CASE 2: HIT em B1 (texto foi removido recentemente de LRU)
@@ -111,7 +111,7 @@ class ARCCache(CacheInterface):
         self._add_to_cache(text_number, content)
         
         total_time = time.time() - start_time
-        self.load_times.append(total_time)
+        self._record_load_time(total_time)
         
         return content, total_time, False
     
@@ -172,6 +172,7 @@ class ARCCache(CacheInterface):
             if self.LRU:
                 oldest, content = self.LRU.popitem(last=False)
                 self.B1[oldest] = None
+                self._notify_evict(oldest)
                 # Limita tamanho de B1
                 if len(self.B1) > self.capacity:
                     self.B1.popitem(last=False)
@@ -180,6 +181,7 @@ class ARCCache(CacheInterface):
             if self.LFU:
                 oldest, content = self.LFU.popitem(last=False)
                 self.B2[oldest] = None
+                self._notify_evict(oldest)
                 # Limita tamanho de B2
                 if len(self.B2) > self.capacity:
                     self.B2.popitem(last=False)
@@ -216,6 +218,29 @@ class ARCCache(CacheInterface):
         """
         return len(self.LRU) + len(self.LFU)
     
+    def keys(self) -> list:
+        """
+        Retorna os números dos textos que estão no cache (LRU e LFU)
+        """
+        return list(self.LRU) + list(self.LFU)
+    
+    def peek(self, text_number: int):
+        """
+        Retorna o conteúdo de um texto sem contar como acesso
+        """
+        if text_number in self.LRU:
+            return self.LRU[text_number]
+        return self.LFU.get(text_number)
+    
+    def _replace_content(self, text_number: int, content):
+        """
+        Troca o conteúdo de um texto sem mudá-lo de lista
+        """
+        if text_number in self.LRU:
+            self.LRU[text_number] = content
+        elif text_number in self.LFU:
+            self.LFU[text_number] = content
+    
     def clear(self):
         """
         Limpa o cache e reseta as métricas
@@ -63,7 +63,7 @@ class FIFOCache(CacheInterface):
             self.hits += 1
             content = self.cache[text_number]
             load_time = time.time() - start_time
-            self.load_times.append(load_time)
+            self._record_load_time(load_time)
             return content, load_time, True
         
         # CACHE MISS - texto não está no cache
@@ -73,6 +73,7 @@ class FIFOCache(CacheInterface):
         if self.is_full():
             removed = self._evict()
             del self.cache[removed]
+            self._notify_evict(removed)
         
         # Carrega o texto do disco
         content, disk_load_time = loader_function(text_number)
@@ -82,7 +83,7 @@ class FIFOCache(CacheInterface):
         self.queue.append(text_number)
         
         total_time = time.time() - start_time
-        self.load_times.append(total_time)
+        self._record_load_time(total_time)
         
         return content, total_time, False
     
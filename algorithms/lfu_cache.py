@@ -83,7 +83,7 @@ class LFUCache(CacheInterface):
             
             content = self.cache[text_number]
             load_time = time.time() - start_time
-            self.load_times.append(load_time)
+            self._record_load_time(load_time)
             return content, load_time, True
         
         # CACHE MISS - texto não está no cache
@@ -94,6 +94,7 @@ class LFUCache(CacheInterface):
             removed = self._evict()
             del self.cache[removed]
             del self.frequency[removed]
+            self._notify_evict(removed)
         
         # Carrega o texto do disco
         content, disk_load_time = loader_function(text_number)
@@ -105,7 +106,7 @@ class LFUCache(CacheInterface):
         self.min_freq = 1
         
         total_time = time.time() - start_time
-        self.load_times.append(total_time)
+        self._record_load_time(total_time)
         
         return content, total_time, False
     
@@ -82,7 +82,7 @@ class LRUCache(CacheInterface):
             
             content = self.cache[text_number]
             load_time = time.time() - start_time
-            self.load_times.append(load_time)
+            self._record_load_time(load_time)
             return content, load_time, True
         
         # CACHE MISS - texto não está no cache
@@ -94,6 +94,7 @@ class LRUCache(CacheInterface):
             del self.cache[removed]
             if removed in self.last_access:
                 del self.last_access[removed]
+            self._notify_evict(removed)
         
         # Carrega o texto do disco
         content, disk_load_time = loader_function(text_number)
@@ -103,7 +104,7 @@ class LRUCache(CacheInterface):
         self.last_access[text_number] = time.time()
         
         total_time = time.time() - start_time
-        self.load_times.append(total_time)
+        self._record_load_time(total_time)
         
         return content, total_time, False
     
@@ -0,0 +1,355 @@
+"""
+Macro benchmark do caminho de atendimento (TextLoader + cache)
+Clientes concorrentes pedem textos a um cache compartilhado, que lê do
+disco com um perfil de disco lento; mede vazão, latência p50/p99 e pico de
+memória (RSS) para cada algoritmo, padrão de acesso e número de clientes
+
+Uso:
+    python benchmarks/macro.py --saida benchmarks/macro.json
+    python benchmarks/macro.py --base benchmarks/macro.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+import argparse
+import itertools
+import json
+import multiprocessing
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+from core.text_loader import DISK_PROFILES, open_loader
+from simulation.request_generator import PATTERNS
+from simulation.simulation_engine import SimulationEngine
+
+try:
+    import resource
+except ImportError:    # Windows: sem pico de RSS
+    resource = None
+
+
+ALGORITHMS = {'fifo': FIFOCache, 'lru': LRUCache, 'lfu': LFUCache, 'arc': ARCCache}
+DEFAULT_CLIENTS = [1, 8, 64]
+
+MACRO_VERSION = 2
+
+
+def peak_rss_mb() -> float:
+    """
+    Pico de memória residente do processo, em MB
+
+    Returns:
+        float: pico de RSS, ou None se o módulo resource não existir
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS, em bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def build_traces(loader, patterns: List[str], num_requests: int,
+                 cache_capacity: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Gera uma sequência fixa por padrão (mesma semente em toda execução)
+
+    Args:
+        loader: loader do corpus (define o número de textos)
+        patterns: padrões do RequestGenerator
+        num_requests: requisições por padrão
+        cache_capacity: capacidade do cache (define o laço do padrão 'loop')
+        seed: semente das sequências
+
+    Returns:
+        dict: {padrão: array de números de textos}
+    """
+    engine = SimulationEngine(loader, seed=seed)
+    return {pattern: engine.generate_user_trace(pattern, 1, num_requests, cache_capacity)[0]
+            for pattern in patterns}
+
+
+def serve_trace(texts_dir: str, disk_profile: str, algorithm: str, cache_capacity: int,
+                trace: np.ndarray, num_clients: int) -> Dict:
+    """
+    Atende uma sequência com num_clients clientes sobre um cache compartilhado
+
+    Cada cliente é uma thread que, com o lock do cache (os caches não são
+    thread-safe), pega a próxima requisição da sequência compartilhada e a
+    aplica à política: a ordem dos acessos, e portanto o hit rate, é a mesma
+    para qualquer número de clientes. A leitura do disco em um miss é feita
+    fora do lock, então clientes com hits (ou outros misses) não esperam por
+    ela; a entrada fica sem conteúdo até a leitura terminar e quem pede o
+    mesmo texto nesse meio-tempo (delayed hit) espera a leitura em curso em
+    vez de ler de novo. A latência de uma requisição inclui a espera pelo
+    lock, que também é medida à parte, e a leitura (própria ou em curso).
+
+    Args:
+        texts_dir: diretório do corpus
+        disk_profile: perfil de disco lento (core.text_loader.DISK_PROFILES)
+        algorithm: 'fifo', 'lru', 'lfu' ou 'arc'
+        cache_capacity: capacidade do cache
+        trace: sequência de números de textos
+        num_clients: número de clientes simultâneos
+
+    Returns:
+        dict: requisições, hit rate, delayed hits, duração, vazão, latências
+              p50/p99, espera média pelo lock e pico de RSS do processo
+    """
+    loader = open_loader(texts_dir, disk_profile)
+    cache = ALGORITHMS[algorithm](capacity=cache_capacity)
+
+    # Lê cada texto uma vez (sem o perfil) para que o cache do sistema
+    # operacional não misture o disco real com o perfil simulado
+    warm_loader = open_loader(texts_dir)
+    for text_number in np.unique(trace).tolist():
+        warm_loader.load_text(text_number)
+
+    def pending_loader(text_number):
+        """Loader da política: a leitura real acontece fora do lock"""
+        return None, 0.0
+
+    requests = trace.tolist()
+    latencies = np.empty(len(requests), dtype=np.float64)
+    lock_waits = np.zeros(len(requests), dtype=np.float64)
+    next_request = itertools.count().__next__
+    lock = threading.Lock()
+    in_flight = {}         # Texto -> Event da leitura em curso
+    delayed_hits = 0
+    start_barrier = threading.Barrier(num_clients + 1)
+
+    def client():
+        nonlocal delayed_hits
+        get = cache.get
+        load_text = loader.load_text
+        start_barrier.wait()
+        while True:
+            t0 = time.perf_counter()
+            with lock:
+                waited = time.perf_counter() - t0
+                i = next_request()
+                if i >= len(requests):
+                    break
+                text_number = requests[i]
+                content, load_time, was_hit = get(text_number, pending_loader)
+                reading = in_flight.get(text_number)
+                if reading is not None:
+                    delayed_hits += was_hit
+                elif not was_hit:
+                    in_flight[text_number] = threading.Event()
+
+            if reading is not None:
+                # Outro cliente já está lendo este texto
+                reading.wait()
+            elif not was_hit:
+                content, load_time = load_text(text_number)
+                t1 = time.perf_counter()
+                with lock:
+                    waited += time.perf_counter() - t1
+                    # Sem efeito se o texto já saiu do cache durante a leitura
+                    cache._replace_content(text_number, content)
+                    in_flight.pop(text_number).set()
+
+            lock_waits[i] = waited
+            latencies[i] = time.perf_counter() - t0
+
+    threads = [threading.Thread(target=client) for _ in range(num_clients)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start_time
+
+    metrics = cache.get_metrics()
+    return {
+        'requests': len(trace),
+        'hit_rate': metrics['hit_rate'],
+        'delayed_hits': delayed_hits,
+        'duration': duration,
+        'throughput': len(trace) / duration if duration > 0 else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1000,
+        'p99_ms': float(np.percentile(latencies, 99)) * 1000,
+        'lock_wait_ms': float(lock_waits.mean()) * 1000,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def _serve_cell(cell: tuple) -> Dict:
+    """Executa uma célula no processo worker"""
+    return serve_trace(*cell)
+
+
+def run_macro_benchmark(texts_dir: str = "texts", disk_profile: str = 'lento',
+                        algorithms: List[str] = None, patterns: List[str] = None,
+                        clients: List[int] = None, num_requests: int = 1000,
+                        cache_capacity: int = 10, seed: int = 0) -> Dict:
+    """
+    Executa a grade algoritmo × padrão × clientes
+
+    Cada célula roda em um processo novo, então o pico de RSS é o da
+    própria célula (interpretador incluído) e um cache não aquece o outro.
+
+    Returns:
+        dict: {'metadata': ambiente e parâmetros, 'results': [células],
+               'summary': vazão geral}
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    patterns = patterns or PATTERNS
+    clients = clients or DEFAULT_CLIENTS
+
+    traces = build_traces(open_loader(texts_dir), patterns, num_requests, cache_capacity, seed)
+
+    print(f"Perfil de disco: {disk_profile} {DISK_PROFILES[disk_profile]}")
+    print(f"{num_requests} requisições por padrão, capacidade {cache_capacity}\n")
+
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for pattern in patterns:
+        for algorithm in algorithms:
+            for num_clients in clients:
+                cell = (texts_dir, disk_profile, algorithm, cache_capacity,
+                        traces[pattern], num_clients)
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(_serve_cell, cell).result()
+                result.update({'algorithm': algorithm, 'pattern': pattern,
+                               'clients': num_clients})
+                results.append(result)
+                print(f"  {pattern:<9} {algorithm:<5} {num_clients:>3} clientes: "
+                      f"{result['throughput']:>8.0f} req/s  p50 {result['p50_ms']:6.2f}ms  "
+                      f"p99 {result['p99_ms']:6.2f}ms  lock {result['lock_wait_ms']:6.3f}ms  "
+                      f"hit rate {result['hit_rate']:5.1f}%")
+
+    total_requests = sum(r['requests'] for r in results)
+    total_time = sum(r['duration'] for r in results)
+
+    return {
+        'metadata': {
+            'version': MACRO_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'texts_dir': str(texts_dir),
+            'disk_profile': disk_profile,
+            'num_requests': num_requests,
+            'cache_capacity': cache_capacity,
+            'seed': seed
+        },
+        'results': results,
+        'summary': {
+            'throughput': total_requests / total_time if total_time > 0 else 0.0
+        }
+    }
+
+
+def summarize_by_client_count(results: List[Dict]) -> Dict:
+    """
+    Agrega as células por (algoritmo, clientes), somando os padrões
+
+    Returns:
+        dict: {(algoritmo, clientes): vazão, p50, p99 e espera pelo lock
+               médios e pico de RSS}
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault((result['algorithm'], result['clients']), []).append(result)
+
+    summary = {}
+    for key, group in groups.items():
+        duration = sum(r['duration'] for r in group)
+        rss = [r['peak_rss_mb'] for r in group if r['peak_rss_mb'] is not None]
+        summary[key] = {
+            'throughput': sum(r['requests'] for r in group) / duration if duration > 0 else 0.0,
+            'p50_ms': float(np.mean([r['p50_ms'] for r in group])),
+            'p99_ms': float(np.mean([r['p99_ms'] for r in group])),
+            # Execuções da versão 1 não mediam a espera pelo lock
+            'lock_wait_ms': float(np.mean([r.get('lock_wait_ms', np.nan) for r in group])),
+            'peak_rss_mb': max(rss) if rss else None
+        }
+    return summary
+
+
+def print_comparison_table(current: Dict, baseline: Dict = None):
+    """
+    Exibe a tabela por algoritmo e número de clientes (médias dos padrões)
+
+    Args:
+        current: resultado de run_macro_benchmark
+        baseline: resultado salvo de uma execução anterior (opcional); acrescenta
+                  a razão de vazão atual/base
+    """
+    summary = summarize_by_client_count(current['results'])
+    base_summary = summarize_by_client_count(baseline['results']) if baseline else {}
+
+    print("\n" + "="*80)
+    print(f"ATENDIMENTO (perfil '{current['metadata']['disk_profile']}', médias dos padrões)")
+    print("="*80)
+    print(f"{'Algoritmo':<10} {'Clientes':>8} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'lock (ms)':>9} {'RSS (MB)':>9}" + (f" {'vs base':>8}" if baseline else ""))
+    print("-"*80)
+    for (algorithm, num_clients), stats in summary.items():
+        rss = f"{stats['peak_rss_mb']:.1f}" if stats['peak_rss_mb'] is not None else "-"
+        line = (f"{algorithm:<10} {num_clients:>8} {stats['throughput']:>9.0f} "
+                f"{stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f} "
+                f"{stats['lock_wait_ms']:>9.3f} {rss:>9}")
+        reference = base_summary.get((algorithm, num_clients))
+        if reference:
+            line += f" {stats['throughput'] / reference['throughput']:>7.2f}x"
+        print(line)
+
+    line = f"\n📦 Vazão geral: {current['summary']['throughput']:.0f} req/s"
+    if baseline:
+        line += (f" (base: {baseline['summary']['throughput']:.0f} req/s, "
+                 f"{current['summary']['throughput'] / baseline['summary']['throughput']:.2f}x)")
+    print(line)
+
+
+def main():
+    """Interface de linha de comando"""
+    parser = argparse.ArgumentParser(
+        description="Macro benchmark do atendimento: TextLoader + cache com clientes concorrentes")
+    parser.add_argument("--textos", default="texts", help="diretório do corpus (padrão: texts)")
+    parser.add_argument("--perfil", choices=DISK_PROFILES, default='lento',
+                        help="perfil de disco lento (padrão: lento)")
+    parser.add_argument("--algoritmos", nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--padroes", nargs='+', choices=PATTERNS, default=PATTERNS)
+    parser.add_argument("--clientes", type=int, nargs='+', default=DEFAULT_CLIENTS)
+    parser.add_argument("--requisicoes", type=int, default=1000, help="requisições por padrão")
+    parser.add_argument("--capacidade", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--saida", help="grava os resultados em JSON")
+    parser.add_argument("--base", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("MACRO BENCHMARK DO ATENDIMENTO")
+    print("="*70)
+    current = run_macro_benchmark(args.textos, args.perfil, args.algoritmos, args.padroes,
+                                  args.clientes, args.requisicoes, args.capacidade, args.seed)
+
+    baseline = None
+    if args.base:
+        with open(args.base, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_comparison_table(current, baseline)
+
+    if args.saida:
+        Path(args.saida).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"💾 Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
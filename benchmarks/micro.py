@@ -0,0 +1,394 @@
+"""
+Micro benchmarks dos caminhos críticos dos caches
+Mede o custo de get() em um hit, get() em um miss (com remoção) e _evict()
+para FIFO, LRU, LFU e ARC, em ns/op e alocações retidas por operação, e
+compara com uma base salva em JSON
+
+Uso:
+    python benchmarks/micro.py --saida benchmarks/base.json       # grava a base
+    python benchmarks/micro.py --base benchmarks/base.json        # compara
+"""
+
+from typing import Callable, Dict, List, Tuple
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+
+
+ALGORITHMS = {'fifo': FIFOCache, 'lru': LRUCache, 'lfu': LFUCache, 'arc': ARCCache}
+OPERATIONS = ('hit', 'miss', 'evict')
+DEFAULT_CAPACITIES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+BENCHMARK_VERSION = 1
+
+# Operações por medição de alocações (depois do aquecimento)
+ALLOCATION_OPS = 10_000
+
+
+def _loader(text_number: int) -> Tuple[int, float]:
+    """Loader em memória: sem disco nem strings, mede só a política"""
+    return text_number, 0.0
+
+
+def _filled_cache(cache_class, capacity: int):
+    """Cria um cache cheio com os textos 1..capacity (todos com um acesso)"""
+    cache = cache_class(capacity=capacity)
+    get = cache.get
+    for text_number in range(1, capacity + 1):
+        get(text_number, _loader)
+    return cache
+
+
+class _HitBenchmark:
+    """get() de textos que estão no cache, em ordem aleatória"""
+
+    # Operações por lote cronometrado (None = todas de uma vez)
+    max_batch = None
+
+    def prepare(self, cache_class, capacity: int):
+        cache = _filled_cache(cache_class, capacity)
+        keys = cache.keys()
+        random.Random(capacity).shuffle(keys)
+        return {'cache': cache, 'keys': keys}
+
+    def batch(self, state, num_ops: int) -> Callable:
+        cache = state['cache']
+        keys = state['keys']
+        requests = (keys * (num_ops // len(keys) + 1))[:num_ops]
+        get = cache.get
+
+        def run():
+            for text_number in requests:
+                get(text_number, _loader)
+        return run
+
+
+class _MissBenchmark:
+    """get() de textos novos com o cache cheio (carga + remoção)"""
+
+    max_batch = None
+
+    def prepare(self, cache_class, capacity: int):
+        return {'cache': _filled_cache(cache_class, capacity), 'next_key': capacity + 1}
+
+    def batch(self, state, num_ops: int) -> Callable:
+        cache = state['cache']
+        requests = list(range(state['next_key'], state['next_key'] + num_ops))
+        state['next_key'] += num_ops
+        get = cache.get
+
+        def run():
+            for text_number in requests:
+                get(text_number, _loader)
+        return run
+
+
+class _EvictBenchmark:
+    """
+    _evict() com o cache cheio
+
+    Em FIFO, LFU e ARC a escolha da vítima também a tira das estruturas da
+    política, então cada cache aguenta no máximo `capacity` remoções: cada
+    lote usa caches novos, preenchidos fora da medição. O LRU só escolhe a
+    vítima (get() a remove do dicionário).
+    """
+
+    # Limita os caches preparados por lote (capacidades pequenas)
+    max_batch = 100_000
+
+    def prepare(self, cache_class, capacity: int):
+        return {'cache_class': cache_class, 'capacity': capacity, 'cache': None, 'remaining': 0}
+
+    def batch(self, state, num_ops: int) -> Callable:
+        evictions = []
+        while len(evictions) < num_ops:
+            # Continua no cache do lote anterior enquanto ele tiver o que remover
+            if state['remaining'] == 0:
+                state['cache'] = _filled_cache(state['cache_class'], state['capacity'])
+                state['remaining'] = state['capacity']
+            count = min(state['remaining'], num_ops - len(evictions))
+            evictions += [state['cache']._evict] * count
+            state['remaining'] -= count
+
+        def run():
+            for evict in evictions:
+                evict()
+        return run
+
+
+BENCHMARKS = {'hit': _HitBenchmark(), 'miss': _MissBenchmark(), 'evict': _EvictBenchmark()}
+
+
+class _Runner:
+    """Executa lotes de uma operação sobre um estado preparado uma única vez"""
+
+    def __init__(self, benchmark, cache_class, capacity: int):
+        self.benchmark = benchmark
+        self.cache_class = cache_class
+        self.capacity = capacity
+        self.state = None
+
+    def _batches(self, num_ops: int):
+        """Lotes (função, tamanho) que somam num_ops operações"""
+        if self.state is None:
+            self.state = self.benchmark.prepare(self.cache_class, self.capacity)
+        max_batch = self.benchmark.max_batch or num_ops
+        while num_ops > 0:
+            size = min(num_ops, max_batch)
+            num_ops -= size
+            yield self.benchmark.batch(self.state, size), size
+
+    def time_ops(self, num_ops: int) -> int:
+        """
+        Executa num_ops operações
+
+        Returns:
+            int: tempo total em nanossegundos (só das operações, sem o preparo)
+        """
+        elapsed = 0
+        for run, _ in self._batches(num_ops):
+            start = time.perf_counter_ns()
+            run()
+            elapsed += time.perf_counter_ns() - start
+        return elapsed
+
+    def retained_allocations(self, num_ops: int) -> Tuple[float, float]:
+        """
+        Mede as alocações retidas (líquidas) por operação com tracemalloc
+
+        Conta blocos e bytes que continuam alocados depois das operações,
+        como as listas de frequência vazias do LFU; alocações temporárias
+        não aparecem.
+
+        Returns:
+            tuple: (blocos por operação, bytes por operação)
+        """
+        blocks = 0
+        size = 0
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+        tracemalloc.start()
+        try:
+            for run, batch_size in self._batches(num_ops):
+                before = tracemalloc.take_snapshot().filter_traces(ignore)
+                run()
+                after = tracemalloc.take_snapshot().filter_traces(ignore)
+                for stat in after.compare_to(before, 'filename'):
+                    blocks += stat.count_diff
+                    size += stat.size_diff
+        finally:
+            tracemalloc.stop()
+        return blocks / num_ops, size / num_ops
+
+
+def calibrate(runner: _Runner, min_time: float) -> int:
+    """
+    Encontra o número de operações cuja execução leva pelo menos min_time
+
+    As rodadas de calibração também servem de aquecimento.
+
+    Args:
+        runner: executor da operação
+        min_time: duração mínima de uma medição, em segundos
+
+    Returns:
+        int: número de operações por medição
+    """
+    num_ops = 100
+    while True:
+        elapsed = runner.time_ops(num_ops) / 1e9
+        if elapsed >= min_time:
+            return num_ops
+        # Estima pelo tempo medido, com folga, e no máximo 10x por rodada
+        num_ops = int(num_ops * min(10.0, 1.2 * min_time / max(elapsed, 1e-6))) + 1
+
+
+def benchmark_operation(algorithm: str, operation: str, capacity: int,
+                        min_time: float = 0.1, repeats: int = 5) -> Dict:
+    """
+    Mede uma operação de um algoritmo em uma capacidade
+
+    Args:
+        algorithm: 'fifo', 'lru', 'lfu' ou 'arc'
+        operation: 'hit', 'miss' ou 'evict'
+        capacity: capacidade do cache
+        min_time: duração mínima de cada medição, em segundos
+        repeats: medições; o resultado principal é a mais rápida
+
+    Returns:
+        dict: ns/op (melhor e mediana), operações por medição e alocações
+              retidas por operação
+    """
+    runner = _Runner(BENCHMARKS[operation], ALGORITHMS[algorithm], capacity)
+
+    num_ops = calibrate(runner, min_time)
+    runner.time_ops(num_ops)    # aquecimento com o tamanho final
+
+    samples = sorted(runner.time_ops(num_ops) / num_ops for _ in range(repeats))
+    blocks, size = runner.retained_allocations(min(num_ops, ALLOCATION_OPS))
+
+    return {
+        'algorithm': algorithm,
+        'operation': operation,
+        'capacity': capacity,
+        'ns_per_op': samples[0],
+        'ns_per_op_median': samples[len(samples) // 2],
+        'ops_per_sample': num_ops,
+        'alloc_blocks_per_op': blocks,
+        'alloc_bytes_per_op': size
+    }
+
+
+def run_benchmarks(algorithms: List[str] = None, operations: List[str] = None,
+                   capacities: List[int] = None, min_time: float = 0.1,
+                   repeats: int = 5) -> Dict:
+    """
+    Mede todas as combinações algoritmo × operação × capacidade
+
+    Returns:
+        dict: {'metadata': ambiente e parâmetros, 'results': [medições]}
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    operations = operations or list(OPERATIONS)
+    capacities = capacities or DEFAULT_CAPACITIES
+
+    results = []
+    for capacity in capacities:
+        for algorithm in algorithms:
+            for operation in operations:
+                result = benchmark_operation(algorithm, operation, capacity, min_time, repeats)
+                results.append(result)
+                print(f"  {algorithm:<5} {operation:<6} {capacity:>9}: "
+                      f"{result['ns_per_op']:>9.1f} ns/op  "
+                      f"{result['alloc_blocks_per_op']:>6.2f} blocos/op")
+
+    return {
+        'metadata': {
+            'version': BENCHMARK_VERSION,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'min_time': min_time,
+            'repeats': repeats
+        },
+        'results': results
+    }
+
+
+def compare_with_baseline(current: Dict, baseline: Dict, time_threshold: float = 0.10,
+                          alloc_threshold: float = 0.5) -> List[Dict]:
+    """
+    Compara as medições com uma base salva
+
+    Args:
+        current: resultado de run_benchmarks
+        baseline: resultado salvo de uma execução anterior
+        time_threshold: aumento relativo de ns/op tolerado (0.10 = 10%)
+        alloc_threshold: aumento de blocos retidos por operação tolerado
+
+    Returns:
+        list: uma linha por medição presente nas duas execuções, com a razão
+              de tempo, a diferença de alocações e se houve regressão
+    """
+    base = {(r['algorithm'], r['operation'], r['capacity']): r for r in baseline['results']}
+
+    rows = []
+    for result in current['results']:
+        key = (result['algorithm'], result['operation'], result['capacity'])
+        if key not in base:
+            continue
+        reference = base[key]
+        ratio = result['ns_per_op'] / reference['ns_per_op']
+        alloc_diff = result['alloc_blocks_per_op'] - reference['alloc_blocks_per_op']
+        rows.append({
+            'algorithm': key[0],
+            'operation': key[1],
+            'capacity': key[2],
+            'base_ns_per_op': reference['ns_per_op'],
+            'ns_per_op': result['ns_per_op'],
+            'ratio': ratio,
+            'alloc_diff': alloc_diff,
+            'slower': ratio > 1 + time_threshold,
+            'more_allocations': alloc_diff > alloc_threshold
+        })
+    return rows
+
+
+def print_comparison(rows: List[Dict], time_threshold: float, alloc_threshold: float):
+    """Exibe a comparação com a base e destaca as regressões"""
+    print("\n" + "="*70)
+    print(f"COMPARAÇÃO COM A BASE (limites: +{time_threshold*100:.0f}% de tempo, "
+          f"+{alloc_threshold:.2f} blocos/op)")
+    print("="*70)
+    print(f"{'Algoritmo':<10} {'Operação':<9} {'Capacidade':>10} {'Base':>10} "
+          f"{'Atual':>10} {'Razão':>7} {'Δ blocos':>9}")
+    print("-"*70)
+    for row in rows:
+        status = "❌" if row['slower'] or row['more_allocations'] else "✅"
+        print(f"{row['algorithm']:<10} {row['operation']:<9} {row['capacity']:>10} "
+              f"{row['base_ns_per_op']:>8.1f}ns {row['ns_per_op']:>8.1f}ns "
+              f"{row['ratio']:>6.2f}x {row['alloc_diff']:>+9.2f} {status}")
+
+    regressions = [row for row in rows if row['slower'] or row['more_allocations']]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressões acima do limite")
+    else:
+        print(f"\n✅ Nenhuma regressão em {len(rows)} medições")
+
+
+def main() -> int:
+    """Interface de linha de comando; devolve 1 se houver regressão"""
+    parser = argparse.ArgumentParser(
+        description="Micro benchmarks de hit, miss e remoção dos algoritmos de cache")
+    parser.add_argument("--algoritmos", nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--operacoes", nargs='+', choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--capacidades", type=int, nargs='+', default=DEFAULT_CAPACITIES)
+    parser.add_argument("--tempo-minimo", type=float, default=0.1,
+                        help="duração mínima de cada medição, em segundos")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="grava as medições em JSON (ex.: a nova base)")
+    parser.add_argument("--base", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--limite", type=float, default=0.10,
+                        help="aumento de ns/op tolerado (padrão: 0.10 = 10%%)")
+    parser.add_argument("--limite-alocacoes", type=float, default=0.5,
+                        help="aumento de blocos retidos por operação tolerado")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("MICRO BENCHMARKS DOS CACHES")
+    print("="*70)
+    current = run_benchmarks(args.algoritmos, args.operacoes, args.capacidades,
+                             args.tempo_minimo, args.repeticoes)
+
+    if args.saida:
+        Path(args.saida).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"\n💾 Medições salvas em {args.saida}")
+
+    if args.base:
+        with open(args.base, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare_with_baseline(current, baseline, args.limite, args.limite_alocacoes)
+        print_comparison(rows, args.limite, args.limite_alocacoes)
+        if any(row['slower'] or row['more_allocations'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
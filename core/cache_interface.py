@@ -4,10 +4,15 @@ Define a estrutura que todos os algoritmos devem seguir
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Tuple, Optional, Dict
 import time
 
 
+# Quantos tempos de carregamento recentes cada cache guarda em load_times
+RECENT_LOAD_TIMES = 1000
+
+
 class CacheInterface(ABC):
     """
     Classe abstrata que define a interface para algoritmos de cache.
@@ -28,7 +33,17 @@ class CacheInterface(ABC):
         self.hits = 0        # Número de vezes que o texto estava no cache
         self.misses = 0      # Número de vezes que o texto NÃO estava no cache
         self.total_requests = 0
-        self.load_times = []  # Lista de tempos de carregamento
+        self.total_load_time = 0.0  # Soma dos tempos de carregamento
+        self.load_count = 0         # Quantos tempos foram somados
+        # Só os últimos tempos: a memória não cresce com o número de requisições
+        self.load_times = deque(maxlen=RECENT_LOAD_TIMES)
+        # False em caches internos (ex.: sombras do AdaptiveCache): o estado
+        # da política e os hits são atualizados, mas nenhum tempo é registrado
+        self.record_load_times = True
+        
+        # Função chamada com o número do texto sempre que a política remove
+        # um texto do cache (clear() não chama)
+        self.on_evict = None
     
     @abstractmethod
     def get(self, text_number: int, loader_function) -> Tuple[str, float, bool]:
@@ -59,6 +74,47 @@ class CacheInterface(ABC):
         """
         pass
     
+    def _record_load_time(self, load_time: float):
+        """Registra o tempo de um get() nas métricas"""
+        if not self.record_load_times:
+            return
+        self.total_load_time += load_time
+        self.load_count += 1
+        self.load_times.append(load_time)
+    
+    def _notify_evict(self, text_number: int):
+        """Avisa o on_evict (se houver) que um texto saiu do cache"""
+        if self.on_evict is not None:
+            self.on_evict(text_number)
+    
+    def prefetch(self, text_number: int, loader_function) -> bool:
+        """
+        Traz um texto para o cache antecipadamente, sem contar como requisição
+        
+        O texto passa pela política normal de admissão (e pode causar uma
+        remoção), mas hits, misses e tempos de carregamento não são alterados.
+        
+        Args:
+            text_number: número do texto a antecipar
+            loader_function: função para carregar do disco
+            
+        Returns:
+            bool: True se o texto foi carregado, False se já estava no cache
+        """
+        if self.is_in_cache(text_number):
+            return False
+        
+        hits, misses, total_requests = self.hits, self.misses, self.total_requests
+        total_load_time, load_count = self.total_load_time, self.load_count
+        
+        self.get(text_number, loader_function)
+        
+        self.hits, self.misses, self.total_requests = hits, misses, total_requests
+        if self.load_count > load_count:
+            self.load_times.pop()
+        self.total_load_time, self.load_count = total_load_time, load_count
+        return True
+    
     def is_full(self) -> bool:
         """Verifica se o cache está cheio"""
         return len(self.cache) >= self.capacity
@@ -71,12 +127,33 @@ class CacheInterface(ABC):
         """Retorna o número de itens atualmente no cache"""
         return len(self.cache)
     
+    def keys(self) -> list:
+        """Retorna os números dos textos que estão no cache"""
+        return list(self.cache)
+    
+    def peek(self, text_number: int):
+        """
+        Retorna o conteúdo guardado de um texto sem contar como acesso
+        (None se o texto não estiver no cache)
+        """
+        return self.cache.get(text_number)
+    
+    def _replace_content(self, text_number: int, content):
+        """
+        Troca o conteúdo guardado de um texto que já está no cache,
+        sem alterar o estado da política (ordem, frequência, etc.)
+        """
+        if text_number in self.cache:
+            self.cache[text_number] = content
+    
     def clear(self):
         """Limpa o cache e reseta as métricas"""
         self.cache.clear()
         self.hits = 0
         self.misses = 0
         self.total_requests = 0
+        self.total_load_time = 0.0
+        self.load_count = 0
         self.load_times.clear()
     
     def get_metrics(self) -> Dict:
@@ -88,7 +165,7 @@ class CacheInterface(ABC):
         """
         hit_rate = (self.hits / self.total_requests * 100) if self.total_requests > 0 else 0
         miss_rate = (self.misses / self.total_requests * 100) if self.total_requests > 0 else 0
-        avg_load_time = sum(self.load_times) / len(self.load_times) if self.load_times else 0
+        avg_load_time = self.total_load_time / self.load_count if self.load_count else 0
         
         return {
             'algorithm': self.__class__.__name__,
@@ -100,7 +177,7 @@ class CacheInterface(ABC):
             'hit_rate': hit_rate,
             'miss_rate': miss_rate,
             'avg_load_time': avg_load_time,
-            'total_load_time': sum(self.load_times)
+            'total_load_time': self.total_load_time
         }
     
     def print_metrics(self):
@@ -151,7 +228,7 @@ class BaseCache(CacheInterface):
             self.hits += 1
             content = self.cache[text_number]
             load_time = time.time() - start_time
-            self.load_times.append(load_time)
+            self._record_load_time(load_time)
             return content, load_time, True
         
         # Não está no cache (MISS) - precisa carregar do disco
@@ -161,6 +238,7 @@ class BaseCache(CacheInterface):
         if self.is_full():
             removed = self._evict()
             del self.cache[removed]
+            self._notify_evict(removed)
         
         # Carrega do disco
         content, disk_load_time = loader_function(text_number)
@@ -169,7 +247,7 @@ class BaseCache(CacheInterface):
         self.cache[text_number] = content
         
         total_time = time.time() - start_time
-        self.load_times.append(total_time)
+        self._record_load_time(total_time)
         
         return content, total_time, False
     
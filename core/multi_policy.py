@@ -0,0 +1,135 @@
+"""
+Avaliação de várias políticas de cache sobre o mesmo fluxo de requisições
+As políticas guardam só metadados; o conteúdo fica no SharedContentStore
+"""
+
+from typing import Dict, List, Tuple
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.shared_store import SharedContentStore
+
+
+class MultiPolicyCache:
+    """
+    Executa várias políticas lado a lado com um único armazenamento de conteúdo
+
+    Cada política recebe todas as requisições e decide hits e remoções
+    normalmente, mas guarda apenas o tamanho de cada texto. O conteúdo vem
+    do SharedContentStore, então uma requisição lê o texto do disco no
+    máximo uma vez, qualquer que seja o número de políticas, e cada texto
+    fica uma única vez na memória. Só a primeira política que erra paga a
+    leitura do disco; as demais recebem o texto do armazenamento.
+
+    Exemplo:
+        multi = MultiPolicyCache([FIFOCache(10), LRUCache(10)], loader.load_text)
+        content, results = multi.get(5)
+        results['LRUCache']  # (cache_hit, tempo, lido_do_disco)
+    """
+
+    def __init__(self, policies: List, loader_function):
+        """
+        Args:
+            policies: instâncias dos algoritmos de cache (vazias)
+            loader_function: função que carrega um texto do disco -> (conteúdo, tempo)
+        """
+        self.policies = policies
+        self.store = SharedContentStore(loader_function)
+        self.total_requests = 0
+
+        # Se o último acquire leu o texto do disco (e não do armazenamento)
+        self._read_from_disk = False
+
+        for policy in policies:
+            policy.on_evict = self.store.release
+
+    def _acquire_metadata(self, text_number: int) -> Tuple[int, float]:
+        """Loader passado às políticas: adquire o texto e devolve só o tamanho"""
+        content, load_time, self._read_from_disk = self.store.acquire(text_number)
+        return len(content), load_time
+
+    def get(self, text_number: int) -> Tuple[str, Dict[str, Tuple[bool, float, bool]]]:
+        """
+        Processa uma requisição em todas as políticas
+
+        Args:
+            text_number: número do texto desejado
+
+        Returns:
+            tuple: (conteúdo, {nome da política: (cache_hit, tempo, lido_do_disco)});
+                   lido_do_disco só é True para o miss que fez a leitura, os
+                   outros misses receberam o texto do armazenamento compartilhado
+        """
+        self.total_requests += 1
+        results = {}
+
+        for policy in self.policies:
+            self._read_from_disk = False
+            size, load_time, was_hit = policy.get(text_number, self._acquire_metadata)
+            results[policy.__class__.__name__] = (was_hit, load_time, self._read_from_disk)
+
+        if text_number in self.store:
+            content = self.store.content(text_number)
+        else:
+            # Nenhuma política admitiu o texto: lê sem guardar
+            content, load_time, was_read = self.store.acquire(text_number)
+            self.store.release(text_number)
+
+        return content, results
+
+    def clear(self):
+        """Limpa todas as políticas e o armazenamento"""
+        for policy in self.policies:
+            policy.clear()
+        self.store.clear()
+        self.total_requests = 0
+
+    def get_metrics(self) -> Dict:
+        """
+        Retorna as métricas de cada política e do armazenamento compartilhado
+
+        Returns:
+            dict: {'policies': {nome: métricas}, 'store': métricas do armazenamento}
+        """
+        return {
+            'total_requests': self.total_requests,
+            'policies': {policy.__class__.__name__: policy.get_metrics()
+                         for policy in self.policies},
+            'store': self.store.get_metrics()
+        }
+
+
+# Teste do avaliador de múltiplas políticas
+if __name__ == "__main__":
+    import numpy as np
+    from algorithms.fifo_cache import FIFOCache
+    from algorithms.lru_cache import LRUCache
+    from algorithms.lfu_cache import LFUCache
+    from algorithms.arc_cache import ARCCache
+
+    print("="*70)
+    print("TESTE DO AVALIADOR DE MÚLTIPLAS POLÍTICAS")
+    print("="*70)
+
+    def mock_loader(text_number):
+        return f"Conteúdo do texto {text_number} " * 100, 0.0
+
+    multi = MultiPolicyCache([FIFOCache(10), LRUCache(10), LFUCache(10), ARCCache(10)],
+                             mock_loader)
+
+    requests = np.random.default_rng(0).zipf(1.3, size=5000) % 100 + 1
+    for text_number in requests.tolist():
+        multi.get(text_number)
+
+    metrics = multi.get_metrics()
+    for name, policy_metrics in metrics['policies'].items():
+        print(f"{name:<12} hit rate: {policy_metrics['hit_rate']:.2f}% "
+              f"({policy_metrics['misses']} misses)")
+
+    store = metrics['store']
+    print(f"\nLeituras do disco: {store['disk_reads']} "
+          f"(soma dos misses: {sum(m['misses'] for m in metrics['policies'].values())})")
+    print(f"Textos residentes: {store['resident_texts']} "
+          f"(no máximo {sum(p.capacity for p in multi.policies)} com cópias por política)")
@@ -0,0 +1,98 @@
+"""
+Armazenamento de conteúdo compartilhado com contagem de referências
+Permite que várias políticas de cache guardem só metadados enquanto cada
+texto fica uma única vez na memória
+"""
+
+from typing import Dict, Tuple
+import time
+
+
+class SharedContentStore:
+    """
+    Guarda o conteúdo dos textos uma única vez para vários caches
+
+    Cada cache que admite um texto chama acquire() e, ao removê-lo,
+    release(). O texto é lido do disco só quando nenhum cache o possui e
+    sai da memória quando o último cache o libera.
+    """
+
+    def __init__(self, loader_function):
+        """
+        Args:
+            loader_function: função que carrega um texto do disco -> (conteúdo, tempo)
+        """
+        self.loader_function = loader_function
+        self.contents = {}     # {text_number: conteúdo}
+        self.refcounts = {}    # {text_number: número de caches que possuem o texto}
+
+        # Métricas
+        self.disk_reads = 0
+        self.bytes_read = 0
+
+    def acquire(self, text_number: int) -> Tuple[str, float, bool]:
+        """
+        Registra mais um cache que possui o texto, lendo-o do disco se preciso
+
+        Args:
+            text_number: número do texto
+
+        Returns:
+            tuple: (conteúdo, tempo de leitura, True se foi lido do disco agora)
+        """
+        if text_number in self.contents:
+            self.refcounts[text_number] += 1
+            return self.contents[text_number], 0.0, False
+
+        start_time = time.time()
+        content, disk_load_time = self.loader_function(text_number)
+        load_time = time.time() - start_time
+
+        self.contents[text_number] = content
+        self.refcounts[text_number] = 1
+        self.disk_reads += 1
+        self.bytes_read += len(content)
+        return content, load_time, True
+
+    def release(self, text_number: int):
+        """
+        Libera a referência de um cache; o texto sai da memória na última
+
+        Args:
+            text_number: número do texto
+        """
+        if text_number not in self.refcounts:
+            return
+
+        self.refcounts[text_number] -= 1
+        if self.refcounts[text_number] == 0:
+            del self.refcounts[text_number]
+            del self.contents[text_number]
+
+    def content(self, text_number: int) -> str:
+        """Retorna o conteúdo de um texto que está no armazenamento"""
+        return self.contents[text_number]
+
+    def __contains__(self, text_number: int) -> bool:
+        return text_number in self.contents
+
+    def clear(self):
+        """Esvazia o armazenamento e reseta as métricas"""
+        self.contents.clear()
+        self.refcounts.clear()
+        self.disk_reads = 0
+        self.bytes_read = 0
+
+    def get_metrics(self) -> Dict:
+        """
+        Retorna as métricas do armazenamento
+
+        Returns:
+            dict: leituras do disco, bytes lidos, textos e caracteres residentes
+        """
+        return {
+            'disk_reads': self.disk_reads,
+            'bytes_read': self.bytes_read,
+            'resident_texts': len(self.contents),
+            'resident_chars': sum(len(content) for content in self.contents.values())
+        }
@@ -1,28 +1,111 @@
 """
 Módulo de leitura de textos do disco
-Responsável por carregar os arquivos de texto numerados de 1 a 100
+Responsável por carregar os arquivos de texto numerados de 1 a N
+
+Formatos suportados:
+- txt: um arquivo texto_N.txt por texto (TextLoader)
+- packed: todos os textos concatenados em textos.dat, com os offsets
+  de cada texto em textos.idx (PackedTextLoader / PackedTextWriter)
 """
 
 import os
+import sys
+import threading
 import time
+from array import array
 from pathlib import Path
 
+import numpy as np
+
+# Arquivos do formato empacotado
+PACKED_DATA_FILE = "textos.dat"
+PACKED_INDEX_FILE = "textos.idx"
+
+# Perfis de disco lento: latência por leitura (s) e taxa de transferência (bytes/s)
+DISK_PROFILES = {
+    'ssd': {'latency': 0.0001, 'bandwidth': 500e6},
+    'lento': {'latency': 0.001, 'bandwidth': 50e6},
+    'hdd': {'latency': 0.008, 'bandwidth': 120e6},
+}
+
+
+def resolve_disk_profile(disk_profile):
+    """
+    Converte um perfil de disco (nome ou dicionário) no dicionário de parâmetros
+
+    Args:
+        disk_profile: None (sem atraso), nome em DISK_PROFILES ou dicionário
+                      com 'latency' (s) e 'bandwidth' (bytes/s, opcional)
+
+    Returns:
+        dict: parâmetros do perfil, ou None
+
+    Raises:
+        ValueError: se o nome do perfil for desconhecido
+    """
+    if disk_profile is None or isinstance(disk_profile, dict):
+        return disk_profile
+    if disk_profile not in DISK_PROFILES:
+        raise ValueError(f"Perfil de disco inválido: {disk_profile}. "
+                         f"Use {', '.join(DISK_PROFILES)}")
+    return DISK_PROFILES[disk_profile]
+
+
+def disk_read_time(disk_profile, num_bytes):
+    """
+    Tempo (s) que o disco do perfil leva para ler num_bytes, sem esperar
+
+    Aceita um número ou um array NumPy de tamanhos; sem perfil, o tempo é zero.
+    """
+    if not disk_profile:
+        return num_bytes * 0.0
+    bandwidth = disk_profile.get('bandwidth')
+    return disk_profile['latency'] + (num_bytes / bandwidth if bandwidth else num_bytes * 0.0)
+
+
+def simulate_disk_read(disk_profile, num_bytes: int):
+    """Espera o tempo que o disco do perfil levaria para ler num_bytes"""
+    if disk_profile:
+        time.sleep(disk_read_time(disk_profile, num_bytes))
+
+
 class TextLoader:
     """Classe responsável por gerenciar o carregamento de textos do disco"""
     
-    def __init__(self, texts_directory="texts"):
+    def __init__(self, texts_directory="texts", total_texts=None, disk_profile=None):
         """
         Inicializa o carregador de textos
         
         Args:
             texts_directory: caminho para o diretório contendo os textos
+            total_texts: número de textos (None = conta os arquivos texto_N.txt)
+            disk_profile: perfil de disco lento aplicado a cada leitura (nome
+                          em DISK_PROFILES ou dicionário); None lê sem atraso
         """
         self.texts_dir = Path(texts_directory)
-        self.total_texts = 100
+        self.disk_profile = resolve_disk_profile(disk_profile)
         
         # Verifica se o diretório existe
         if not self.texts_dir.exists():
             raise FileNotFoundError(f"Diretório '{texts_directory}' não encontrado")
+        
+        if total_texts is None:
+            total_texts = sum(1 for _ in self.texts_dir.glob("texto_*.txt"))
+        self.total_texts = total_texts
+        self._sizes = None
+    
+    def _validate_number(self, text_number):
+        """
+        Valida o número do texto
+        
+        Raises:
+            ValueError: se o número do texto for inválido
+        """
+        if not isinstance(text_number, (int, np.integer)):
+            raise ValueError("O número do texto deve ser um inteiro")
+        
+        if text_number < 1 or text_number > self.total_texts:
+            raise ValueError(f"Número do texto deve estar entre 1 e {self.total_texts}")
     
     def load_text(self, text_number):
         """
@@ -39,11 +122,7 @@ class TextLoader:
             FileNotFoundError: se o arquivo não existir
         """
         # Validação do número
-        if not isinstance(text_number, int):
-            raise ValueError("O número do texto deve ser um inteiro")
-        
-        if text_number < 1 or text_number > self.total_texts:
-            raise ValueError(f"Número do texto deve estar entre 1 e {self.total_texts}")
+        self._validate_number(text_number)
         
         # Construção do caminho do arquivo
         filename = f"texto_{text_number}.txt"
@@ -60,6 +139,7 @@ class TextLoader:
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 content = file.read()
+            simulate_disk_read(self.disk_profile, len(content))
             
             load_time = time.time() - start_time
             
@@ -67,6 +147,218 @@ class TextLoader:
             
         except Exception as e:
             raise IOError(f"Erro ao ler o arquivo {file_path}: {str(e)}")
+    
+    def text_sizes(self):
+        """
+        Tamanho em bytes de cada texto, lido uma única vez
+        
+        Returns:
+            np.ndarray: array int64 indexado pelo número do texto (posição 0 sem uso)
+        """
+        if self._sizes is None:
+            sizes = np.zeros(self.total_texts + 1, dtype=np.int64)
+            for text_number in range(1, self.total_texts + 1):
+                sizes[text_number] = (self.texts_dir / f"texto_{text_number}.txt").stat().st_size
+            self._sizes = sizes
+        return self._sizes
+    
+    def load_size(self, text_number):
+        """
+        Substituto de load_text para simulações só de chaves
+        
+        Não lê o arquivo nem cria strings: devolve o tamanho do texto no
+        lugar do conteúdo, então os caches guardam apenas chave e tamanho.
+        
+        Args:
+            text_number: número do texto
+            
+        Returns:
+            tuple: (tamanho do texto em bytes, 0.0)
+            
+        Raises:
+            ValueError: se o número do texto for inválido
+        """
+        self._validate_number(text_number)
+        
+        return int(self.text_sizes()[text_number]), 0.0
+
+class PackedTextWriter:
+    """
+    Grava textos no formato empacotado (textos.dat + textos.idx)
+
+    O índice guarda N+1 offsets uint64 (little-endian): o texto k ocupa os
+    bytes [offsets[k-1], offsets[k]) de textos.dat. A reserva de espaço é
+    sequencial, mas a gravação em si pode ser feita por várias threads.
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory: diretório onde os arquivos serão criados
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._data = open(self.directory / PACKED_DATA_FILE, "wb")
+        self._offsets = array("Q", [0])
+        self._lock = threading.Lock()
+
+    def reserve(self, num_bytes: int) -> int:
+        """
+        Reserva espaço para o próximo texto
+
+        Returns:
+            int: offset onde o texto deve ser gravado
+        """
+        offset = self._offsets[-1]
+        self._offsets.append(offset + num_bytes)
+        return offset
+
+    def write_at(self, offset: int, data: bytes):
+        """Grava os bytes de um texto no offset reservado (thread-safe)"""
+        if hasattr(os, "pwrite"):
+            os.pwrite(self._data.fileno(), data, offset)
+        else:
+            with self._lock:
+                self._data.seek(offset)
+                self._data.write(data)
+
+    def append(self, content: str) -> int:
+        """
+        Grava o próximo texto
+
+        Returns:
+            int: número do texto gravado (1-N)
+        """
+        data = content.encode("utf-8")
+        self.write_at(self.reserve(len(data)), data)
+        return len(self._offsets) - 1
+
+    def close(self):
+        """
+        Fecha o arquivo de dados e grava o índice
+
+        O índice é gravado em um arquivo temporário e renomeado no fim, então
+        textos.idx só existe quando descreve dados completamente gravados.
+        """
+        if self._data.closed:
+            return
+        self._data.close()
+        index_path = self.directory / PACKED_INDEX_FILE
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        with open(temp_path, "wb") as index_file:
+            if sys.byteorder == "big":
+                self._offsets.byteswap()
+            self._offsets.tofile(index_file)
+        os.replace(temp_path, index_path)
+
+    def abort(self):
+        """
+        Fecha o arquivo de dados sem gravar o índice
+
+        Usado quando alguma gravação falhou: um índice antigo também é
+        removido, para que o PackedTextLoader não sirva regiões não gravadas.
+        """
+        if self._data.closed:
+            return
+        self._data.close()
+        (self.directory / PACKED_INDEX_FILE).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class PackedTextLoader(TextLoader):
+    """
+    Carrega textos do formato empacotado (textos.dat + textos.idx)
+
+    Mantém a mesma interface do TextLoader: load_text(n) -> (conteúdo, tempo).
+    O índice é mapeado em memória, então abrir um corpus com milhões de
+    textos não exige lê-lo inteiro.
+    """
+
+    def __init__(self, texts_directory="texts", disk_profile=None):
+        """
+        Args:
+            texts_directory: diretório contendo textos.dat e textos.idx
+            disk_profile: perfil de disco lento (veja TextLoader)
+        """
+        self.texts_dir = Path(texts_directory)
+        self.disk_profile = resolve_disk_profile(disk_profile)
+        self.data_path = self.texts_dir / PACKED_DATA_FILE
+        index_path = self.texts_dir / PACKED_INDEX_FILE
+
+        if not index_path.exists() or not self.data_path.exists():
+            raise FileNotFoundError(
+                f"Corpus empacotado não encontrado em '{texts_directory}'")
+
+        self.offsets = np.memmap(index_path, dtype="<u8", mode="r")
+        self.total_texts = len(self.offsets) - 1
+        self._sizes = None
+
+    def load_text(self, text_number):
+        """
+        Carrega um texto específico do arquivo empacotado
+
+        Args:
+            text_number: número do texto (1-N)
+
+        Returns:
+            tuple: (conteúdo do texto, tempo de carregamento em segundos)
+        """
+        self._validate_number(text_number)
+
+        start = int(self.offsets[text_number - 1])
+        end = int(self.offsets[text_number])
+
+        start_time = time.time()
+
+        try:
+            with open(self.data_path, "rb") as file:
+                file.seek(start)
+                content = file.read(end - start).decode("utf-8")
+            simulate_disk_read(self.disk_profile, end - start)
+
+            load_time = time.time() - start_time
+
+            return content, load_time
+
+        except Exception as e:
+            raise IOError(f"Erro ao ler o texto {text_number} de {self.data_path}: {str(e)}")
+
+    def text_sizes(self):
+        """
+        Tamanho em bytes de cada texto, calculado a partir do índice
+
+        Returns:
+            np.ndarray: array int64 indexado pelo número do texto (posição 0 sem uso)
+        """
+        if self._sizes is None:
+            self._sizes = np.diff(self.offsets, prepend=0).astype(np.int64)
+        return self._sizes
+
+
+def open_loader(texts_directory="texts", disk_profile=None):
+    """
+    Abre o loader adequado ao formato encontrado no diretório
+
+    Args:
+        texts_directory: diretório do corpus
+        disk_profile: perfil de disco lento (veja TextLoader)
+
+    Returns:
+        TextLoader ou PackedTextLoader
+    """
+    if (Path(texts_directory) / PACKED_INDEX_FILE).exists():
+        return PackedTextLoader(texts_directory, disk_profile)
+    return TextLoader(texts_directory, disk_profile=disk_profile)
+
 
 # Exemplo de uso
 if __name__ == "__main__":
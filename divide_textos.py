@@ -1,31 +1,202 @@
 # divide_textos.py
+import argparse
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.text_loader import PackedTextWriter
+
+# Tamanho padrão de cada bloco lido do arquivo de entrada (1 MiB de caracteres)
+TAMANHO_BLOCO_PADRAO = 1 << 20
+
+
+def iterar_palavras(arquivo_entrada, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Lê o arquivo de entrada em blocos e produz as palavras de cada bloco
+
+    Uma palavra que fica cortada no fim de um bloco é guardada e
+    completada com o início do bloco seguinte, de modo que a memória usada
+    é limitada pelo tamanho do bloco e não pelo tamanho do arquivo.
+
+    Args:
+        arquivo_entrada: caminho do texto original
+        tamanho_bloco: número de caracteres lidos por vez
+
+    Yields:
+        list: palavras completas de cada bloco
+    """
+    resto = ""
+    with open(arquivo_entrada, "r", encoding="utf-8") as f:
+        while True:
+            bloco = f.read(tamanho_bloco)
+            if not bloco:
+                break
+
+            bloco = resto + bloco
+            palavras = bloco.split()
+
+            # Se o bloco não termina em espaço, a última palavra pode estar incompleta
+            if palavras and not bloco[-1].isspace():
+                resto = palavras.pop()
+            else:
+                resto = ""
+
+            if palavras:
+                yield palavras
+
+    if resto:
+        yield [resto]
+
+
+def iterar_trechos(arquivo_entrada, palavras_por_texto=1000,
+                   tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Agrupa as palavras do arquivo em trechos de tamanho fixo
+
+    Args:
+        arquivo_entrada: caminho do texto original
+        palavras_por_texto: número de palavras de cada trecho
+        tamanho_bloco: número de caracteres lidos por vez
+
+    Yields:
+        str: trechos com palavras_por_texto palavras (o último pode ser menor)
+    """
+    pendentes = []
+    for palavras in iterar_palavras(arquivo_entrada, tamanho_bloco):
+        pendentes.extend(palavras)
+
+        inicio = 0
+        while len(pendentes) - inicio >= palavras_por_texto:
+            fim = inicio + palavras_por_texto
+            yield " ".join(pendentes[inicio:fim])
+            inicio = fim
+
+        # Descarta de uma só vez as palavras já usadas
+        del pendentes[:inicio]
+
+    if pendentes:
+        yield " ".join(pendentes)
+
+
+def _escrever_txt(caminho, trecho):
+    """Escreve um trecho em um arquivo .txt individual"""
+    with open(caminho, "w", encoding="utf-8") as out:
+        out.write(trecho)
+
+
+def dividir_texto(arquivo_entrada, pasta_saida, palavras_por_texto=1000,
+                  num_textos=None, formato="txt", num_workers=4,
+                  tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Divide o texto de entrada em partes numeradas, em fluxo contínuo
+
+    O arquivo é lido bloco a bloco e cada parte é entregue a um pool de
+    escritores em paralelo. O número de escritas pendentes é limitado, então
+    a memória não cresce com o tamanho da entrada.
+
+    Args:
+        arquivo_entrada: caminho do texto original
+        pasta_saida: diretório onde as partes serão gravadas
+        palavras_por_texto: número de palavras por parte
+        num_textos: número máximo de partes (None = até o fim da entrada)
+        formato: 'txt' (um arquivo por parte) ou 'packed' (dados + índice)
+        num_workers: número de escritores em paralelo
+        tamanho_bloco: número de caracteres lidos por vez
+
+    Returns:
+        int: número de partes geradas
+
+    Raises:
+        ValueError: se o formato for inválido
+    """
+    if formato not in ("txt", "packed"):
+        raise ValueError(f"Formato inválido: {formato}. Use 'txt' ou 'packed'")
 
-def dividir_texto(arquivo_entrada, pasta_saida, palavras_por_texto=1000):
     # Cria a pasta de saída, se não existir
     os.makedirs(pasta_saida, exist_ok=True)
 
-    # Lê todo o texto de entrada
-    with open(arquivo_entrada, "r", encoding="utf-8") as f:
-        texto = f.read()
+    # Limita as escritas em andamento para manter a memória controlada
+    vagas = threading.BoundedSemaphore(num_workers * 2)
+    writer = PackedTextWriter(pasta_saida) if formato == "packed" else None
 
-    # Divide o texto em palavras
-    palavras = texto.split()
+    def liberar_vaga(futuro):
+        vagas.release()
 
-    # Cria os arquivos de saída
-    for i in range (100):
-        inicio = i * palavras_por_texto
-        fim = inicio + palavras_por_texto
-        trecho = " ".join(palavras[inicio:fim])
-        
-        with open(f"{pasta_saida}/texto_{i+1}.txt", "w", encoding="utf-8") as out:
-            out.write(trecho)
+    gerados = 0
+    futuros = []
+    start_time = time.time()
 
-    print(f"✅ Gerados 100 arquivos na pasta '{pasta_saida}'")
+    try:
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            for trecho in iterar_trechos(arquivo_entrada, palavras_por_texto, tamanho_bloco):
+                if num_textos is not None and gerados >= num_textos:
+                    break
+
+                gerados += 1
+                vagas.acquire()
+
+                if writer is not None:
+                    # A reserva é sequencial; a gravação no offset é paralela
+                    dados = trecho.encode("utf-8")
+                    offset = writer.reserve(len(dados))
+                    futuro = pool.submit(writer.write_at, offset, dados)
+                else:
+                    caminho = os.path.join(pasta_saida, f"texto_{gerados}.txt")
+                    futuro = pool.submit(_escrever_txt, caminho, trecho)
+
+                futuro.add_done_callback(liberar_vaga)
+                futuros.append(futuro)
+
+                # Propaga erros de escrita assim que aparecem
+                if len(futuros) >= num_workers * 4:
+                    for f in futuros:
+                        f.result()
+                    futuros.clear()
+
+            for f in futuros:
+                f.result()
+    except BaseException:
+        # Com alguma escrita incompleta, o índice apontaria para regiões vazias
+        if writer is not None:
+            writer.abort()
+        raise
+
+    if writer is not None:
+        writer.close()
+
+    total_time = time.time() - start_time
+    print(f"✅ Gerados {gerados} textos ({formato}) na pasta '{pasta_saida}' "
+          f"em {total_time:.2f}s")
+
+    return gerados
 
 
 def main():
-    dividir_texto("OsFilhosdoPadre.txt", "texts")
+    parser = argparse.ArgumentParser(
+        description="Divide um texto grande em partes numeradas para a simulação")
+    parser.add_argument("entrada", nargs="?", default="OsFilhosdoPadre.txt",
+                        help="arquivo de texto original")
+    parser.add_argument("saida", nargs="?", default="texts",
+                        help="diretório de saída")
+    parser.add_argument("--palavras", type=int, default=1000,
+                        help="palavras por parte (padrão: 1000)")
+    parser.add_argument("--num-textos", type=int, default=100,
+                        help="número máximo de partes, 0 = todas (padrão: 100)")
+    parser.add_argument("--formato", choices=["txt", "packed"], default="txt",
+                        help="formato de saída (padrão: txt)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="escritores em paralelo (padrão: 4)")
+    args = parser.parse_args()
+
+    dividir_texto(
+        args.entrada,
+        args.saida,
+        palavras_por_texto=args.palavras,
+        num_textos=args.num_textos or None,
+        formato=args.formato,
+        num_workers=args.workers
+    )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,25 +1,26 @@
 from core.text_loader import TextLoader
+from core.multi_policy import MultiPolicyCache
 from algorithms.fifo_cache import FIFOCache
 from algorithms.lru_cache import LRUCache
 from algorithms.lfu_cache import LFUCache
 from algorithms.arc_cache import ARCCache
-from simulation.simulation_mode import run_simulation_mode
+from simulation.simulation_mode import run_simulation_mode, run_capacity_sweep_mode
 
 def menu():
     # Instancia o loader
     loader = TextLoader("texts")
     
-    # Inicializa o cache FIFO
-    FIFOcache = FIFOCache(capacity=10)
-    # Inicializa o cache LRU
-    LRUcache = LRUCache(capacity=10)
-    # Inicializa o cache LFU
-    LFUcache = LFUCache(capacity=10)
-    # Inicializa o cache ARC
-    ARCcache = ARCCache(capacity=10)
+    # Inicializa as quatro políticas sobre um único armazenamento de conteúdo:
+    # cada texto é lido do disco no máximo uma vez por requisição e fica uma
+    # única vez na memória, as políticas guardam só metadados
+    caches = MultiPolicyCache(
+        [FIFOCache(capacity=10), LRUCache(capacity=10),
+         LFUCache(capacity=10), ARCCache(capacity=10)],
+        loader.load_text
+    )
     
     while True:
-        entrada = input("\nDigite o número do texto desejado (1-100), 0 para sair, ou -1 para simulação: ")
+        entrada = input("\nDigite o número do texto desejado (1-100), 0 para sair, -1 para simulação ou -2 para dimensionar o cache: ")
         
         # Sair
         if entrada == "0":
@@ -28,13 +29,38 @@ def menu():
         
         # Modo simulação
         elif entrada == "-1":
+            # Por padrão, 3 usuários fixos por padrão e nada gravado além dos
+            # gráficos; a repetição adaptativa (até 30 usuários, com checkpoint
+            # e banco de resultados) é opcional. Os tempos vêm do relógio
+            # virtual, então a simulação não espera pelo disco
+            adaptativa = input("Repetir usuários até o IC95% dos líderes ficar abaixo de 2 pp "
+                               "(até 30 por padrão; grava checkpoints/ e results/)? (s/n): "
+                               ).strip().lower() == 's'
+            
             print("Iniciando modo simulação...")
-            run_simulation_mode(
-                loader,
-                cache_capacity=10,
-                num_users=3,
-                requests_per_user=200
-            )
+            if adaptativa:
+                run_simulation_mode(
+                    loader,
+                    cache_capacity=10,
+                    num_users=3,
+                    requests_per_user=200,
+                    warmup='fill',
+                    target_ci_width=2.0,
+                    checkpoint_path="checkpoints/simulacao.ckpt",
+                    store_path="results/resultados.db",
+                    keep_access_log=False,
+                    virtual_clock=True
+                )
+            else:
+                run_simulation_mode(
+                    loader,
+                    cache_capacity=10,
+                    num_users=3,
+                    requests_per_user=200,
+                    warmup='fill',
+                    keep_access_log=False,
+                    virtual_clock=True
+                )
             
             # Pergunta se quer continuar ou sair
             continuar = input("\nDeseja continuar usando o sistema? (s/n): ").strip().lower()
@@ -42,81 +68,61 @@ def menu():
                 print("Encerrando...")
                 break
         
+        # Varredura de capacidade
+        elif entrada == "-2":
+            orcamentos = input("Orçamentos de memória em MB separados por vírgula "
+                               "(ENTER para varrer de 1 a 100 textos): ").strip()
+            try:
+                byte_budgets = ([float(mb) * 1024 * 1024 for mb in orcamentos.split(",")]
+                                if orcamentos else None)
+            except ValueError:
+                print("❌ Erro: Digite apenas números separados por vírgula!")
+                continue
+            
+            try:
+                run_capacity_sweep_mode(loader, byte_budgets=byte_budgets,
+                                        checkpoint_path="checkpoints/varredura.ckpt")
+            except ValueError as e:
+                print(f"❌ Erro: {e}")
+        
         # Carregar texto
         else:
             try:
                 # Converte para inteiro
                 text_num = int(entrada)
 
-                # Função wrapper para o loader
-                def load_from_disk(num):
-                    return loader.load_text(num)
-                
-                # Obtém o texto através do cache FIFO
-                FIFOcontent, FIFOload_time, FIFOwas_hit = FIFOcache.get(text_num, load_from_disk)
-
-                # Obtém o texto através do cache LRU
-                LRUcontent, LRUload_time, LRUwas_hit = LRUcache.get(text_num, load_from_disk)
-
-                # Obtém o texto através do cache LFU
-                LFUcontent, LFUload_time, LFUwas_hit = LFUcache.get(text_num, load_from_disk)
-
-                # Obtém o texto através do cache ARC
-                ARCcontent, ARCload_time, ARCwas_hit = ARCcache.get(text_num, load_from_disk)
-                
-                # Exibe informações FIFO
-                FIFOstatus = "CACHE HIT ✓" if FIFOwas_hit else "CACHE MISS ✗ (carregado do disco)"
-
-                # Exibe informações LRU
-                LRUstatus = "CACHE HIT ✓" if LRUwas_hit else "CACHE MISS ✗ (carregado do disco)"
-
-                # Exibe informações LFU
-                LFUstatus = "CACHE HIT ✓" if LFUwas_hit else "CACHE MISS ✗ (carregado do disco)"
-
-                # Exibe informações ARC
-                ARCstatus = "CACHE HIT ✓" if ARCwas_hit else "CACHE MISS ✗ (carregado do disco)"
+                # Obtém o texto através das quatro políticas
+                content, results = caches.get(text_num)
                 
                 # Exibição
                 print(f"\n{'='*60}")
 
-                # Exibe informações FIFO
-                print(f"{'='*20}FIFO{'='*20}")
-                print(f"✓ Texto {text_num} carregado com sucesso - {FIFOstatus}!")
-                print(f"  Tempo de carregamento: {FIFOload_time:.6f}s")
-                print(f"  Tamanho: {len(FIFOcontent)} caracteres")
-                print(f"  Palavras: {len(FIFOcontent.split())}")
-                print(f"Itens no cache: {FIFOcache.size()}/{FIFOcache.capacity}")
-                print(f"{'='*60}\n")
-
-                # Exibe informações LRU
-                print(f"{'='*20}LRU{'='*20}")
-                print(f"✓ Texto {text_num} carregado com sucesso - {LRUstatus}!")
-                print(f"  Tempo de carregamento: {LRUload_time:.6f}s")
-                print(f"  Tamanho: {len(LRUcontent)} caracteres")
-                print(f"  Palavras: {len(LRUcontent.split())}")
-                print(f"Itens no cache: {LRUcache.size()}/{LRUcache.capacity}")
-                print(f"{'='*60}\n")
-
-                # Exibe informações LFU
-                print(f"{'='*20}LFU{'='*20}")
-                print(f"✓ Texto {text_num} carregado com sucesso - {LFUstatus}!")
-                print(f"  Tempo de carregamento: {LFUload_time:.6f}s")
-                print(f"  Tamanho: {len(LFUcontent)} caracteres")
-                print(f"  Palavras: {len(LFUcontent.split())}")
-                print(f"Itens no cache: {LFUcache.size()}/{LFUcache.capacity}")
-                print(f"{'='*60}\n")
-
-                # Exibe informações ARC
-                print(f"{'='*20}ARC{'='*20}")
-                print(f"✓ Texto {text_num} carregado com sucesso - {ARCstatus}!")
-                print(f"  Tempo de carregamento: {ARCload_time:.6f}s")
-                print(f"  Tamanho: {len(ARCcontent)} caracteres")
-                print(f"  Palavras: {len(ARCcontent.split())}")
-                print(f"Itens no cache: {ARCcache.size()}/{ARCcache.capacity}")
-                print(f"{'='*60}\n")
+                # O texto é lido do disco no máximo uma vez, pelo primeiro miss
+                for policy_name, (was_hit, load_time, from_disk) in results.items():
+                    if from_disk:
+                        print(f"Leitura do disco: {load_time:.6f}s "
+                              f"(miss do {policy_name.replace('Cache', '')})")
+
+                for cache in caches.policies:
+                    was_hit, load_time, from_disk = results[cache.__class__.__name__]
+                    if was_hit:
+                        status = "CACHE HIT ✓"
+                    elif from_disk:
+                        status = "CACHE MISS ✗ (carregado do disco)"
+                    else:
+                        status = "CACHE MISS ✗ (do armazenamento compartilhado)"
+                    name = cache.__class__.__name__.replace("Cache", "")
+                    
+                    print(f"{'='*20}{name}{'='*20}")
+                    print(f"✓ Texto {text_num} carregado com sucesso - {status}!")
+                    print(f"  Tempo de carregamento: {load_time:.6f}s")
+                    print(f"  Tamanho: {len(content)} caracteres")
+                    print(f"  Palavras: {len(content.split())}")
+                    print(f"Itens no cache: {cache.size()}/{cache.capacity}")
+                    print(f"{'='*60}\n")
 
                 #Imprime o conteudo, que é igual para todos os caches
-                print(ARCcontent)
+                print(content)
 
 
                 # Fim da exibição
@@ -0,0 +1,350 @@
+"""
+Agregação incremental dos resultados de simulação
+Mantém contadores de tamanho constante (independente do número de
+requisições): hits e misses, histograma logarítmico de latência e
+contadores por texto
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict, Iterable, List, Tuple
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from simulation.confidence import bootstrap_ci
+
+
+# Histograma de latência: 8 baldes por potência de 2 (erro relativo < 9%),
+# de 1ns a 2^48ns (~78h); o balde 0 guarda as latências zeradas
+LATENCY_BUCKETS_PER_OCTAVE = 8
+LATENCY_OCTAVES = 48
+NUM_LATENCY_BUCKETS = 1 + LATENCY_OCTAVES * LATENCY_BUCKETS_PER_OCTAVE
+
+
+def latency_histogram(latency_ns) -> np.ndarray:
+    """
+    Conta latências em baldes logarítmicos
+
+    Args:
+        latency_ns: latências em nanossegundos
+
+    Returns:
+        np.ndarray: contagem por balde (NUM_LATENCY_BUCKETS posições)
+    """
+    latency_ns = np.asarray(latency_ns, dtype=np.float64)
+    positive = latency_ns[latency_ns >= 1]
+
+    buckets = 1 + np.floor(np.log2(positive) * LATENCY_BUCKETS_PER_OCTAVE).astype(np.int64)
+    np.clip(buckets, 1, NUM_LATENCY_BUCKETS - 1, out=buckets)
+
+    histogram = np.bincount(buckets, minlength=NUM_LATENCY_BUCKETS).astype(np.int64)
+    histogram[0] = len(latency_ns) - len(positive)
+    return histogram
+
+
+def histogram_quantile(histogram: np.ndarray, quantile: float) -> float:
+    """
+    Estima um percentil a partir do histograma de latência
+
+    Args:
+        histogram: contagens por balde (latency_histogram)
+        quantile: percentil entre 0 e 1
+
+    Returns:
+        float: latência estimada em segundos (centro geométrico do balde)
+    """
+    total = histogram.sum()
+    if total == 0:
+        return 0.0
+
+    bucket = int(np.searchsorted(np.cumsum(histogram), quantile * total, side='left'))
+    if bucket == 0:
+        return 0.0
+    return 2 ** ((bucket - 0.5) / LATENCY_BUCKETS_PER_OCTAVE) / 1e9
+
+
+def steady_state_ranking(summary: Dict, pattern: str) -> bool:
+    """
+    Se o ranking de um padrão deve usar o hit rate em regime
+
+    Só quando houve aquecimento e todo algoritmo do padrão tem usuários com
+    requisições em regime; senão (ex.: com warmup='fill', o cache nunca
+    encheu) o ranking usa o hit rate da sequência inteira.
+
+    Args:
+        summary: estatísticas de StreamingAggregator.summary
+        pattern: padrão de acesso
+
+    Returns:
+        bool: True para usar as métricas 'steady'
+    """
+    groups = [data[pattern] for data in summary.values() if pattern in data]
+    has_warmup = any(stats.get('total_warmup_requests') for data in summary.values()
+                     for stats in data.values())
+    return has_warmup and all(stats.get('num_steady_users', stats['num_users'])
+                              for stats in groups)
+
+
+def _finite(values: List[float]) -> np.ndarray:
+    """Valores por usuário sem os NaN (usuários sem requisições em regime)"""
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.isfinite(values)]
+
+
+def _add_per_text(total: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Soma contagens por texto, aumentando o array se preciso"""
+    if len(counts) > len(total):
+        total = np.pad(total, (0, len(counts) - len(total)))
+    total[:len(counts)] += counts
+    return total
+
+
+class _GroupStats:
+    """Acumuladores de um par (algoritmo, padrão)"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.warmup_requests = 0
+        self.warmup_misses = 0
+
+        # Um valor por usuário: tamanho proporcional aos usuários, não às requisições
+        self.hit_rates = []
+        self.miss_rates = []
+        self.load_times = []
+        self.steady_hit_rates = []
+        self.steady_load_times = []
+        self.hot_set_before = []
+        self.hot_set_after = []
+
+        self.text_hits = np.zeros(0, dtype=np.int64)
+        self.text_misses = np.zeros(0, dtype=np.int64)
+        self.latency = np.zeros(NUM_LATENCY_BUCKETS, dtype=np.int64)
+
+
+class StreamingAggregator:
+    """
+    Estatísticas dos resultados, atualizadas a cada célula ou bloco
+
+    A memória usada depende só do número de (algoritmo, padrão, usuário) e
+    do número de textos, nunca do número de requisições: o log de acessos
+    não é necessário. O resumo do SimulationEngine e os gráficos do
+    ReportGenerator são calculados a partir daqui.
+
+    Exemplo:
+        aggregator = StreamingAggregator()
+        for result in results:
+            aggregator.add_result(result)
+        aggregator.summary()['LRUCache']['zipf']['avg_hit_rate']
+    """
+
+    def __init__(self):
+        self.groups = {}    # {algoritmo: {padrão: _GroupStats}}
+
+    @classmethod
+    def from_results(cls, results: Dict[str, List[Dict]]) -> 'StreamingAggregator':
+        """
+        Agrega resultados já existentes ({algoritmo: [resultados]})
+
+        Args:
+            results: resultados organizados por algoritmo
+
+        Returns:
+            StreamingAggregator: agregador com todos os resultados
+        """
+        aggregator = cls()
+        for user_results in results.values():
+            for result in user_results:
+                aggregator.add_result(result)
+        return aggregator
+
+    def _group(self, algorithm: str, pattern: str) -> _GroupStats:
+        """Acumuladores do par (algoritmo, padrão), criados na primeira vez"""
+        patterns = self.groups.setdefault(algorithm, {})
+        if pattern not in patterns:
+            patterns[pattern] = _GroupStats()
+        return patterns[pattern]
+
+    def add_requests(self, algorithm: str, pattern: str, text_ids: np.ndarray,
+                     was_hit: np.ndarray, latency_ns: np.ndarray = None):
+        """
+        Acumula um bloco de requisições (contadores por texto e latência)
+
+        Args:
+            algorithm: nome do algoritmo
+            pattern: padrão de acesso
+            text_ids: números dos textos do bloco
+            was_hit: se cada requisição foi hit
+            latency_ns: latência de cada requisição, em nanossegundos
+        """
+        text_ids = np.asarray(text_ids)
+        was_hit = np.asarray(was_hit, dtype=bool)
+        self.add_counts(algorithm, pattern, np.bincount(text_ids[was_hit]),
+                        np.bincount(text_ids[~was_hit]),
+                        latency_histogram(latency_ns) if latency_ns is not None else None)
+
+    def add_counts(self, algorithm: str, pattern: str, text_hits: np.ndarray,
+                   text_misses: np.ndarray, latency: np.ndarray = None):
+        """
+        Acumula contadores já calculados de um bloco de requisições
+
+        Args:
+            algorithm: nome do algoritmo
+            pattern: padrão de acesso
+            text_hits: hits por número de texto
+            text_misses: misses por número de texto
+            latency: histograma de latência do bloco (latency_histogram)
+        """
+        group = self._group(algorithm, pattern)
+        group.text_hits = _add_per_text(group.text_hits, text_hits)
+        group.text_misses = _add_per_text(group.text_misses, text_misses)
+        if latency is not None:
+            group.latency += latency
+
+    def add_result(self, result: Dict, include_counts: bool = True):
+        """
+        Acumula o resultado de uma célula (um usuário)
+
+        Usa os contadores por texto e o histograma de latência do resultado;
+        o log de acessos só é lido se o histograma não estiver presente.
+
+        Args:
+            result: resultado no formato de SimulationEngine.simulate_user
+            include_counts: soma também os contadores por texto e o
+                            histograma; False quando os blocos da célula já
+                            foram agregados (add_counts / add_requests)
+        """
+        group = self._group(result['algorithm'], result['pattern'])
+
+        group.hits += result['hits']
+        group.misses += result['misses']
+        group.warmup_requests += result.get('warmup_requests', 0)
+        group.warmup_misses += result.get('warmup_misses', 0)
+
+        group.hit_rates.append(result['hit_rate'])
+        group.miss_rates.append(result['miss_rate'])
+        group.load_times.append(result['avg_load_time'])
+        # Resultados sem aquecimento (ex.: traces) contam por inteiro
+        group.steady_hit_rates.append(result.get('steady_hit_rate', result['hit_rate']))
+        group.steady_load_times.append(result.get('steady_avg_load_time', result['avg_load_time']))
+        if 'hot_set_after_scan' in result:
+            group.hot_set_before.append(result['hot_set_before_scan'])
+            group.hot_set_after.append(result['hot_set_after_scan'])
+
+        if not include_counts:
+            return
+
+        group.text_hits = _add_per_text(group.text_hits, result['text_hit_count'])
+        group.text_misses = _add_per_text(group.text_misses, result['text_miss_count'])
+
+        if 'latency_histogram' in result:
+            group.latency += result['latency_histogram']
+        elif len(result.get('access_log', {}).get('latency_ns', ())):
+            group.latency += latency_histogram(result['access_log']['latency_ns'])
+
+    def algorithms(self) -> List[str]:
+        """Algoritmos agregados, na ordem em que apareceram"""
+        return list(self.groups)
+
+    def patterns(self) -> List[str]:
+        """Padrões agregados, na ordem em que apareceram"""
+        return list(dict.fromkeys(p for patterns in self.groups.values() for p in patterns))
+
+    def text_counts(self, algorithm: str, patterns: Iterable[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hits e misses por texto de um algoritmo, somados nos padrões
+
+        Args:
+            algorithm: nome do algoritmo
+            patterns: padrões a somar (padrão: todos)
+
+        Returns:
+            tuple: (hits, misses), arrays indexados pelo número do texto
+        """
+        hits = np.zeros(0, dtype=np.int64)
+        misses = np.zeros(0, dtype=np.int64)
+        for pattern, group in self.groups.get(algorithm, {}).items():
+            if patterns is None or pattern in patterns:
+                hits = _add_per_text(hits, group.text_hits)
+                misses = _add_per_text(misses, group.text_misses)
+        size = max(len(hits), len(misses))
+        return np.pad(hits, (0, size - len(hits))), np.pad(misses, (0, size - len(misses)))
+
+    def summary(self) -> Dict:
+        """
+        Estatísticas por algoritmo e padrão
+
+        Usuários cujo aquecimento tomou a sequência inteira têm métricas em
+        regime NaN: ficam fora das médias e do intervalo 'steady' (contados
+        em 'num_steady_users'); sem nenhum, essas médias são NaN.
+
+        Returns:
+            dict: {algoritmo: {padrão: estatísticas}}, com médias por usuário,
+                  totais, valores por usuário, intervalos de confiança e
+                  percentis de latência (p50/p99, pelo histograma)
+        """
+        summary = {}
+        for algorithm, patterns in self.groups.items():
+            summary[algorithm] = {}
+            for pattern, group in patterns.items():
+                steady_hit_rates = _finite(group.steady_hit_rates)
+                steady_load_times = _finite(group.steady_load_times)
+                stats = {
+                    'avg_hit_rate': float(np.mean(group.hit_rates)),
+                    'avg_miss_rate': float(np.mean(group.miss_rates)),
+                    'avg_load_time': float(np.mean(group.load_times)),
+                    'total_hits': group.hits,
+                    'total_misses': group.misses,
+                    'num_users': len(group.hit_rates),
+                    'num_steady_users': len(steady_hit_rates),
+                    'avg_steady_hit_rate': (float(steady_hit_rates.mean())
+                                            if len(steady_hit_rates) else float('nan')),
+                    'avg_steady_load_time': (float(steady_load_times.mean())
+                                             if len(steady_load_times) else float('nan')),
+                    'total_warmup_requests': group.warmup_requests,
+                    'total_warmup_misses': group.warmup_misses,
+                    # Valores por usuário, na ordem dos usuários (amostras pareadas)
+                    'user_hit_rates': list(group.hit_rates),
+                    'user_steady_hit_rates': list(group.steady_hit_rates),
+                    'hit_rate_ci': bootstrap_ci(group.hit_rates)[1:],
+                    'steady_hit_rate_ci': (bootstrap_ci(steady_hit_rates)[1:]
+                                           if len(steady_hit_rates)
+                                           else (float('nan'), float('nan'))),
+                    'p50_load_time': histogram_quantile(group.latency, 0.50),
+                    'p99_load_time': histogram_quantile(group.latency, 0.99)
+                }
+                if group.hot_set_after:
+                    stats['avg_hot_set_before_scan'] = float(np.mean(group.hot_set_before))
+                    stats['avg_hot_set_after_scan'] = float(np.mean(group.hot_set_after))
+                summary[algorithm][pattern] = stats
+        return summary
+
+
+# Teste do agregador
+if __name__ == "__main__":
+    print("="*70)
+    print("TESTE DO AGREGADOR INCREMENTAL")
+    print("="*70)
+
+    rng = np.random.default_rng(0)
+    latencies = rng.lognormal(np.log(5e6), 0.5, size=100_000)    # ~5ms
+    histogram = latency_histogram(latencies)
+
+    for q in (0.5, 0.99):
+        exact = np.quantile(latencies, q) / 1e9
+        print(f"p{q*100:.0f}: histograma {histogram_quantile(histogram, q)*1000:.3f}ms, "
+              f"exato {exact*1000:.3f}ms")
+    print(f"Memória do histograma: {histogram.nbytes} bytes para {len(latencies)} latências")
+
+    aggregator = StreamingAggregator()
+    for start in range(0, 1_000_000, 100_000):
+        text_ids = rng.integers(1, 101, size=100_000)
+        aggregator.add_requests('LRUCache', 'random', text_ids, text_ids <= 10, latencies)
+
+    hits, misses = aggregator.text_counts('LRUCache')
+    print(f"\n1.000.000 requisições em blocos: {hits.sum()} hits, {misses.sum()} misses "
+          f"({hits.nbytes + misses.nbytes} bytes de contadores por texto)")
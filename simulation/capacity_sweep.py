@@ -0,0 +1,125 @@
+"""
+Varredura de capacidade: hit rate de cada algoritmo em função do tamanho do cache
+Encontra o "joelho" de cada curva (método Kneedle) e recomenda uma
+capacidade por política
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict, Optional
+import numpy as np
+
+
+def find_knee(capacities, hit_rates, min_gap: float = 0.05) -> Optional[int]:
+    """
+    Encontra o joelho de uma curva de hit rate crescente (método Kneedle)
+
+    Os dois eixos são normalizados para [0, 1]; o joelho é o ponto em que
+    a curva mais se afasta da reta que liga a primeira à última capacidade,
+    ou seja, onde aumentar o cache deixa de compensar. Curvas quase retas
+    (cada texto a mais rende o mesmo ganho, como no acesso uniforme) não
+    têm joelho.
+
+    Args:
+        capacities: capacidades avaliadas, em ordem crescente
+        hit_rates: hit rate em cada capacidade
+        min_gap: afastamento mínimo da reta, em unidades normalizadas,
+                 para que o ponto conte como joelho
+
+    Returns:
+        int: capacidade do joelho, ou None se a curva não tiver joelho
+    """
+    x = np.asarray(capacities, dtype=np.float64)
+    y = np.asarray(hit_rates, dtype=np.float64)
+
+    if len(x) < 3 or x[-1] == x[0] or y.max() == y.min():
+        return None
+
+    x_norm = (x - x[0]) / (x[-1] - x[0])
+    y_norm = (y - y.min()) / (y.max() - y.min())
+    difference = y_norm - x_norm
+
+    knee = int(np.argmax(difference))
+    if difference[knee] < min_gap:
+        return None
+    return int(x[knee])
+
+
+def format_bytes(num_bytes: float) -> str:
+    """Formata um tamanho em bytes (KB, MB, GB)"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if num_bytes < 1024 or unit == 'GB':
+            return f"{num_bytes:.0f}{unit}" if unit == 'B' else f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+
+
+def print_capacity_sweep(sweep: Dict):
+    """
+    Exibe a tabela da varredura e a capacidade recomendada por política
+
+    Args:
+        sweep: resultado de SimulationEngine.simulate_capacity_sweep
+    """
+    capacities = sweep['capacities']
+    mean_size = sweep['mean_text_size']
+
+    print("\n" + "="*70)
+    print("VARREDURA DE CAPACIDADE (hit rate médio dos padrões)")
+    print("="*70)
+    if sweep.get('warmup'):
+        print(f"Hit rate em regime, após {sweep['warmup']} requisições de aquecimento\n")
+
+    header = f"{'Capacidade':<12}" + (f"{'Memória':<10}" if mean_size else "")
+    header += "".join(f"{alg:>14}" for alg in sweep['overall'])
+    print(header)
+    print("-"*70)
+    for i, capacity in enumerate(capacities):
+        row = f"{int(capacity):<12}"
+        if mean_size:
+            row += f"{format_bytes(capacity * mean_size):<10}"
+        row += "".join(f"{curve[i]:>13.2f}%" for curve in sweep['overall'].values())
+        print(row)
+
+    print("\n" + "-"*70)
+    print("📐 CAPACIDADE RECOMENDADA POR POLÍTICA (joelho da curva)")
+    print("-"*70)
+
+    for algorithm, curve in sweep['overall'].items():
+        knee = sweep['knees'][algorithm]
+        best = curve[-1]
+        if knee is None:
+            print(f"{algorithm:<15} sem joelho: o ganho por texto é quase constante "
+                  f"(máx. {best:.1f}% com {int(capacities[-1])} textos)")
+            continue
+
+        at_knee = curve[np.searchsorted(capacities, knee)]
+        line = (f"{algorithm:<15} {knee:>5} textos → {at_knee:6.2f}% "
+                f"(máx. {best:.1f}% com {int(capacities[-1])})")
+        if mean_size:
+            line += f"  ≈ {format_bytes(knee * mean_size)}"
+        print(line)
+
+        pattern_knees = ", ".join(f"{pattern}: {k if k is not None else '-'}"
+                                  for pattern, k in sweep['pattern_knees'][algorithm].items())
+        print(f"{'':<15} joelho por padrão: {pattern_knees}")
+
+
+# Teste da detecção de joelho
+if __name__ == "__main__":
+    print("="*70)
+    print("TESTE DA DETECÇÃO DE JOELHO")
+    print("="*70)
+
+    capacities = np.arange(1, 101)
+
+    # Curva côncava típica (Zipf): satura rápido
+    concave = 100 * (1 - np.exp(-capacities / 12))
+    print(f"Curva côncava (escala 12):         joelho em {find_knee(capacities, concave)}")
+
+    # Curva linear (acesso uniforme): sem joelho
+    linear = capacities.astype(float)
+    print(f"Curva linear (acesso uniforme):    joelho em {find_knee(capacities, linear)}")
+
+    # Degrau (laço cíclico): tudo ou nada quando o laço cabe no cache
+    step = np.where(capacities >= 30, 95.0, 0.0)
+    print(f"Degrau em 30 (laço cíclico):       joelho em {find_knee(capacities, step)}")
@@ -0,0 +1,164 @@
+"""
+Checkpoints de simulações longas
+Guarda em disco as células concluídas e o estado da célula em andamento,
+para que uma simulação interrompida continue de onde parou
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict, Hashable
+import os
+import pickle
+import time
+from pathlib import Path
+
+
+CHECKPOINT_VERSION = 2
+
+
+class SimulationCheckpoint:
+    """
+    Progresso de uma simulação, salvo periodicamente em um arquivo pickle
+
+    Guarda:
+    - a configuração da execução (um checkpoint só é retomado pela mesma
+      configuração)
+    - o resultado de cada célula concluída, pela chave da célula
+    - um retrato da célula em andamento (cache, posição na sequência,
+      acumuladores e log parcial), tirado entre dois blocos de requisições
+
+    A gravação é atômica: o arquivo é escrito ao lado e renomeado, então
+    uma interrupção durante a gravação mantém o checkpoint anterior.
+
+    Exemplo:
+        checkpoint = SimulationCheckpoint.open("sim.ckpt", config, resume=True)
+        engine.checkpoint = checkpoint
+        ...
+        checkpoint.save()      # ao interromper
+        checkpoint.remove()    # ao concluir
+    """
+
+    def __init__(self, path, config: Dict, interval: float = 60.0):
+        """
+        Args:
+            path: caminho do arquivo de checkpoint
+            config: configuração da execução (deve ser serializável)
+            interval: intervalo mínimo entre gravações periódicas, em segundos
+        """
+        self.path = Path(path)
+        self.config = config
+        self.interval = interval
+
+        self.completed = {}    # {chave da célula: resultado}
+        self.partial = None    # (chave, retrato serializado) da célula em andamento
+        self.last_save = time.time()
+
+    @classmethod
+    def open(cls, path, config: Dict, interval: float = 60.0,
+             resume: bool = True) -> 'SimulationCheckpoint':
+        """
+        Abre um checkpoint, retomando o progresso salvo se for compatível
+
+        Args:
+            path: caminho do arquivo de checkpoint
+            config: configuração da execução atual
+            interval: intervalo mínimo entre gravações, em segundos
+            resume: retoma o arquivo existente; se False, começa do zero
+
+        Returns:
+            SimulationCheckpoint: checkpoint novo ou retomado
+        """
+        checkpoint = cls(path, config, interval)
+        if not resume or not checkpoint.path.exists():
+            return checkpoint
+
+        try:
+            with open(checkpoint.path, 'rb') as f:
+                saved = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            print(f"⚠️  Checkpoint {checkpoint.path} ilegível ({e}); começando do zero")
+            return checkpoint
+
+        if saved.get('version') != CHECKPOINT_VERSION or saved.get('config') != config:
+            print(f"⚠️  Checkpoint {checkpoint.path} é de outra configuração; começando do zero")
+            return checkpoint
+
+        checkpoint.completed = saved['completed']
+        checkpoint.partial = saved['partial']
+        print(f"♻️  Retomando do checkpoint {checkpoint.path}: "
+              f"{len(checkpoint.completed)} células concluídas"
+              f"{' + 1 em andamento' if checkpoint.partial else ''}")
+        return checkpoint
+
+    def is_done(self, key: Hashable) -> bool:
+        """Verifica se a célula já foi concluída"""
+        return key in self.completed
+
+    def record(self, key: Hashable, result):
+        """
+        Registra uma célula concluída (e grava se o intervalo já passou)
+
+        Args:
+            key: chave da célula
+            result: resultado da célula
+        """
+        self.completed[key] = result
+        if self.partial is not None and self.partial[0] == key:
+            self.partial = None
+        if self.is_due():
+            self.save()
+
+    def snapshot(self, key: Hashable, state: Dict):
+        """
+        Retrata a célula em andamento e grava o checkpoint
+
+        O estado é serializado na hora, então alterações posteriores no
+        cache não afetam o retrato.
+
+        Args:
+            key: chave da célula
+            state: estado da célula (cache, posição, log parcial, ...)
+        """
+        self.partial = (key, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        self.save()
+
+    def take_partial(self, key: Hashable):
+        """
+        Devolve (e consome) o retrato da célula, se for a célula em andamento
+
+        Args:
+            key: chave da célula
+
+        Returns:
+            dict: estado salvo por snapshot(), ou None
+        """
+        if self.partial is None or self.partial[0] != key:
+            return None
+        state = pickle.loads(self.partial[1])
+        self.partial = None
+        return state
+
+    def is_due(self) -> bool:
+        """Verifica se já passou o intervalo desde a última gravação"""
+        return time.time() - self.last_save >= self.interval
+
+    def save(self):
+        """Grava o checkpoint de forma atômica"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+
+        with open(temp_path, 'wb') as f:
+            pickle.dump({
+                'version': CHECKPOINT_VERSION,
+                'config': self.config,
+                'completed': self.completed,
+                'partial': self.partial
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+
+        self.last_save = time.time()
+
+    def remove(self):
+        """Apaga o arquivo do checkpoint (simulação concluída)"""
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,141 @@
+"""
+Estatística das simulações: intervalos de confiança por bootstrap
+Usados para dizer se a diferença entre dois algoritmos é real ou ruído
+das sementes
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+def bootstrap_ci(samples, confidence: float = 0.95, num_resamples: int = 2000,
+                 seed: int = 0) -> Tuple[float, float, float]:
+    """
+    Intervalo de confiança da média por bootstrap percentil
+
+    Args:
+        samples: valores observados (ex.: hit rate de cada usuário)
+        confidence: nível de confiança
+        num_resamples: número de reamostragens
+        seed: semente das reamostragens (resultado reprodutível)
+
+    Returns:
+        tuple: (média, limite inferior, limite superior); com menos de duas
+               amostras o intervalo é o próprio valor
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    mean = float(samples.mean()) if len(samples) else 0.0
+    if len(samples) < 2:
+        return mean, mean, mean
+
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(samples), size=(num_resamples, len(samples)))
+    means = samples[indices].mean(axis=1)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(means, [alpha, 1 - alpha])
+    return mean, float(low), float(high)
+
+
+def paired_difference_ci(samples_a, samples_b, confidence: float = 0.95,
+                         num_resamples: int = 2000,
+                         seed: int = 0) -> Tuple[float, float, float]:
+    """
+    Intervalo de confiança da diferença média entre dois algoritmos
+
+    As amostras são pareadas: a posição i de cada lista vem da mesma
+    sequência de requisições (mesmo usuário e semente), então a variação
+    da carga se cancela e o intervalo fica bem mais estreito do que
+    comparando as médias separadamente.
+
+    Args:
+        samples_a: valores do algoritmo A
+        samples_b: valores do algoritmo B, na mesma ordem
+        confidence: nível de confiança
+        num_resamples: número de reamostragens
+        seed: semente das reamostragens
+
+    Returns:
+        tuple: (diferença média A - B, limite inferior, limite superior)
+    """
+    differences = np.asarray(samples_a, dtype=np.float64) - np.asarray(samples_b, dtype=np.float64)
+    return bootstrap_ci(differences, confidence, num_resamples, seed)
+
+
+def leader_comparison(samples: Dict[str, List[float]], confidence: float = 0.95,
+                      num_resamples: int = 2000) -> Dict:
+    """
+    Compara os dois algoritmos com maior média
+
+    Args:
+        samples: {algoritmo: valores por usuário, na mesma ordem de usuários}
+        confidence: nível de confiança
+        num_resamples: número de reamostragens
+
+    Usuários com valor NaN em algum algoritmo (ex.: sem requisições em
+    regime) ficam fora da comparação, nos dois lados do par.
+
+    Returns:
+        dict: 'leader', 'runner_up', 'difference', 'ci_low', 'ci_high',
+              'width', 'confidence', 'separated' (True se o intervalo
+              não contém zero) e 'num_samples' (usuários comparados)
+    """
+    samples = {name: np.asarray(values, dtype=np.float64) for name, values in samples.items()}
+    if len({len(values) for values in samples.values()}) == 1:
+        paired = np.logical_and.reduce([np.isfinite(values) for values in samples.values()])
+        samples = {name: values[paired] for name, values in samples.items()}
+    num_samples = min(len(values) for values in samples.values())
+    if num_samples == 0:
+        names = list(samples)
+        return {
+            'leader': names[0],
+            'runner_up': names[1] if len(names) > 1 else names[0],
+            'difference': float('nan'),
+            'ci_low': float('nan'),
+            'ci_high': float('nan'),
+            'width': float('nan'),
+            'confidence': confidence,
+            'separated': False,
+            'num_samples': 0
+        }
+
+    ranked = sorted(samples, key=lambda name: np.mean(samples[name]), reverse=True)
+    leader, runner_up = ranked[0], ranked[1] if len(ranked) > 1 else ranked[0]
+
+    difference, low, high = paired_difference_ci(samples[leader], samples[runner_up],
+                                                 confidence, num_resamples)
+    return {
+        'leader': leader,
+        'runner_up': runner_up,
+        'difference': difference,
+        'ci_low': low,
+        'ci_high': high,
+        'width': high - low,
+        'confidence': confidence,
+        'separated': low > 0,
+        'num_samples': num_samples
+    }
+
+
+# Teste dos intervalos de confiança
+if __name__ == "__main__":
+    print("="*70)
+    print("TESTE DOS INTERVALOS DE CONFIANÇA")
+    print("="*70)
+
+    rng = np.random.default_rng(1)
+    load = rng.normal(40, 8, size=10)           # Variação entre usuários
+    lru = load + rng.normal(0, 0.5, size=10)
+    lfu = load + 1.5 + rng.normal(0, 0.5, size=10)
+
+    mean, low, high = bootstrap_ci(lfu)
+    print(f"LFU: {mean:.2f}% [{low:.2f}, {high:.2f}]")
+    mean, low, high = bootstrap_ci(lru)
+    print(f"LRU: {mean:.2f}% [{low:.2f}, {high:.2f}]  (intervalos se sobrepõem)")
+
+    comparison = leader_comparison({'LRUCache': lru.tolist(), 'LFUCache': lfu.tolist()})
+    print(f"\n{comparison['leader']} - {comparison['runner_up']}: "
+          f"{comparison['difference']:.2f} pp [{comparison['ci_low']:.2f}, {comparison['ci_high']:.2f}]"
+          f" → {'diferença real' if comparison['separated'] else 'empate'} (pareado)")
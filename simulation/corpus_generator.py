@@ -0,0 +1,236 @@
+"""
+Gerador de corpus sintético para benchmarks de escala
+Produz N textos com tamanhos seguindo uma distribuição configurável,
+de forma determinística a partir de uma semente
+
+Aluno D - Módulo de Simulação
+"""
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.text_loader import PackedTextWriter
+
+
+SIZE_DISTRIBUTIONS = ['fixed', 'lognormal', 'pareto']
+
+
+class CorpusGenerator:
+    """
+    Classe para gerar corpora sintéticos nos formatos lidos pelo TextLoader
+
+    Cada texto é gerado a partir de uma semente própria derivada de
+    (seed, número do texto), então o texto k é sempre o mesmo,
+    independentemente de quantos textos são gerados ou em que ordem.
+    """
+
+    def __init__(self, num_texts: int = 100, distribution: str = 'fixed',
+                 mean_words: int = 1000, sigma: float = 1.0, alpha: float = 1.5,
+                 max_words: int = None, vocabulary_size: int = 5000,
+                 seed: int = 0):
+        """
+        Inicializa o gerador de corpus
+
+        Args:
+            num_texts: número de textos a gerar
+            distribution: distribuição dos tamanhos ('fixed', 'lognormal', 'pareto')
+            mean_words: tamanho médio de um texto, em palavras
+            sigma: desvio padrão do log do tamanho (lognormal)
+            alpha: expoente da cauda (pareto, deve ser > 1)
+            max_words: limite superior de palavras por texto (None = 1000 × média)
+            vocabulary_size: número de palavras distintas do vocabulário
+            seed: semente para reprodutibilidade
+
+        Raises:
+            ValueError: se a distribuição ou os parâmetros forem inválidos
+        """
+        if distribution not in SIZE_DISTRIBUTIONS:
+            raise ValueError(f"Distribuição inválida: {distribution}. "
+                             f"Use {', '.join(SIZE_DISTRIBUTIONS)}")
+        if distribution == 'pareto' and alpha <= 1:
+            raise ValueError("alpha deve ser maior que 1 para a distribuição pareto")
+
+        self.num_texts = num_texts
+        self.distribution = distribution
+        self.mean_words = mean_words
+        self.sigma = sigma
+        self.alpha = alpha
+        self.max_words = max_words or mean_words * 1000
+        self.seed = seed
+
+        self.vocabulary = self._build_vocabulary(vocabulary_size)
+        self.sizes = self._generate_sizes()
+
+    def _build_vocabulary(self, vocabulary_size: int) -> np.ndarray:
+        """
+        Cria um vocabulário de pseudo-palavras a partir de sílabas
+
+        Returns:
+            np.ndarray: array de strings com as palavras
+        """
+        rng = np.random.default_rng([self.seed, 0])
+        syllables = np.array([c + v for c in "bcdfglmnprstv" for v in "aeiou"])
+        lengths = rng.integers(1, 5, size=vocabulary_size)
+
+        words = []
+        for length in lengths:
+            words.append("".join(rng.choice(syllables, size=length)))
+        return np.array(words)
+
+    def _generate_sizes(self) -> np.ndarray:
+        """
+        Sorteia o tamanho (em palavras) de cada texto
+
+        Returns:
+            np.ndarray: array int64 com num_texts tamanhos
+        """
+        rng = np.random.default_rng([self.seed, 1])
+
+        if self.distribution == 'fixed':
+            sizes = np.full(self.num_texts, self.mean_words, dtype=np.float64)
+        elif self.distribution == 'lognormal':
+            # mu escolhido para que a média da lognormal seja mean_words
+            mu = np.log(self.mean_words) - self.sigma ** 2 / 2
+            sizes = rng.lognormal(mu, self.sigma, size=self.num_texts)
+        else:
+            # Pareto clássica com mínimo xm e média alpha * xm / (alpha - 1)
+            xm = self.mean_words * (self.alpha - 1) / self.alpha
+            sizes = (rng.pareto(self.alpha, size=self.num_texts) + 1) * xm
+
+        return np.clip(np.rint(sizes), 1, self.max_words).astype(np.int64)
+
+    def generate_text(self, text_number: int) -> str:
+        """
+        Gera o conteúdo de um texto
+
+        Args:
+            text_number: número do texto (1 a num_texts)
+
+        Returns:
+            str: conteúdo do texto
+        """
+        rng = np.random.default_rng([self.seed, 2, text_number])
+        indices = rng.integers(0, len(self.vocabulary), size=self.sizes[text_number - 1])
+        return " ".join(self.vocabulary[indices].tolist())
+
+    def write(self, output_dir: str, formato: str = 'txt', num_workers: int = 4) -> int:
+        """
+        Grava o corpus em disco no formato do TextLoader
+
+        Args:
+            output_dir: diretório de saída
+            formato: 'txt' (texto_N.txt) ou 'packed' (textos.dat + textos.idx)
+            num_workers: número de threads de escrita
+
+        Returns:
+            int: total de bytes gravados
+
+        Raises:
+            ValueError: se o formato for inválido
+        """
+        if formato not in ('txt', 'packed'):
+            raise ValueError(f"Formato inválido: {formato}. Use 'txt' ou 'packed'")
+
+        os.makedirs(output_dir, exist_ok=True)
+        total_bytes = 0
+
+        if formato == 'packed':
+            # O formato empacotado exige ordem sequencial na reserva dos offsets
+            with PackedTextWriter(output_dir) as writer:
+                for text_number in range(1, self.num_texts + 1):
+                    data = self.generate_text(text_number).encode('utf-8')
+                    writer.write_at(writer.reserve(len(data)), data)
+                    total_bytes += len(data)
+            return total_bytes
+
+        def write_one(text_number: int) -> int:
+            data = self.generate_text(text_number).encode('utf-8')
+            with open(os.path.join(output_dir, f"texto_{text_number}.txt"), 'wb') as out:
+                out.write(data)
+            return len(data)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            for written in pool.map(write_one, range(1, self.num_texts + 1), chunksize=64):
+                total_bytes += written
+
+        return total_bytes
+
+    def describe(self) -> dict:
+        """
+        Retorna estatísticas dos tamanhos sorteados
+
+        Returns:
+            dict: estatísticas da distribuição de tamanhos (em palavras)
+        """
+        return {
+            'num_texts': self.num_texts,
+            'distribution': self.distribution,
+            'total_words': int(self.sizes.sum()),
+            'mean_words': float(self.sizes.mean()),
+            'median_words': float(np.median(self.sizes)),
+            'p99_words': float(np.percentile(self.sizes, 99)),
+            'max_words': int(self.sizes.max())
+        }
+
+
+def generate_corpora(base_dir: str, corpus_sizes: List[int], formato: str = 'txt',
+                     **kwargs) -> List[str]:
+    """
+    Gera um corpus para cada tamanho pedido (útil para rodadas de escala)
+
+    Args:
+        base_dir: diretório base; cada corpus vai para base_dir/corpus_<N>
+        corpus_sizes: lista com o número de textos de cada corpus
+        formato: formato de saída ('txt' ou 'packed')
+        **kwargs: parâmetros repassados ao CorpusGenerator
+
+    Returns:
+        list: diretórios gerados, na mesma ordem de corpus_sizes
+    """
+    directories = []
+    for num_texts in corpus_sizes:
+        output_dir = os.path.join(base_dir, f"corpus_{num_texts}")
+        CorpusGenerator(num_texts=num_texts, **kwargs).write(output_dir, formato)
+        directories.append(output_dir)
+    return directories
+
+
+# Execução pela linha de comando
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera um corpus sintético de textos")
+    parser.add_argument("saida", help="diretório de saída")
+    parser.add_argument("--num-textos", type=int, default=100)
+    parser.add_argument("--distribuicao", choices=SIZE_DISTRIBUTIONS, default='fixed')
+    parser.add_argument("--media", type=int, default=1000, help="média de palavras por texto")
+    parser.add_argument("--sigma", type=float, default=1.0, help="sigma da lognormal")
+    parser.add_argument("--alpha", type=float, default=1.5, help="expoente da pareto")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formato", choices=['txt', 'packed'], default='txt')
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(
+        num_texts=args.num_textos,
+        distribution=args.distribuicao,
+        mean_words=args.media,
+        sigma=args.sigma,
+        alpha=args.alpha,
+        seed=args.seed
+    )
+    total_bytes = generator.write(args.saida, args.formato, args.workers)
+
+    stats = generator.describe()
+    print(f"✅ Corpus gerado em '{args.saida}' ({args.formato})")
+    print(f"  Textos: {stats['num_texts']}")
+    print(f"  Distribuição: {stats['distribution']}")
+    print(f"  Palavras (média/mediana/p99/máx): {stats['mean_words']:.0f} / "
+          f"{stats['median_words']:.0f} / {stats['p99_words']:.0f} / {stats['max_words']}")
+    print(f"  Tamanho total: {total_bytes / 1e6:.2f} MB")
@@ -0,0 +1,269 @@
+"""
+Motor de simulação por eventos discretos com relógio virtual
+Modela a latência do disco lento em vez de esperá-la com time.sleep
+
+Aluno D - Módulo de Simulação
+"""
+
+import heapq
+import time
+from collections import deque
+from typing import Dict
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+# Tipos de evento no heap. As chegadas já vêm ordenadas e são intercaladas com
+# o heap sem passar por ele; conclusões no mesmo instante de uma chegada são
+# tratadas antes dela.
+DISK_DONE = 0
+PREFETCH_DONE = 1
+
+# Tempo de serviço de uma leitura quando nenhum perfil de disco é informado (s)
+DEFAULT_DISK_LATENCY = 0.005
+
+
+class EventSimulator:
+    """
+    Simulador de eventos discretos para um cache na frente de um disco lento
+
+    O relógio é virtual: o tempo avança de evento em evento (chegada de uma
+    requisição, fim de uma leitura, fim de uma antecipação), então a duração
+    da simulação depende apenas do custo da política de cache, não da
+    latência simulada.
+
+    Modelo:
+    - o disco tem disk_channels canais; cada leitura ocupa um canal pelo
+      tempo de leitura do texto (read_times, ou disk_latency segundos para
+      todos) e as leituras esperam em uma fila FIFO
+    - um hit responde em hit_latency; um hit em um texto cuja leitura ainda
+      não terminou (delayed hit) espera o fim dessa leitura
+    - com prefetch_depth > 0, cada miss do texto n antecipa os textos
+      n+1 ... n+prefetch_depth que não estão no cache
+    """
+
+    def __init__(self, cache, loader_function, disk_latency: float = DEFAULT_DISK_LATENCY,
+                 hit_latency: float = 0.0, disk_channels: int = 1,
+                 prefetch_depth: int = 0, total_texts: int = None, read_times=None):
+        """
+        Args:
+            cache: instância do algoritmo de cache
+            loader_function: função de carregamento passada ao cache
+            disk_latency: tempo de serviço de uma leitura, em segundos
+                          (usado quando read_times não é informado)
+            hit_latency: tempo de resposta de um hit, em segundos
+            disk_channels: leituras simultâneas suportadas pelo disco
+            prefetch_depth: número de textos seguintes antecipados a cada miss
+            total_texts: maior número de texto válido (limita a antecipação)
+            read_times: tempo de serviço de cada texto, em segundos, indexado
+                        pelo número do texto (ex.: disk_read_time do perfil
+                        de disco sobre o tamanho dos textos)
+        """
+        self.cache = cache
+        self.loader_function = loader_function
+        self.disk_latency = disk_latency
+        self.hit_latency = hit_latency
+        self.disk_channels = disk_channels
+        self.prefetch_depth = prefetch_depth
+        self.total_texts = total_texts
+        self.read_times = read_times
+
+    def run(self, requests, arrivals) -> Dict:
+        """
+        Executa a simulação
+
+        Args:
+            requests: lista ou array de números de textos
+            arrivals: instante de chegada (s) de cada requisição, em ordem crescente
+
+        Returns:
+            dict: tempos de resposta por requisição e métricas agregadas
+        """
+        cache = self.cache
+        loader_function = self.loader_function
+        disk_latency = self.disk_latency
+        hit_latency = self.hit_latency
+        read_times = (np.asarray(self.read_times, dtype=np.float64).tolist()
+                      if self.read_times is not None else None)
+
+        if isinstance(requests, np.ndarray):
+            requests = requests.tolist()
+        arrivals = np.asarray(arrivals, dtype=np.float64).tolist()
+        num_requests = len(requests)
+
+        response_times = np.empty(num_requests, dtype=np.float64)
+        queue_delays = np.zeros(num_requests, dtype=np.float64)
+
+        events = []            # Heap (instante, tipo, leitura, texto)
+        disk_queue = deque()   # Leituras esperando canal: (tipo, leitura, texto)
+        free_channels = self.disk_channels
+        readers = {}           # Leitura -> [(requisição, chegada)] esperando por ela
+        pending = {}           # Texto -> leitura mais recente ainda não concluída
+        prefetched = set()     # Textos antecipados ainda não pedidos
+        num_reads = 0
+
+        delayed_hits = 0
+        prefetches = 0
+        prefetch_hits = 0
+        disk_busy = 0.0
+        num_events = 0
+        now = 0.0
+
+        def start_read(kind: int, text_num: int, waiting: list, start: float):
+            """Ocupa um canal do disco ou põe a leitura na fila"""
+            nonlocal free_channels, num_reads, disk_busy
+            num_reads += 1
+            readers[num_reads] = waiting
+            pending[text_num] = num_reads
+            if free_channels > 0:
+                free_channels -= 1
+                service = read_times[text_num] if read_times is not None else disk_latency
+                heapq.heappush(events, (start + service, kind, num_reads, text_num))
+                disk_busy += service
+            else:
+                disk_queue.append((kind, num_reads, text_num))
+
+        def complete(event):
+            """Trata o fim de uma leitura e libera o canal para a próxima da fila"""
+            nonlocal free_channels, disk_busy
+            done, kind, read_id, text_num = event
+
+            for index, arrival in readers.pop(read_id):
+                response_times[index] = done - arrival
+            if pending.get(text_num) == read_id:
+                del pending[text_num]
+
+            if disk_queue:
+                next_kind, next_read, next_text = disk_queue.popleft()
+                service = read_times[next_text] if read_times is not None else disk_latency
+                heapq.heappush(events, (done + service, next_kind, next_read, next_text))
+                disk_busy += service
+                if readers[next_read]:
+                    # Espera na fila de quem causou a leitura
+                    index, arrival = readers[next_read][0]
+                    queue_delays[index] = done - arrival
+            else:
+                free_channels += 1
+
+        start_time = time.perf_counter()
+
+        for index in range(num_requests):
+            text_num = requests[index]
+            now = arrivals[index]
+
+            # Processa as conclusões que acontecem até a chegada desta requisição
+            while events and events[0][0] <= now:
+                complete(heapq.heappop(events))
+                num_events += 1
+
+            num_events += 1
+            content, load_time, was_hit = cache.get(text_num, loader_function)
+
+            if text_num in prefetched:
+                prefetched.discard(text_num)
+                if was_hit:
+                    prefetch_hits += 1
+
+            if was_hit:
+                read_id = pending.get(text_num)
+                if read_id is not None:
+                    # Está no cache, mas a leitura ainda não terminou
+                    delayed_hits += 1
+                    readers[read_id].append((index, now))
+                else:
+                    response_times[index] = hit_latency
+                continue
+
+            # Miss: a requisição espera a própria leitura
+            start_read(DISK_DONE, text_num, [(index, now)], now)
+
+            for offset in range(1, self.prefetch_depth + 1):
+                candidate = text_num + offset
+                if self.total_texts is not None and candidate > self.total_texts:
+                    break
+                if candidate in pending or not cache.prefetch(candidate, loader_function):
+                    continue
+                prefetches += 1
+                prefetched.add(candidate)
+                start_read(PREFETCH_DONE, candidate, [], now)
+
+        # Esvazia as leituras restantes
+        while events:
+            event = heapq.heappop(events)
+            now = event[0]
+            complete(event)
+            num_events += 1
+
+        wall_time = time.perf_counter() - start_time
+        metrics = cache.get_metrics()
+        makespan = now - arrivals[0] if num_requests else 0.0
+
+        if num_requests:
+            p50, p95, p99 = np.percentile(response_times, [50, 95, 99])
+        else:
+            p50 = p95 = p99 = 0.0
+
+        return {
+            'algorithm': cache.__class__.__name__,
+            'total_requests': num_requests,
+            'hits': metrics['hits'],
+            'misses': metrics['misses'],
+            'hit_rate': metrics['hit_rate'],
+            'miss_rate': metrics['miss_rate'],
+            'delayed_hits': delayed_hits,
+            'prefetches': prefetches,
+            'prefetch_hits': prefetch_hits,
+            'mean_response_time': float(response_times.mean()) if num_requests else 0.0,
+            'p50_response_time': float(p50),
+            'p95_response_time': float(p95),
+            'p99_response_time': float(p99),
+            'max_response_time': float(response_times.max()) if num_requests else 0.0,
+            'mean_queue_delay': float(queue_delays.mean()) if num_requests else 0.0,
+            'virtual_time': makespan,
+            'disk_utilization': (disk_busy / (makespan * self.disk_channels)
+                                 if makespan > 0 else 0.0),
+            'events': num_events,
+            'wall_time': wall_time,
+            'requests_per_second': num_requests / wall_time if wall_time > 0 else 0.0,
+            'response_times': response_times
+        }
+
+
+# Teste do simulador de eventos
+if __name__ == "__main__":
+    from algorithms.lru_cache import LRUCache
+    from simulation.request_generator import RequestGenerator
+
+    print("="*70)
+    print("TESTE DO SIMULADOR DE EVENTOS DISCRETOS")
+    print("="*70)
+
+    generator = RequestGenerator(total_texts=100, seed=42)
+    num_requests = 200000
+    requests = generator.generate_user_requests(num_requests, 'zipf')
+    arrivals = generator.generate_arrivals(num_requests, 'mmpp', rate=50)
+
+    def keys_only_loader(num):
+        return "", 0.0
+
+    for depth in (0, 2):
+        simulator = EventSimulator(LRUCache(capacity=10), keys_only_loader,
+                                   disk_latency=0.005, prefetch_depth=depth,
+                                   total_texts=100)
+        result = simulator.run(requests, arrivals)
+
+        print(f"\nAntecipação: {depth} texto(s)")
+        print(f"  Hit rate: {result['hit_rate']:.2f}% "
+              f"({result['delayed_hits']} delayed hits)")
+        print(f"  Antecipações: {result['prefetches']} "
+              f"({result['prefetch_hits']} aproveitadas)")
+        print(f"  Resposta média/p99: {result['mean_response_time']*1000:.2f}ms / "
+              f"{result['p99_response_time']*1000:.2f}ms")
+        print(f"  Tempo virtual: {result['virtual_time']:.1f}s | "
+              f"Utilização do disco: {result['disk_utilization']*100:.1f}%")
+        print(f"  Tempo real: {result['wall_time']:.2f}s "
+              f"({result['requests_per_second']:,.0f} requisições/s)")
@@ -0,0 +1,238 @@
+"""
+Curvas de miss ratio do LRU em uma única passada
+Usa as distâncias de pilha de Mattson com uma árvore de Fenwick (O(n log n))
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class FenwickTree:
+    """
+    Árvore de Fenwick (Binary Indexed Tree) para somas de prefixo
+
+    Atualização e consulta em O(log n). Posições de 0 a size - 1.
+    """
+
+    def __init__(self, size: int):
+        """
+        Args:
+            size: número de posições
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, position: int, value: int):
+        """Soma value na posição"""
+        tree = self.tree
+        i = position + 1
+        while i <= self.size:
+            tree[i] += value
+            i += i & -i
+
+    def prefix_sum(self, position: int) -> int:
+        """Soma das posições 0 até position (inclusive)"""
+        tree = self.tree
+        i = position + 1
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+class StackDistanceAnalyzer:
+    """
+    Calcula as distâncias de pilha (stack distances) de uma sequência
+
+    A distância de pilha de um acesso é o número de textos distintos
+    acessados desde o acesso anterior ao mesmo texto, contando ele próprio.
+    Um LRU com capacidade C acerta exatamente os acessos com distância <= C,
+    então o histograma das distâncias dá a curva de miss ratio para todas
+    as capacidades de uma vez.
+
+    A árvore de Fenwick marca, para cada texto, a posição do seu último
+    acesso; a distância é o número de marcas depois da posição anterior.
+    A sequência pode ser processada em blocos com update().
+    """
+
+    def __init__(self, num_requests: int):
+        """
+        Args:
+            num_requests: número total de requisições que serão processadas
+        """
+        self.num_requests = num_requests
+        self.tree = FenwickTree(num_requests)
+        self.last_access = {}    # Texto -> posição do último acesso
+        self.position = 0
+        self.histogram = np.zeros(1, dtype=np.int64)   # Índice = distância
+        self.cold_misses = 0
+
+    def update(self, requests) -> np.ndarray:
+        """
+        Processa o próximo bloco da sequência
+
+        Args:
+            requests: lista ou array de números de textos
+
+        Returns:
+            np.ndarray: distância de cada acesso do bloco (0 = primeiro acesso)
+
+        Raises:
+            ValueError: se o total de requisições informado for ultrapassado
+        """
+        if isinstance(requests, np.ndarray):
+            requests = requests.tolist()
+        if self.position + len(requests) > self.num_requests:
+            raise ValueError(f"A sequência tem mais de {self.num_requests} requisições")
+
+        tree = self.tree.tree
+        size = self.tree.size
+        last_access = self.last_access
+        distances = np.zeros(len(requests), dtype=np.int64)
+        position = self.position
+
+        # As operações da árvore são feitas em linha para evitar chamadas de
+        # método no laço principal
+        for i, text_num in enumerate(requests):
+            previous = last_access.get(text_num)
+
+            if previous is not None:
+                # Marcas depois de previous = textos distintos desde o último acesso
+                j = previous + 1
+                before = 0
+                while j > 0:
+                    before += tree[j]
+                    j -= j & -j
+                distances[i] = len(last_access) - before + 1
+
+                j = previous + 1
+                while j <= size:
+                    tree[j] -= 1
+                    j += j & -j
+
+            last_access[text_num] = position
+            j = position + 1
+            while j <= size:
+                tree[j] += 1
+                j += j & -j
+            position += 1
+
+        self.position = position
+
+        counts = np.bincount(distances)
+        if len(counts) > len(self.histogram):
+            self.histogram = np.pad(self.histogram, (0, len(counts) - len(self.histogram)))
+        self.histogram[:len(counts)] += counts
+        self.cold_misses = int(self.histogram[0])
+
+        return distances
+
+    def miss_ratio_curve(self, max_capacity: int = None) -> Dict:
+        """
+        Monta a curva de miss ratio do LRU
+
+        Args:
+            max_capacity: maior capacidade da curva (padrão: textos distintos)
+
+        Returns:
+            dict: 'capacities' (1..max_capacity), 'miss_ratio' (0 a 1),
+                  'hit_rate' (%), 'cold_misses', 'total_requests', 'unique_texts'
+        """
+        unique_texts = len(self.last_access)
+        max_capacity = max_capacity or max(unique_texts, 1)
+
+        histogram = np.zeros(max_capacity + 1, dtype=np.int64)
+        used = min(len(self.histogram), max_capacity + 1)
+        histogram[:used] = self.histogram[:used]
+        histogram[0] = 0
+
+        hits = np.cumsum(histogram)[1:]
+        total = self.position
+        miss_ratio = 1 - hits / total if total else np.ones(max_capacity)
+
+        return {
+            'capacities': np.arange(1, max_capacity + 1),
+            'miss_ratio': miss_ratio,
+            'hit_rate': (1 - miss_ratio) * 100,
+            'cold_misses': self.cold_misses,
+            'total_requests': total,
+            'unique_texts': unique_texts
+        }
+
+
+def lru_miss_ratio_curve(requests, max_capacity: int = None) -> Dict:
+    """
+    Curva de miss ratio exata do LRU para todas as capacidades
+
+    Args:
+        requests: lista ou array de números de textos
+        max_capacity: maior capacidade da curva (padrão: textos distintos)
+
+    Returns:
+        dict: curva no formato de StackDistanceAnalyzer.miss_ratio_curve
+    """
+    analyzer = StackDistanceAnalyzer(len(requests))
+    analyzer.update(requests)
+    return analyzer.miss_ratio_curve(max_capacity)
+
+
+def trace_miss_ratio_curve(trace, max_capacity: int = None,
+                           chunk_size: int = 1 << 16) -> Dict:
+    """
+    Curva de miss ratio do LRU para um trace gravado (simulation.trace_store)
+
+    Args:
+        trace: Trace ou caminho do diretório do trace
+        max_capacity: maior capacidade da curva (padrão: textos distintos)
+        chunk_size: requisições lidas por bloco
+
+    Returns:
+        dict: curva no formato de StackDistanceAnalyzer.miss_ratio_curve
+    """
+    from simulation.trace_store import Trace
+
+    if not isinstance(trace, Trace):
+        trace = Trace(trace)
+
+    analyzer = StackDistanceAnalyzer(len(trace))
+    for chunk in trace.iter_chunks(chunk_size):
+        analyzer.update(chunk['text_ids'])
+    return analyzer.miss_ratio_curve(max_capacity)
+
+
+# Teste da curva de miss ratio
+if __name__ == "__main__":
+    import time
+    from algorithms.lru_cache import LRUCache
+    from simulation.request_generator import RequestGenerator
+
+    print("="*70)
+    print("TESTE DA CURVA DE MISS RATIO (LRU)")
+    print("="*70)
+
+    generator = RequestGenerator(total_texts=100, seed=42)
+    requests = generator.generate_user_requests(100000, 'zipf')
+
+    start_time = time.time()
+    curve = lru_miss_ratio_curve(requests)
+    elapsed = time.time() - start_time
+
+    print(f"\n{len(requests)} requisições, {curve['unique_texts']} textos distintos "
+          f"({elapsed:.2f}s para todas as capacidades)")
+    print(f"\n{'Capacidade':<12} {'Miss ratio':<12} {'LRU simulado':<12}")
+    print("-"*40)
+
+    for capacity in (1, 5, 10, 20, 50):
+        cache = LRUCache(capacity=capacity)
+        for text_num in requests.tolist():
+            cache.get(text_num, lambda num: ("", 0.0))
+        simulated = cache.get_metrics()['miss_rate'] / 100
+        print(f"{capacity:<12} {curve['miss_ratio'][capacity - 1]:<12.4f} {simulated:<12.4f}")
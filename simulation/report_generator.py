@@ -8,8 +8,13 @@ Aluno D - Módulo de Simulação
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-from collections import defaultdict
 import numpy as np
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from simulation.request_generator import pattern_display_name
+from simulation.aggregator import StreamingAggregator
 
 
 class ReportGenerator:
@@ -17,41 +22,55 @@ class ReportGenerator:
     Classe para gerar relatórios e gráficos de análise de cache
     """
     
-    def __init__(self, output_dir: str = "docs"):
+    def __init__(self, output_dir: str = "docs", pattern_params: dict = None):
         """
         Inicializa o gerador de relatórios
         
         Args:
             output_dir: diretório onde os gráficos serão salvos
+            pattern_params: parâmetros por padrão usados na simulação, para
+                            os nomes dos padrões (ex.: {'zipf': {'exponent': 1.2}})
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.pattern_params = pattern_params or {}
         
         # Configuração de estilo
         sns.set_style("whitegrid")
         plt.rcParams['figure.figsize'] = (12, 6)
         plt.rcParams['font.size'] = 10
     
+    def _pattern_name(self, pattern: str) -> str:
+        """Nome exibido do padrão, com os parâmetros desta simulação"""
+        return pattern_display_name(pattern, self.pattern_params.get(pattern))
+    
+    @staticmethod
+    def _aggregate(results) -> StreamingAggregator:
+        """
+        Devolve o agregador dos resultados (os gráficos não leem o log de acessos)
+        
+        Args:
+            results: StreamingAggregator, ou dicionário {algorithm: [user_results]}
+                     que é agregado aqui
+        """
+        if isinstance(results, StreamingAggregator):
+            return results
+        return StreamingAggregator.from_results(results)
+    
     def generate_hit_rate_comparison(self, results: dict, filename: str = "hit_rate_comparison.png"):
         """
         Gera gráfico comparando hit rate entre algoritmos e padrões
         
         Args:
-            results: dicionário com resultados {algorithm: [user_results]}
+            results: StreamingAggregator ou dicionário {algorithm: [user_results]}
             filename: nome do arquivo de saída
         """
         # Prepara dados
-        data = defaultdict(lambda: defaultdict(list))
-        
-        for algorithm, user_results in results.items():
-            for result in user_results:
-                pattern = result['pattern']
-                hit_rate = result['hit_rate']
-                data[algorithm][pattern].append(hit_rate)
+        aggregator = self._aggregate(results)
+        summary = aggregator.summary()
         
-        # Calcula médias
-        algorithms = list(data.keys())
-        patterns = ['random', 'poisson', 'weighted']
+        algorithms = aggregator.algorithms()
+        patterns = aggregator.patterns()
         
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -62,7 +81,7 @@ class ReportGenerator:
         colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
         
         for i, algorithm in enumerate(algorithms):
-            means = [np.mean(data[algorithm][p]) if p in data[algorithm] else 0 
+            means = [summary[algorithm][p]['avg_hit_rate'] if p in summary[algorithm] else 0 
                     for p in patterns]
             offset = width * multiplier
             bars = ax.bar(x + offset, means, width, label=algorithm, 
@@ -85,7 +104,7 @@ class ReportGenerator:
         ax.set_xticklabels([p.capitalize() for p in patterns])
         ax.legend(loc='upper left', framealpha=0.9)
         ax.set_ylim(0, max([max(means) for means in 
-                           [[np.mean(data[a][p]) if p in data[a] else 0 
+                           [[summary[a][p]['avg_hit_rate'] if p in summary[a] else 0 
                              for p in patterns] for a in algorithms]]) * 1.2)
         
         plt.grid(axis='y', alpha=0.3)
@@ -100,20 +119,15 @@ class ReportGenerator:
         Gera gráfico comparando tempo médio de carregamento
         
         Args:
-            results: dicionário com resultados
+            results: StreamingAggregator ou dicionário com resultados
             filename: nome do arquivo de saída
         """
         # Prepara dados
-        data = defaultdict(lambda: defaultdict(list))
+        aggregator = self._aggregate(results)
+        summary = aggregator.summary()
         
-        for algorithm, user_results in results.items():
-            for result in user_results:
-                pattern = result['pattern']
-                avg_time = result['avg_load_time']
-                data[algorithm][pattern].append(avg_time)
-        
-        algorithms = list(data.keys())
-        patterns = ['random', 'poisson', 'weighted']
+        algorithms = aggregator.algorithms()
+        patterns = aggregator.patterns()
         
         fig, ax = plt.subplots(figsize=(12, 6))
         
@@ -124,7 +138,7 @@ class ReportGenerator:
         colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
         
         for i, algorithm in enumerate(algorithms):
-            means = [np.mean(data[algorithm][p]) * 1000 if p in data[algorithm] else 0 
+            means = [summary[algorithm][p]['avg_load_time'] * 1000 if p in summary[algorithm] else 0 
                     for p in patterns]  # Converte para ms
             offset = width * multiplier
             bars = ax.bar(x + offset, means, width, label=algorithm, 
@@ -159,29 +173,26 @@ class ReportGenerator:
         Gera gráfico mostrando distribuição de misses por texto
         
         Args:
-            results: dicionário com resultados
+            results: StreamingAggregator ou dicionário com resultados
             filename: nome do arquivo de saída
         """
+        aggregator = self._aggregate(results)
+        
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Distribuição de Cache Misses por Texto', 
                     fontsize=16, fontweight='bold', y=0.995)
         
-        algorithms = list(results.keys())[:4]  # Máximo 4 algoritmos
+        algorithms = aggregator.algorithms()[:4]  # Máximo 4 algoritmos
         
         for idx, algorithm in enumerate(algorithms):
             ax = axes[idx // 2, idx % 2]
             
-            # Agrega misses de todos os usuários
-            total_misses = defaultdict(int)
+            # Misses de todos os usuários (contadores por texto do agregador)
+            _, total_misses = aggregator.text_counts(algorithm)
             
-            for result in results[algorithm]:
-                for text_num, count in result['text_miss_count'].items():
-                    total_misses[text_num] += count
-            
-            if total_misses:
-                # Ordena por número do texto
-                texts = sorted(total_misses.keys())
-                misses = [total_misses[t] for t in texts]
+            if total_misses.any():
+                texts = np.flatnonzero(total_misses)
+                misses = total_misses[texts]
                 
                 # Destaca textos 30-40 (região "quente")
                 colors = ['#e74c3c' if 30 <= t <= 40 else '#3498db' for t in texts]
@@ -210,32 +221,33 @@ class ReportGenerator:
         Gera gráfico comparando performance em diferentes padrões
         
         Args:
-            results: dicionário com resultados
+            results: StreamingAggregator ou dicionário com resultados
             filename: nome do arquivo de saída
         """
-        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+        aggregator = self._aggregate(results)
+        summary = aggregator.summary()
+        
+        patterns = aggregator.patterns()
+        pattern_names = [self._pattern_name(p) for p in patterns]
+        
+        fig, axes = plt.subplots(1, len(patterns), figsize=(6 * len(patterns), 5),
+                                 squeeze=False)
         fig.suptitle('Performance por Padrão de Acesso', 
                     fontsize=16, fontweight='bold')
         
-        patterns = ['random', 'poisson', 'weighted']
-        pattern_names = ['Aleatório', 'Poisson (λ=30)', 'Ponderado (30-40: 43%)']
-        
         for idx, (pattern, pattern_name) in enumerate(zip(patterns, pattern_names)):
-            ax = axes[idx]
+            ax = axes[0, idx]
             
             # Coleta dados para este padrão
             algorithms = []
             hit_rates = []
             miss_rates = []
             
-            for algorithm, user_results in results.items():
-                pattern_results = [r for r in user_results if r['pattern'] == pattern]
-                if pattern_results:
+            for algorithm, stats in summary.items():
+                if pattern in stats:
                     algorithms.append(algorithm)
-                    avg_hit = np.mean([r['hit_rate'] for r in pattern_results])
-                    avg_miss = np.mean([r['miss_rate'] for r in pattern_results])
-                    hit_rates.append(avg_hit)
-                    miss_rates.append(avg_miss)
+                    hit_rates.append(stats[pattern]['avg_hit_rate'])
+                    miss_rates.append(stats[pattern]['avg_miss_rate'])
             
             # Gráfico de barras empilhadas
             x = np.arange(len(algorithms))
@@ -279,26 +291,33 @@ class ReportGenerator:
         Gera heatmap de performance (algoritmo x padrão)
         
         Args:
-            results: dicionário com resultados
+            results: StreamingAggregator ou dicionário com resultados
             filename: nome do arquivo de saída
         """
         # Prepara dados para heatmap
-        algorithms = list(results.keys())
-        patterns = ['random', 'poisson', 'weighted']
+        aggregator = self._aggregate(results)
+        summary = aggregator.summary()
+        
+        algorithms = aggregator.algorithms()
+        patterns = aggregator.patterns()
         
         heatmap_data = []
+        half_widths = []
         
         for algorithm in algorithms:
             row = []
+            row_half_widths = []
             for pattern in patterns:
-                pattern_results = [r for r in results[algorithm] 
-                                 if r['pattern'] == pattern]
-                if pattern_results:
-                    avg_hit_rate = np.mean([r['hit_rate'] for r in pattern_results])
-                    row.append(avg_hit_rate)
+                if pattern in summary[algorithm]:
+                    stats = summary[algorithm][pattern]
+                    low, high = stats['hit_rate_ci']
+                    row.append(stats['avg_hit_rate'])
+                    row_half_widths.append((high - low) / 2)
                 else:
                     row.append(0)
+                    row_half_widths.append(0)
             heatmap_data.append(row)
+            half_widths.append(row_half_widths)
         
         # Cria heatmap
         fig, ax = plt.subplots(figsize=(10, 6))
@@ -314,11 +333,11 @@ class ReportGenerator:
         # Adiciona valores nas células
         for i in range(len(algorithms)):
             for j in range(len(patterns)):
-                text = ax.text(j, i, f'{heatmap_data[i][j]:.1f}%',
+                text = ax.text(j, i, f'{heatmap_data[i][j]:.1f}%\n±{half_widths[i][j]:.1f}',
                              ha="center", va="center", color="black",
                              fontsize=12, fontweight='bold')
         
-        ax.set_title('Heatmap de Hit Rate: Algoritmo vs Padrão de Acesso',
+        ax.set_title('Heatmap de Hit Rate: Algoritmo vs Padrão de Acesso (± IC95%)',
                     fontsize=14, fontweight='bold', pad=20)
         
         # Colorbar
@@ -336,32 +355,31 @@ class ReportGenerator:
         Analisa os textos mais e menos acessados
         
         Args:
-            results: dicionário com resultados
+            results: StreamingAggregator ou dicionário com resultados
             filename: nome do arquivo de saída
         """
+        aggregator = self._aggregate(results)
+        
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Análise dos Textos Mais Solicitados', 
                     fontsize=16, fontweight='bold')
         
-        algorithms = list(results.keys())[:4]
+        algorithms = aggregator.algorithms()[:4]
         
         for idx, algorithm in enumerate(algorithms):
             ax = axes[idx // 2, idx % 2]
             
-            # Conta total de acessos por texto
-            total_accesses = defaultdict(int)
-            
-            for result in results[algorithm]:
-                for access in result['access_log']:
-                    total_accesses[access['text_num']] += 1
+            # Acessos por texto = hits + misses (contadores do agregador)
+            text_hits, text_misses = aggregator.text_counts(algorithm)
+            total_accesses = text_hits + text_misses
             
-            if total_accesses:
+            if total_accesses.any():
                 # Top 20 textos mais acessados
-                top_texts = sorted(total_accesses.items(), 
-                                  key=lambda x: x[1], reverse=True)[:20]
+                top = np.argsort(-total_accesses, kind='stable')[:20]
+                top = top[total_accesses[top] > 0]
                 
-                texts = [t[0] for t in top_texts]
-                counts = [t[1] for t in top_texts]
+                texts = top.tolist()
+                counts = total_accesses[top].tolist()
                 
                 # Destaca textos 30-40
                 colors = ['#e74c3c' if 30 <= t <= 40 else '#3498db' 
@@ -387,13 +405,94 @@ class ReportGenerator:
         
         print(f"✓ Gráfico salvo: {filename}")
     
-    def generate_full_report(self, results: dict):
+    def generate_miss_ratio_curves(self, curves: dict, cache_capacity: int = None,
+                                   filename: str = "miss_ratio_curves.png"):
+        """
+        Gera as curvas de miss ratio do LRU (miss ratio x capacidade)
+        
+        Args:
+            curves: dicionário {padrão: curva} de SimulationEngine.compute_miss_ratio_curves
+            cache_capacity: capacidade atual, marcada no gráfico
+            filename: nome do arquivo de saída
+        """
+        fig, ax = plt.subplots(figsize=(12, 6))
+        
+        colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6',
+                  '#1abc9c', '#34495e', '#e67e22']
+        
+        for i, (pattern, curve) in enumerate(curves.items()):
+            ax.plot(curve['capacities'], curve['miss_ratio'] * 100,
+                    label=self._pattern_name(pattern),
+                    color=colors[i % len(colors)], linewidth=2)
+        
+        if cache_capacity:
+            ax.axvline(cache_capacity, color='gray', linestyle='--', alpha=0.7,
+                       label=f'Capacidade atual ({cache_capacity})')
+        
+        ax.set_xlabel('Capacidade do Cache (textos)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Miss Ratio (%)', fontsize=12, fontweight='bold')
+        ax.set_title('Curvas de Miss Ratio do LRU por Padrão de Acesso',
+                    fontsize=14, fontweight='bold', pad=20)
+        ax.set_ylim(0, 105)
+        ax.legend(loc='upper right', framealpha=0.9)
+        
+        plt.grid(alpha=0.3)
+        plt.tight_layout()
+        plt.savefig(self.output_dir / filename, dpi=300, bbox_inches='tight')
+        plt.close()
+        
+        print(f"✓ Gráfico salvo: {filename}")
+    
+    def generate_capacity_sweep(self, sweep: dict, filename: str = "capacity_sweep.png"):
+        """
+        Gera as curvas de hit rate x capacidade de cada algoritmo, com os joelhos
+        
+        Args:
+            sweep: resultado de SimulationEngine.simulate_capacity_sweep
+            filename: nome do arquivo de saída
+        """
+        fig, ax = plt.subplots(figsize=(12, 6))
+        
+        colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
+        capacities = sweep['capacities']
+        
+        for i, (algorithm, curve) in enumerate(sweep['overall'].items()):
+            color = colors[i % len(colors)]
+            ax.plot(capacities, curve, label=algorithm, color=color,
+                    linewidth=2, marker='o', markersize=4)
+            
+            knee = sweep['knees'][algorithm]
+            if knee is not None:
+                ax.plot(knee, curve[np.searchsorted(capacities, knee)], marker='*',
+                        markersize=16, color=color, markeredgecolor='black')
+        
+        xlabel = 'Capacidade do Cache (textos)'
+        if sweep['mean_text_size']:
+            xlabel += f" - texto médio de {sweep['mean_text_size'] / 1024:.1f}KB"
+        ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+        ax.set_ylabel('Hit Rate médio (%)', fontsize=12, fontweight='bold')
+        ax.set_title('Varredura de Capacidade (★ = joelho da curva)',
+                    fontsize=14, fontweight='bold', pad=20)
+        ax.set_ylim(0, 105)
+        ax.legend(loc='lower right', framealpha=0.9)
+        
+        plt.grid(alpha=0.3)
+        plt.tight_layout()
+        plt.savefig(self.output_dir / filename, dpi=300, bbox_inches='tight')
+        plt.close()
+        
+        print(f"✓ Gráfico salvo: {filename}")
+    
+    def generate_full_report(self, results):
         """
         Gera relatório completo com todos os gráficos
         
         Args:
-            results: dicionário com resultados da simulação
+            results: StreamingAggregator da simulação (engine.aggregator), ou
+                     dicionário com resultados, agregado uma única vez aqui
         """
+        results = self._aggregate(results)
+
         print("\n" + "="*70)
         print("GERANDO RELATÓRIO COMPLETO")
         print("="*70)
@@ -426,36 +525,36 @@ if __name__ == "__main__":
     print("="*70)
     
     # Dados mockados para teste
+    def mock_counts(low, high, hot_low=None, hot_high=None):
+        """Contagens por texto (índice 0 sem uso), com região 30-40 opcional"""
+        counts = np.random.randint(low, high, size=101)
+        if hot_low is not None:
+            counts[30:41] = np.random.randint(hot_low, hot_high, size=11)
+        counts[0] = 0
+        return counts
+    
     mock_results = {
         'FIFOCache': [
             {
                 'user_id': 1, 'pattern': 'random', 'algorithm': 'FIFOCache',
                 'hits': 45, 'misses': 155, 'hit_rate': 22.5, 'miss_rate': 77.5,
                 'avg_load_time': 0.015, 'total_load_time': 3.0,
-                'text_miss_count': {i: np.random.randint(1, 5) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(0, 3) for i in range(1, 51)},
-                'access_log': [{'text_num': i % 100 + 1, 'was_hit': i % 4 == 0, 
-                              'load_time': 0.01} for i in range(200)]
+                'text_miss_count': mock_counts(1, 5),
+                'text_hit_count': mock_counts(0, 3)
             },
             {
                 'user_id': 1, 'pattern': 'poisson', 'algorithm': 'FIFOCache',
                 'hits': 38, 'misses': 162, 'hit_rate': 19.0, 'miss_rate': 81.0,
                 'avg_load_time': 0.016, 'total_load_time': 3.2,
-                'text_miss_count': {i: np.random.randint(1, 6) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(0, 2) for i in range(1, 51)},
-                'access_log': [{'text_num': i % 100 + 1, 'was_hit': i % 5 == 0,
-                              'load_time': 0.01} for i in range(200)]
+                'text_miss_count': mock_counts(1, 6),
+                'text_hit_count': mock_counts(0, 2)
             },
             {
                 'user_id': 1, 'pattern': 'weighted', 'algorithm': 'FIFOCache',
                 'hits': 52, 'misses': 148, 'hit_rate': 26.0, 'miss_rate': 74.0,
                 'avg_load_time': 0.014, 'total_load_time': 2.8,
-                'text_miss_count': {i: np.random.randint(2, 8) if 30 <= i <= 40 
-                                   else np.random.randint(0, 3) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(1, 4) for i in range(30, 41)},
-                'access_log': [{'text_num': 35 if i % 2 == 0 else i % 100 + 1,
-                              'was_hit': i % 4 == 0, 'load_time': 0.01} 
-                              for i in range(200)]
+                'text_miss_count': mock_counts(0, 3, 2, 8),
+                'text_hit_count': mock_counts(0, 1, 1, 4)
             }
         ],
         'LRUCache': [
@@ -463,30 +562,22 @@ if __name__ == "__main__":
                 'user_id': 1, 'pattern': 'random', 'algorithm': 'LRUCache',
                 'hits': 58, 'misses': 142, 'hit_rate': 29.0, 'miss_rate': 71.0,
                 'avg_load_time': 0.013, 'total_load_time': 2.6,
-                'text_miss_count': {i: np.random.randint(1, 4) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(0, 4) for i in range(1, 51)},
-                'access_log': [{'text_num': i % 100 + 1, 'was_hit': i % 3 == 0,
-                              'load_time': 0.01} for i in range(200)]
+                'text_miss_count': mock_counts(1, 4),
+                'text_hit_count': mock_counts(0, 4)
             },
             {
                 'user_id': 1, 'pattern': 'poisson', 'algorithm': 'LRUCache',
                 'hits': 64, 'misses': 136, 'hit_rate': 32.0, 'miss_rate': 68.0,
                 'avg_load_time': 0.012, 'total_load_time': 2.4,
-                'text_miss_count': {i: np.random.randint(1, 5) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(0, 3) for i in range(1, 51)},
-                'access_log': [{'text_num': i % 100 + 1, 'was_hit': i % 3 == 0,
-                              'load_time': 0.01} for i in range(200)]
+                'text_miss_count': mock_counts(1, 5),
+                'text_hit_count': mock_counts(0, 3)
             },
             {
                 'user_id': 1, 'pattern': 'weighted', 'algorithm': 'LRUCache',
                 'hits': 78, 'misses': 122, 'hit_rate': 39.0, 'miss_rate': 61.0,
                 'avg_load_time': 0.011, 'total_load_time': 2.2,
-                'text_miss_count': {i: np.random.randint(1, 6) if 30 <= i <= 40
-                                   else np.random.randint(0, 2) for i in range(1, 101)},
-                'text_hit_count': {i: np.random.randint(2, 6) for i in range(30, 41)},
-                'access_log': [{'text_num': 35 if i % 2 == 0 else i % 100 + 1,
-                              'was_hit': i % 3 == 0, 'load_time': 0.01}
-                              for i in range(200)]
+                'text_miss_count': mock_counts(0, 2, 1, 6),
+                'text_hit_count': mock_counts(0, 1, 2, 6)
             }
         ]
     }
@@ -1,33 +1,114 @@
 """
 Gerador de requisições para simulação de usuários
-Implementa três padrões de acesso: aleatório, Poisson e ponderado
+Implementa os padrões de acesso: aleatório, Poisson, ponderado,
+Zipf embaralhado, hotspot móvel, fases, varreduras e laços
 
 Aluno D - Módulo de Simulação
 """
 
-import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict
+import inspect
+
 import numpy as np
 
 
+# Padrões usados por padrão na simulação
+DEFAULT_PATTERNS = ['random', 'poisson', 'weighted']
+
+# Todos os padrões aceitos por generate_user_requests
+PATTERNS = DEFAULT_PATTERNS + ['zipf', 'drifting', 'phases', 'scan', 'loop']
+
+# Processos de chegada aceitos por generate_arrivals
+ARRIVAL_PROCESSES = ['poisson', 'mmpp', 'diurnal']
+
+# Nomes exibidos nos relatórios; pattern_display_name acrescenta os
+# parâmetros usados (ex.: o expoente do Zipf)
+PATTERN_NAMES = {
+    'random': 'Aleatório',
+    'poisson': 'Poisson',
+    'weighted': 'Ponderado',
+    'zipf': 'Zipf',
+    'drifting': 'Hotspot Móvel',
+    'phases': 'Fases',
+    'scan': 'Hot set + Varreduras',
+    'loop': 'Laço Cíclico'
+}
+
+
 class RequestGenerator:
     """
     Classe para gerar requisições de textos seguindo diferentes padrões
     """
     
-    def __init__(self, total_texts: int = 100, seed: int = None):
+    def __init__(self, total_texts: int = 100, seed=None):
         """
         Inicializa o gerador de requisições
         
+        Cada gerador tem seu próprio numpy.random.Generator, então dois
+        geradores não interferem um no outro e podem rodar em paralelo.
+        
         Args:
             total_texts: número total de textos disponíveis (1-100)
-            seed: semente para reprodutibilidade (opcional)
+            seed: semente (int) ou np.random.SeedSequence (opcional)
         """
         self.total_texts = total_texts
-        if seed is not None:
-            random.seed(seed)
-            np.random.seed(seed)
+        
+        # Metadados da última sequência gerada (ex.: hot set e fim das varreduras)
+        self.last_trace_info = {}
+        
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+    
+    def for_user(self, user_id: int) -> 'RequestGenerator':
+        """
+        Cria o gerador independente de um usuário
+        
+        O fluxo do usuário é derivado apenas de (semente, user_id), então é
+        o mesmo qualquer que seja a ordem ou o processo em que é criado.
+        
+        Args:
+            user_id: identificador do usuário
+            
+        Returns:
+            RequestGenerator: gerador com o fluxo aleatório do usuário
+        """
+        child = np.random.SeedSequence(
+            self.seed_sequence.entropy,
+            spawn_key=self.seed_sequence.spawn_key + (user_id,))
+        return RequestGenerator(self.total_texts, seed=child)
     
-    def generate_random(self, num_requests: int) -> list:
+    def generate_users(self, user_ids: list, num_requests: int = 200,
+                       pattern: str = 'random', max_workers: int = None,
+                       use_processes: bool = False, **params) -> list:
+        """
+        Gera as sequências de vários usuários em paralelo
+        
+        O resultado é idêntico, bit a bit, a chamar
+        for_user(u).generate_user_requests(...) para cada usuário em série.
+        
+        Args:
+            user_ids: identificadores dos usuários
+            num_requests: número de requisições por usuário
+            pattern: padrão de acesso
+            max_workers: número de workers (padrão do executor se None)
+            use_processes: usa processos em vez de threads
+            **params: parâmetros repassados ao gerador do padrão
+            
+        Returns:
+            list: um array int32 por usuário, na ordem de user_ids
+        """
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        tasks = [(self.for_user(user_id), num_requests, pattern, params)
+                 for user_id in user_ids]
+        
+        with executor_class(max_workers=max_workers) as executor:
+            return list(executor.map(_generate_task, tasks))
+    
+    def generate_random(self, num_requests: int) -> np.ndarray:
         """
         Gera requisições completamente aleatórias (distribuição uniforme)
         
@@ -35,11 +116,11 @@ class RequestGenerator:
             num_requests: número de requisições a gerar
             
         Returns:
-            list: lista de números de textos (1 a total_texts)
+            np.ndarray: array int32 de números de textos (1 a total_texts)
         """
-        return [random.randint(1, self.total_texts) for _ in range(num_requests)]
+        return self.rng.integers(1, self.total_texts + 1, size=num_requests, dtype=np.int32)
     
-    def generate_poisson(self, num_requests: int, lambda_param: float = 30.0) -> list:
+    def generate_poisson(self, num_requests: int, lambda_param: float = 30.0) -> np.ndarray:
         """
         Gera requisições com distribuição de Poisson
         
@@ -51,20 +132,15 @@ class RequestGenerator:
             lambda_param: parâmetro lambda (média) da distribuição
             
         Returns:
-            list: lista de números de textos
-        """
-        requests = []
-        for _ in range(num_requests):
-            # Gera número usando Poisson e garante que está no range válido
-            value = np.random.poisson(lambda_param)
-            # Mantém no intervalo [1, total_texts]
-            value = max(1, min(value, self.total_texts))
-            requests.append(value)
-        return requests
+            np.ndarray: array int32 de números de textos
+        """
+        # Gera todos os valores de uma vez e os mantém no intervalo [1, total_texts]
+        values = self.rng.poisson(lambda_param, size=num_requests)
+        return np.clip(values, 1, self.total_texts).astype(np.int32)
     
     def generate_weighted(self, num_requests: int, 
                          hot_range: tuple = (30, 40), 
-                         hot_probability: float = 0.43) -> list:
+                         hot_probability: float = 0.43) -> np.ndarray:
         """
         Gera requisições com ponderação (alguns textos são mais prováveis)
         
@@ -77,73 +153,419 @@ class RequestGenerator:
             hot_probability: probabilidade de acessar textos quentes (0-1)
             
         Returns:
-            list: lista de números de textos
+            np.ndarray: array int32 de números de textos
         """
-        requests = []
         hot_start, hot_end = hot_range
-        hot_texts = list(range(hot_start, hot_end + 1))
-        cold_texts = [i for i in range(1, self.total_texts + 1) 
-                     if i not in hot_texts]
-        
-        for _ in range(num_requests):
-            if random.random() < hot_probability:
-                # Acessa um texto "quente" (no intervalo especificado)
-                requests.append(random.choice(hot_texts))
-            else:
-                # Acessa um texto "frio" (fora do intervalo)
-                requests.append(random.choice(cold_texts))
+        hot_texts = np.arange(hot_start, hot_end + 1, dtype=np.int32)
+        cold_texts = np.setdiff1d(np.arange(1, self.total_texts + 1, dtype=np.int32),
+                                  hot_texts, assume_unique=True)
+        
+        # Decide de uma vez quais requisições vão para a região quente
+        is_hot = self.rng.random(num_requests) < hot_probability
+        num_hot = int(is_hot.sum())
+        
+        requests = np.empty(num_requests, dtype=np.int32)
+        # Textos "quentes" (no intervalo especificado)
+        requests[is_hot] = hot_texts[self.rng.integers(0, len(hot_texts), size=num_hot)]
+        # Textos "frios" (fora do intervalo)
+        requests[~is_hot] = cold_texts[self.rng.integers(0, len(cold_texts),
+                                                         size=num_requests - num_hot)]
+        
+        return requests
+    
+    def _zipf_ranks(self, num_requests: int, exponent: float) -> np.ndarray:
+        """
+        Sorteia posições de popularidade (0 = mais popular) com lei de Zipf
+        
+        Usa a inversa da CDF: P(posição k) é proporcional a 1 / (k+1)^exponent.
+        
+        Args:
+            num_requests: número de posições a sortear
+            exponent: expoente s da distribuição (0 = uniforme)
+            
+        Returns:
+            np.ndarray: array int32 de posições em [0, total_texts)
+        """
+        weights = np.arange(1, self.total_texts + 1, dtype=np.float64) ** -exponent
+        cdf = np.cumsum(weights)
+        cdf /= cdf[-1]
+        
+        ranks = np.searchsorted(cdf, self.rng.random(num_requests), side='right')
+        # Protege contra arredondamento no último elemento da CDF
+        return np.minimum(ranks, self.total_texts - 1).astype(np.int32)
+    
+    def generate_zipf(self, num_requests: int, exponent: float = 1.0,
+                      scrambled: bool = True) -> np.ndarray:
+        """
+        Gera requisições com popularidade seguindo a lei de Zipf
+        
+        No modo embaralhado, as posições de popularidade são mapeadas para
+        textos por uma permutação aleatória, então os textos populares ficam
+        espalhados pelo corpus em vez de serem sempre 1, 2, 3...
+        
+        Args:
+            num_requests: número de requisições a gerar
+            exponent: expoente s (quanto maior, mais concentrado)
+            scrambled: se True, embaralha a associação posição → texto
+            
+        Returns:
+            np.ndarray: array int32 de números de textos
+        """
+        ranks = self._zipf_ranks(num_requests, exponent)
+        
+        if scrambled:
+            permutation = self.rng.permutation(self.total_texts).astype(np.int32) + 1
+            return permutation[ranks]
+        return ranks + 1
+    
+    def generate_drifting(self, num_requests: int, hot_size: int = 10,
+                          drift_speed: float = 0.05,
+                          hot_probability: float = 0.8) -> np.ndarray:
+        """
+        Gera requisições com uma região quente que se desloca ao longo do tempo
+        
+        A região quente tem hot_size textos consecutivos e começa em um texto
+        aleatório; a cada requisição ela anda drift_speed textos (dando a volta
+        no fim do corpus).
+        
+        Args:
+            num_requests: número de requisições a gerar
+            hot_size: número de textos da região quente
+            drift_speed: deslocamento da região, em textos por requisição
+            hot_probability: probabilidade de acessar a região quente (0-1)
+            
+        Returns:
+            np.ndarray: array int32 de números de textos
+        """
+        start = int(self.rng.integers(0, self.total_texts))
+        hot_start = (start + np.floor(drift_speed * np.arange(num_requests))).astype(np.int64)
+        
+        hot_requests = (hot_start + self.rng.integers(0, hot_size, size=num_requests)) \
+            % self.total_texts + 1
+        cold_requests = self.rng.integers(1, self.total_texts + 1, size=num_requests)
+        
+        is_hot = self.rng.random(num_requests) < hot_probability
+        return np.where(is_hot, hot_requests, cold_requests).astype(np.int32)
+    
+    def generate_phases(self, num_requests: int, num_phases: int = 4,
+                        exponent: float = 1.0) -> np.ndarray:
+        """
+        Gera requisições em fases com conjuntos populares diferentes
+        
+        Cada fase segue uma distribuição de Zipf com sua própria permutação,
+        então o conjunto de textos populares muda abruptamente na troca de fase.
+        
+        Args:
+            num_requests: número de requisições a gerar
+            num_phases: número de fases (de mesmo tamanho)
+            exponent: expoente s da distribuição de Zipf de cada fase
+            
+        Returns:
+            np.ndarray: array int32 de números de textos
+        """
+        ranks = self._zipf_ranks(num_requests, exponent)
+        phase = (np.arange(num_requests, dtype=np.int64) * num_phases) // max(num_requests, 1)
+        
+        # Uma permutação posição → texto por fase
+        permutations = np.argsort(self.rng.random((num_phases, self.total_texts)), axis=1)
+        return (permutations[phase, ranks] + 1).astype(np.int32)
+    
+    def generate_scan(self, num_requests: int, hot_size: int = 10,
+                      scan_length: int = 50, scan_every: int = None) -> np.ndarray:
+        """
+        Gera acessos a um hot set intercalados com varreduras sequenciais
+        
+        A sequência é formada por períodos de scan_every acessos uniformes ao
+        hot set seguidos de uma varredura de scan_length textos frios
+        consecutivos (a partir de um texto frio aleatório, dando a volta no
+        fim do corpus). As varreduras nunca tocam o hot set, então o que
+        sobra dele depois de uma varredura depende só da política.
+        É o padrão típico de uma exportação em lote que lê tudo uma vez.
+        
+        O hot set e o índice de início/fim de cada varredura ficam em
+        last_trace_info, para medir quanto do hot set sobrevive às varreduras.
+        
+        Args:
+            num_requests: número de requisições a gerar
+            hot_size: número de textos do hot set (menor que total_texts)
+            scan_length: número de textos lidos em cada varredura
+            scan_every: acessos ao hot set entre duas varreduras; None divide
+                        a sequência em dois períodos, para que ao menos uma
+                        varredura completa caiba nela
+            
+        Returns:
+            np.ndarray: array int32 de números de textos
+            
+        Raises:
+            ValueError: se hot_size não deixar textos frios para as varreduras
+        """
+        if not 1 <= hot_size < self.total_texts:
+            raise ValueError(f"hot_size deve estar entre 1 e {self.total_texts - 1} "
+                             f"(recebido: {hot_size}); as varreduras usam os demais textos")
+        if scan_every is None:
+            scan_every = max(num_requests // 2 - scan_length, 1)
+        
+        hot_set = (self.rng.choice(self.total_texts, size=hot_size, replace=False) + 1) \
+            .astype(np.int32)
+        cold_texts = np.setdiff1d(np.arange(1, self.total_texts + 1, dtype=np.int32), hot_set)
+        
+        period = scan_every + scan_length
+        position = np.arange(num_requests, dtype=np.int64)
+        offset = position % period
+        is_scan = offset >= scan_every
+        
+        num_periods = -(-num_requests // period)
+        scan_starts = self.rng.integers(0, len(cold_texts), size=num_periods)
+        scan_requests = cold_texts[(scan_starts[position // period] + offset - scan_every)
+                                   % len(cold_texts)]
+        hot_requests = hot_set[self.rng.integers(0, hot_size, size=num_requests)]
+        
+        requests = np.where(is_scan, scan_requests, hot_requests).astype(np.int32)
+        
+        # Índices (0-based) da primeira e da última requisição de cada varredura completa
+        first = np.arange(scan_every, num_requests, period)
+        last = first + scan_length - 1
+        complete = last < num_requests
+        self.last_trace_info = {
+            'hot_set': hot_set,
+            'scan_starts': first[complete],
+            'scan_ends': last[complete]
+        }
         
         return requests
     
+    def generate_loop(self, num_requests: int, loop_size: int = 12) -> np.ndarray:
+        """
+        Gera um laço cíclico sobre loop_size textos consecutivos
+        
+        Com um laço um pouco maior que a capacidade, LRU e FIFO sempre removem
+        o texto que será pedido logo em seguida (hit rate zero).
+        
+        Args:
+            num_requests: número de requisições a gerar
+            loop_size: número de textos do laço
+            
+        Returns:
+            np.ndarray: array int32 de números de textos
+        """
+        start = int(self.rng.integers(0, self.total_texts))
+        position = np.arange(num_requests, dtype=np.int64) % loop_size
+        return ((start + position) % self.total_texts + 1).astype(np.int32)
+    
     def generate_user_requests(self, num_requests: int = 200, 
-                              pattern: str = 'random') -> list:
+                              pattern: str = 'random', **params) -> np.ndarray:
         """
         Gera requisições para um único usuário seguindo um padrão específico
         
         Args:
             num_requests: número de requisições (padrão: 200)
-            pattern: tipo de padrão ('random', 'poisson', 'weighted')
+            pattern: tipo de padrão ('random', 'poisson', 'weighted',
+                     'zipf', 'drifting', 'phases', 'scan', 'loop')
+            **params: parâmetros repassados ao gerador do padrão
+                      (ex.: exponent=1.2 para 'zipf', drift_speed=0.5 para 'drifting')
             
         Returns:
-            list: lista de números de textos
+            np.ndarray: array int32 de números de textos
             
         Raises:
             ValueError: se o padrão for inválido
         """
+        self.last_trace_info = {}
+        
         if pattern == 'random':
-            return self.generate_random(num_requests)
+            return self.generate_random(num_requests, **params)
         elif pattern == 'poisson':
-            return self.generate_poisson(num_requests)
+            return self.generate_poisson(num_requests, **params)
         elif pattern == 'weighted':
-            return self.generate_weighted(num_requests)
+            return self.generate_weighted(num_requests, **params)
+        elif pattern == 'zipf':
+            return self.generate_zipf(num_requests, **params)
+        elif pattern == 'drifting':
+            return self.generate_drifting(num_requests, **params)
+        elif pattern == 'phases':
+            return self.generate_phases(num_requests, **params)
+        elif pattern == 'scan':
+            return self.generate_scan(num_requests, **params)
+        elif pattern == 'loop':
+            return self.generate_loop(num_requests, **params)
         else:
             raise ValueError(f"Padrão inválido: {pattern}. "
-                           f"Use 'random', 'poisson' ou 'weighted'")
+                           f"Use {', '.join(PATTERNS)}")
     
-    def analyze_distribution(self, requests: list) -> dict:
+    def generate_arrivals(self, num_requests: int, process: str = 'poisson',
+                          rate: float = 100.0, burst_factor: float = 10.0,
+                          mean_calm: float = 5.0, mean_burst: float = 0.5,
+                          period: float = 86400.0, amplitude: float = 0.8) -> np.ndarray:
+        """
+        Gera os instantes de chegada (em segundos) de cada requisição
+        
+        Processos disponíveis:
+        - 'poisson': chegadas independentes com taxa constante `rate`
+        - 'mmpp': Poisson modulado por Markov com dois estados; alterna entre
+          calmaria (taxa `rate`, duração média `mean_calm`) e rajada
+          (taxa `rate * burst_factor`, duração média `mean_burst`)
+        - 'diurnal': Poisson não homogêneo com taxa
+          rate * (1 + amplitude * sin(2π t / period)), gerado por thinning
+        
+        Args:
+            num_requests: número de instantes a gerar
+            process: processo de chegada ('poisson', 'mmpp', 'diurnal')
+            rate: taxa base de chegada em requisições/s (taxa da calmaria no mmpp)
+            burst_factor: multiplicador da taxa nas rajadas (mmpp)
+            mean_calm: duração média da calmaria em segundos (mmpp)
+            mean_burst: duração média da rajada em segundos (mmpp)
+            period: período da curva diária em segundos (diurnal)
+            amplitude: amplitude relativa da curva, entre 0 e 1 (diurnal)
+            
+        Returns:
+            np.ndarray: array float64 crescente de instantes
+            
+        Raises:
+            ValueError: se o processo for inválido
+        """
+        if process == 'poisson':
+            return np.cumsum(self.rng.exponential(1.0 / rate, size=num_requests))
+        
+        if process == 'mmpp':
+            return self._mmpp_arrivals(num_requests, rate, burst_factor, mean_calm, mean_burst)
+        
+        if process == 'diurnal':
+            return self._diurnal_arrivals(num_requests, rate, period, amplitude)
+        
+        raise ValueError(f"Processo de chegada inválido: {process}. "
+                         f"Use {', '.join(ARRIVAL_PROCESSES)}")
+    
+    def _mmpp_arrivals(self, num_requests: int, rate: float, burst_factor: float,
+                       mean_calm: float, mean_burst: float) -> np.ndarray:
+        """
+        Gera chegadas de um MMPP de dois estados, em lotes de segmentos
+        
+        Dado o número de chegadas em um segmento de taxa constante, os
+        instantes são uniformes no segmento; assim cada lote de segmentos é
+        gerado com poucas operações vetorizadas.
+        """
+        chunks = []
+        generated = 0
+        t0 = 0.0
+        
+        # Número de pares (calmaria, rajada) esperado para cobrir as requisições
+        mean_per_pair = rate * mean_calm + rate * burst_factor * mean_burst
+        pairs = max(16, int(num_requests / mean_per_pair * 1.2) + 1)
+        
+        while generated < num_requests:
+            durations = np.empty(2 * pairs)
+            durations[0::2] = self.rng.exponential(mean_calm, size=pairs)
+            durations[1::2] = self.rng.exponential(mean_burst, size=pairs)
+            rates = np.tile([rate, rate * burst_factor], pairs)
+            
+            starts = t0 + np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+            counts = self.rng.poisson(rates * durations)
+            
+            segment = np.repeat(np.arange(len(durations)), counts)
+            times = starts[segment] + self.rng.random(len(segment)) * durations[segment]
+            # Segmentos não se sobrepõem, então ordenar tudo ordena dentro de cada um
+            times.sort()
+            
+            chunks.append(times)
+            generated += len(times)
+            t0 = starts[-1] + durations[-1]
+        
+        return np.concatenate(chunks)[:num_requests]
+    
+    def _diurnal_arrivals(self, num_requests: int, rate: float,
+                          period: float, amplitude: float) -> np.ndarray:
+        """
+        Gera chegadas com taxa senoidal por thinning (Lewis-Shedler)
+        
+        Candidatos são gerados com a taxa máxima e aceitos com probabilidade
+        taxa(t) / taxa máxima, em lotes vetorizados.
+        """
+        max_rate = rate * (1 + amplitude)
+        chunks = []
+        generated = 0
+        t0 = 0.0
+        
+        while generated < num_requests:
+            batch = int((num_requests - generated) * (1 + amplitude) * 1.1) + 16
+            candidates = t0 + np.cumsum(self.rng.exponential(1.0 / max_rate, size=batch))
+            current_rate = rate * (1 + amplitude * np.sin(2 * np.pi * candidates / period))
+            accepted = candidates[self.rng.random(batch) * max_rate < current_rate]
+            
+            chunks.append(accepted)
+            generated += len(accepted)
+            t0 = candidates[-1]
+        
+        return np.concatenate(chunks)[:num_requests]
+    
+    def analyze_distribution(self, requests) -> dict:
         """
         Analisa a distribuição de uma lista de requisições
         
         Args:
-            requests: lista de números de textos
+            requests: lista ou array de números de textos
             
         Returns:
             dict: estatísticas da distribuição
         """
-        from collections import Counter
+        counts = np.bincount(np.asarray(requests, dtype=np.int64))
+        texts = np.flatnonzero(counts)
+        counts = counts[texts]
         
-        counter = Counter(requests)
+        # Ordena por número de acessos (estável, empates pelo número do texto)
+        top = np.argsort(-counts, kind='stable')[:10]
         
         return {
             'total_requests': len(requests),
-            'unique_texts': len(counter),
-            'most_common': counter.most_common(10),
-            'min_accesses': min(counter.values()) if counter else 0,
-            'max_accesses': max(counter.values()) if counter else 0,
-            'avg_accesses': sum(counter.values()) / len(counter) if counter else 0
+            'unique_texts': len(texts),
+            'most_common': [(int(texts[i]), int(counts[i])) for i in top],
+            'min_accesses': int(counts.min()) if len(counts) else 0,
+            'max_accesses': int(counts.max()) if len(counts) else 0,
+            'avg_accesses': float(counts.mean()) if len(counts) else 0
         }
 
 
+def _generate_task(task: tuple) -> np.ndarray:
+    """Gera a sequência de um usuário (função de módulo para poder ir a outro processo)"""
+    generator, num_requests, pattern, params = task
+    return generator.generate_user_requests(num_requests, pattern, **params)
+
+
+def pattern_display_name(pattern: str, params: Dict = None) -> str:
+    """
+    Nome de um padrão para os relatórios, com os parâmetros efetivos
+
+    Parâmetros não informados assumem os valores padrão do método
+    generate_<padrão> do RequestGenerator.
+
+    Args:
+        pattern: padrão de acesso
+        params: parâmetros do padrão (ex.: {'exponent': 1.2} para 'zipf')
+
+    Returns:
+        str: nome exibido, ex.: 'Zipf (s=1.2)'
+    """
+    name = PATTERN_NAMES.get(pattern, pattern.capitalize())
+    method = getattr(RequestGenerator, f"generate_{pattern}", None)
+    if method is None:
+        return name
+
+    values = {key: parameter.default
+              for key, parameter in inspect.signature(method).parameters.items()
+              if parameter.default is not inspect.Parameter.empty}
+    values.update(params or {})
+
+    if pattern == 'zipf':
+        return f"{name} (s={float(values['exponent'])})"
+    if pattern == 'poisson':
+        return f"{name} (λ={values['lambda_param']:g})"
+    if pattern == 'weighted':
+        low, high = values['hot_range']
+        return f"{name} ({low}-{high}: {values['hot_probability'] * 100:g}%)"
+    if pattern == 'phases':
+        return f"{name} ({values['num_phases']})"
+    return name
+
+
 # Teste e demonstração
 if __name__ == "__main__":
     print("="*70)
@@ -152,7 +574,7 @@ if __name__ == "__main__":
     
     generator = RequestGenerator(total_texts=100, seed=42)
     
-    patterns = ['random', 'poisson', 'weighted']
+    patterns = PATTERNS
     num_requests = 200
     
     for pattern in patterns:
@@ -176,8 +598,7 @@ if __name__ == "__main__":
         
         if pattern == 'weighted':
             # Verifica se a ponderação funcionou (textos 30-40 devem ter ~43%)
-            hot_range = range(30, 41)
-            hot_accesses = sum(1 for r in requests if r in hot_range)
+            hot_accesses = int(((requests >= 30) & (requests <= 40)).sum())
             hot_percentage = (hot_accesses / len(requests)) * 100
             print(f"\n📊 Verificação da ponderação:")
             print(f"  Textos 30-40: {hot_accesses} acessos ({hot_percentage:.1f}%)")
@@ -0,0 +1,298 @@
+"""
+Armazenamento persistente dos resultados de simulação (SQLite)
+Cada célula (algoritmo, padrão, usuário, configuração) é guardada pelo
+hash da sua configuração; relatórios podem ser refeitos sem simular de novo
+
+Aluno D - Módulo de Simulação
+"""
+
+from typing import Dict, List, Optional
+import argparse
+import hashlib
+import io
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def config_hash(config: Dict) -> str:
+    """
+    Hash estável de uma configuração (JSON com chaves ordenadas)
+
+    Args:
+        config: configuração serializável em JSON
+
+    Returns:
+        str: hash SHA-256 em hexadecimal
+    """
+    encoded = json.dumps(config, sort_keys=True, default=_json_default)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _json_default(value):
+    """Converte escalares e arrays NumPy para JSON"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def _split_result(result: Dict):
+    """Separa um resultado em métricas escalares (JSON) e arrays (npz)"""
+    scalars = {}
+    arrays = {}
+    for key, value in result.items():
+        if isinstance(value, np.ndarray):
+            arrays[key] = value
+        elif isinstance(value, dict) and value and all(
+                isinstance(column, np.ndarray) for column in value.values()):
+            for column, array in value.items():
+                arrays[f"{key}/{column}"] = array
+        else:
+            scalars[key] = value
+    return scalars, arrays
+
+
+def _join_result(scalars: Dict, arrays: Dict) -> Dict:
+    """Reconstrói um resultado a partir das métricas e dos arrays"""
+    result = dict(scalars)
+    for name, array in arrays.items():
+        if '/' in name:
+            key, column = name.split('/', 1)
+            result.setdefault(key, {})[column] = array
+        else:
+            result[name] = array
+    return result
+
+
+class ResultsStore:
+    """
+    Banco SQLite com os resultados das células e das execuções
+
+    Tabelas:
+    - cells: uma linha por célula, chaveada pelo hash da configuração da
+      célula; métricas em JSON e arrays (log de acessos, contagens por
+      texto) em um blob .npz compactado
+    - runs: uma linha por execução, com a configuração, a lista ordenada
+      das células e a comparação dos líderes da repetição adaptativa, para
+      refazer resumos e gráficos sem simular
+
+    Exemplo:
+        store = ResultsStore("results/resultados.db")
+        engine.store = store                  # células já salvas não são simuladas
+        results = engine.simulate_all_algorithms(algorithms, cache_capacity=10)
+        cell_configs = [engine.cell_config(algorithm, r['pattern'], r['user_id'], 10)
+                        for algorithm, cells in results.items() for r in cells]
+        run_id = store.save_run(run_config, cell_configs, engine.confidence)
+        results = store.load_run(run_id)      # mesmo formato de engine.results
+    """
+
+    def __init__(self, path="results/resultados.db"):
+        """
+        Args:
+            path: caminho do arquivo SQLite (criado se não existir)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS cells (
+                cell_hash TEXT PRIMARY KEY,
+                algorithm TEXT NOT NULL,
+                pattern TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                config TEXT NOT NULL,
+                metrics TEXT NOT NULL,
+                arrays BLOB NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                run_hash TEXT PRIMARY KEY,
+                config TEXT NOT NULL,
+                cells TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                confidence TEXT
+            );
+        """)
+
+        # Bancos criados antes da coluna de confiança ganham a coluna vazia
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(runs)")]
+        if 'confidence' not in columns:
+            with self.connection:
+                self.connection.execute("ALTER TABLE runs ADD COLUMN confidence TEXT")
+
+    def get(self, cell_config: Dict) -> Optional[Dict]:
+        """
+        Busca o resultado de uma célula
+
+        Args:
+            cell_config: configuração da célula (SimulationEngine.cell_config)
+
+        Returns:
+            dict: resultado no formato de simulate_user, ou None se não existir
+        """
+        return self._load_cell(config_hash(cell_config))
+
+    def __contains__(self, cell_config: Dict) -> bool:
+        row = self.connection.execute("SELECT 1 FROM cells WHERE cell_hash = ?",
+                                      (config_hash(cell_config),)).fetchone()
+        return row is not None
+
+    def put(self, cell_config: Dict, result: Dict):
+        """
+        Salva (ou substitui) o resultado de uma célula
+
+        Args:
+            cell_config: configuração da célula
+            result: resultado no formato de simulate_user
+        """
+        scalars, arrays = _split_result(result)
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cells VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (config_hash(cell_config), cell_config['algorithm'], cell_config['pattern'],
+                 cell_config['user_id'], json.dumps(cell_config, sort_keys=True),
+                 json.dumps(scalars, default=_json_default), buffer.getvalue(), time.time()))
+
+    def _load_cell(self, cell_hash: str) -> Optional[Dict]:
+        """Lê uma célula pelo hash"""
+        row = self.connection.execute(
+            "SELECT metrics, arrays FROM cells WHERE cell_hash = ?", (cell_hash,)).fetchone()
+        if row is None:
+            return None
+
+        with np.load(io.BytesIO(row[1])) as data:
+            arrays = {name: data[name] for name in data.files}
+        return _join_result(json.loads(row[0]), arrays)
+
+    def save_run(self, run_config: Dict, cell_configs: List[Dict],
+                 confidence: Dict = None) -> str:
+        """
+        Registra uma execução e a ordem das suas células
+
+        Args:
+            run_config: configuração da execução
+            cell_configs: configurações das células, na ordem dos resultados
+            confidence: comparação dos líderes por padrão (engine.confidence,
+                        preenchida por simulate_until_confident)
+
+        Returns:
+            str: identificador (hash) da execução
+        """
+        run_hash = config_hash(run_config)
+        cells = [[cell['algorithm'], config_hash(cell)] for cell in cell_configs]
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO runs (run_hash, config, cells, created_at, confidence) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (run_hash, json.dumps(run_config, sort_keys=True, default=_json_default),
+                 json.dumps(cells), time.time(),
+                 json.dumps(confidence or {}, default=_json_default)))
+        return run_hash
+
+    def load_run(self, run_hash: str = None) -> Dict[str, List[Dict]]:
+        """
+        Lê os resultados de uma execução no formato de SimulationEngine.results
+
+        Args:
+            run_hash: identificador da execução, ou um prefixo dele
+                      (padrão: a execução mais recente)
+
+        Returns:
+            dict: resultados organizados por algoritmo
+
+        Raises:
+            KeyError: se a execução não existir ou alguma célula faltar
+        """
+        if run_hash is None:
+            row = self.connection.execute(
+                "SELECT run_hash, cells FROM runs ORDER BY created_at DESC LIMIT 1").fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT run_hash, cells FROM runs WHERE run_hash LIKE ? "
+                "ORDER BY created_at DESC LIMIT 1", (run_hash + '%',)).fetchone()
+        if row is None:
+            raise KeyError(f"Execução não encontrada: {run_hash or '(nenhuma salva)'}")
+
+        results = {}
+        for algorithm, cell_hash in json.loads(row[1]):
+            result = self._load_cell(cell_hash)
+            if result is None:
+                raise KeyError(f"Célula {cell_hash[:12]} da execução {row[0][:12]} não está salva")
+            results.setdefault(algorithm, []).append(result)
+        return results
+
+    def list_runs(self) -> List[Dict]:
+        """
+        Lista as execuções salvas, da mais recente para a mais antiga
+
+        Returns:
+            list: dicts com 'run_hash', 'config', 'num_cells', 'created_at' e
+                  'confidence' (comparação dos líderes por padrão; vazia se a
+                  execução não usou a repetição adaptativa)
+        """
+        rows = self.connection.execute(
+            "SELECT run_hash, config, cells, created_at, confidence FROM runs "
+            "ORDER BY created_at DESC")
+        return [{'run_hash': run_hash, 'config': json.loads(config),
+                 'num_cells': len(json.loads(cells)), 'created_at': created_at,
+                 'confidence': json.loads(confidence) if confidence else {}}
+                for run_hash, config, cells, created_at, confidence in rows]
+
+    def num_cells(self) -> int:
+        """Número de células salvas"""
+        return self.connection.execute("SELECT COUNT(*) FROM cells").fetchone()[0]
+
+    def close(self):
+        """Fecha a conexão com o banco"""
+        self.connection.close()
+
+
+def main():
+    """Interface de linha de comando: lista execuções e refaz relatórios"""
+    parser = argparse.ArgumentParser(
+        description="Consulta os resultados de simulação salvos em SQLite")
+    parser.add_argument('banco', nargs='?', default='results/resultados.db',
+                        help="arquivo SQLite (padrão: results/resultados.db)")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    subparsers.add_parser('listar', help="lista as execuções salvas")
+
+    report = subparsers.add_parser('relatorio',
+                                   help="refaz resumo, gráficos e recomendação de uma execução")
+    report.add_argument('execucao', nargs='?', default=None,
+                        help="hash (ou prefixo) da execução; padrão: a mais recente")
+    report.add_argument('--saida', default='docs', help="diretório dos gráficos (padrão: docs)")
+
+    args = parser.parse_args()
+
+    if args.comando == 'listar':
+        store = ResultsStore(args.banco)
+        print(f"{'Execução':<14} {'Data':<20} {'Células':<9} Configuração")
+        print("-"*70)
+        for run in store.list_runs():
+            config = run['config']
+            created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(run['created_at']))
+            print(f"{run['run_hash'][:12]:<14} {created:<20} {run['num_cells']:<9} "
+                  f"capacidade={config.get('cache_capacity')}, "
+                  f"padrões={','.join(config.get('patterns', []))}")
+        print(f"\n{store.num_cells()} células salvas em {store.path}")
+        store.close()
+    else:
+        from simulation.simulation_mode import report_from_store
+        report_from_store(args.banco, args.execucao, args.saida)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Amostragem espacial de traces (SHARDS) para curvas de miss ratio aproximadas
+Simula qualquer algoritmo de algorithms/ sobre uma fração dos textos,
+com um cache proporcionalmente menor
+
+Aluno D - Módulo de Simulação
+"""
+
+import argparse
+from typing import Dict, List
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+# Constantes do splitmix64
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_HASH_SPACE = 2 ** 64
+
+
+def hash_keys(keys, salt: int = 0) -> np.ndarray:
+    """
+    Hash splitmix64 vetorizado dos números dos textos
+
+    Args:
+        keys: array de números de textos
+        salt: sal que muda a amostra (amostras independentes por sal)
+
+    Returns:
+        np.ndarray: hashes uint64
+    """
+    offset = np.uint64(_GOLDEN * (salt + 1) % _HASH_SPACE)
+    z = np.asarray(keys).astype(np.uint64) + offset
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    return z ^ (z >> np.uint64(31))
+
+
+def _iter_blocks(requests, chunk_size: int):
+    """Percorre uma sequência em memória ou um Trace em blocos de text_ids"""
+    from simulation.trace_store import Trace
+
+    if isinstance(requests, (str, Path)):
+        requests = Trace(requests)
+    if isinstance(requests, Trace):
+        for chunk in requests.iter_chunks(chunk_size):
+            yield chunk['text_ids']
+    else:
+        requests = np.asarray(requests)
+        for start in range(0, len(requests), chunk_size):
+            yield requests[start:start + chunk_size]
+
+
+class ShardsSampler:
+    """
+    Amostrador espacial: um texto entra na amostra se hash(texto) < limiar
+
+    Todas as requisições de um texto amostrado são mantidas, então a
+    reutilização entre acessos é preservada. Com taxa R, um cache de
+    capacidade C é simulado com capacidade R × C.
+
+    Variantes:
+    - taxa fixa (rate): o limiar é R × 2^64
+    - tamanho fixo (max_keys): o limiar é o max_keys-ésimo menor hash entre
+      os textos do trace, então a amostra tem no máximo max_keys textos
+      distintos (limiar calculado em uma primeira passada pelo trace)
+    """
+
+    def __init__(self, rate: float = None, max_keys: int = None, salt: int = 0):
+        """
+        Args:
+            rate: taxa de amostragem (0 < rate <= 1)
+            max_keys: número máximo de textos distintos na amostra
+            salt: sal do hash
+
+        Raises:
+            ValueError: se não for informado exatamente um entre rate e max_keys
+        """
+        if (rate is None) == (max_keys is None):
+            raise ValueError("Informe exatamente um entre rate e max_keys")
+        if rate is not None and not 0 < rate <= 1:
+            raise ValueError("rate deve estar entre 0 e 1")
+        if max_keys is not None and max_keys < 1:
+            raise ValueError("max_keys deve ser positivo")
+
+        self.rate = rate
+        self.max_keys = max_keys
+        self.salt = salt
+
+    def _threshold(self, requests, chunk_size: int) -> int:
+        """Calcula o limiar do hash (exclusivo) para a variante escolhida"""
+        if self.rate is not None:
+            return min(int(self.rate * _HASH_SPACE), _HASH_SPACE)
+
+        # Tamanho fixo: guarda só os max_keys menores hashes distintos
+        smallest = np.empty(0, dtype=np.uint64)
+        for block in _iter_blocks(requests, chunk_size):
+            smallest = np.union1d(smallest, hash_keys(np.unique(block), self.salt))
+            smallest = smallest[:self.max_keys + 1]
+
+        if len(smallest) <= self.max_keys:
+            return _HASH_SPACE
+        return int(smallest[self.max_keys])
+
+    def sample(self, requests, chunk_size: int = 1 << 20) -> Dict:
+        """
+        Extrai a subsequência amostrada
+
+        Args:
+            requests: array/lista de textos, Trace ou diretório de trace
+            chunk_size: requisições processadas por bloco
+
+        Returns:
+            dict: 'requests' (subsequência), 'rate' (taxa efetiva),
+                  'total_requests' e 'sampled_requests'
+        """
+        threshold = self._threshold(requests, chunk_size)
+        sampled = []
+        total = 0
+
+        for block in _iter_blocks(requests, chunk_size):
+            total += len(block)
+            if threshold >= _HASH_SPACE:
+                sampled.append(np.asarray(block))
+            else:
+                sampled.append(block[hash_keys(block, self.salt) < np.uint64(threshold)])
+
+        sampled = np.concatenate(sampled) if sampled else np.empty(0, dtype=np.int32)
+        return {
+            'requests': sampled,
+            'rate': threshold / _HASH_SPACE,
+            'total_requests': total,
+            'sampled_requests': len(sampled)
+        }
+
+
+def _keys_only_loader(num):
+    """Loader que não lê nada: a amostragem só mede hits e misses"""
+    return "", 0.0
+
+
+def _run_policy(cache_class, requests: np.ndarray, capacity: int) -> float:
+    """Simula um algoritmo sobre a subsequência e retorna o miss ratio"""
+    cache = cache_class(capacity=capacity)
+    for text_num in requests.tolist():
+        cache.get(text_num, _keys_only_loader)
+    return cache.misses / len(requests) if len(requests) else 0.0
+
+
+def shards_compare(algorithms: List, requests, capacities: List[int],
+                   rate: float = None, max_keys: int = None, num_salts: int = 3,
+                   chunk_size: int = 1 << 20) -> Dict[str, List[Dict]]:
+    """
+    Estima o miss ratio de cada algoritmo em cada capacidade por amostragem
+
+    A amostra de cada sal é extraída uma vez e reaproveitada em todos os
+    algoritmos e capacidades. O erro é estimado pela dispersão entre as
+    amostras de sais diferentes (erro padrão da média).
+
+    Args:
+        algorithms: lista de classes de algoritmos de cache
+        requests: array/lista de textos, Trace ou diretório de trace
+        capacities: capacidades (em textos) do cache real
+        rate: taxa de amostragem fixa
+        max_keys: tamanho fixo da amostra, em textos distintos
+        num_salts: número de amostras independentes
+        chunk_size: requisições processadas por bloco
+
+    Returns:
+        dict: {algoritmo: [resultado por capacidade]}
+    """
+    samples = [ShardsSampler(rate, max_keys, salt).sample(requests, chunk_size)
+               for salt in range(num_salts)]
+
+    results = {cache_class.__name__: [] for cache_class in algorithms}
+
+    for cache_class in algorithms:
+        for capacity in capacities:
+            miss_ratios = []
+            scaled = []
+            for sample in samples:
+                scaled_capacity = max(1, round(capacity * sample['rate']))
+                scaled.append(scaled_capacity)
+                miss_ratios.append(_run_policy(cache_class, sample['requests'], scaled_capacity))
+
+            miss_ratios = np.array(miss_ratios)
+            std_error = (miss_ratios.std(ddof=1) / np.sqrt(num_salts)
+                         if num_salts > 1 else float('nan'))
+
+            results[cache_class.__name__].append({
+                'algorithm': cache_class.__name__,
+                'cache_capacity': capacity,
+                'scaled_capacity': scaled,
+                'rate': float(np.mean([s['rate'] for s in samples])),
+                'total_requests': samples[0]['total_requests'],
+                'sampled_requests': float(np.mean([s['sampled_requests'] for s in samples])),
+                'miss_ratio': float(miss_ratios.mean()),
+                'hit_rate': float((1 - miss_ratios.mean()) * 100),
+                'std_error': float(std_error),
+                'salt_miss_ratios': miss_ratios.tolist()
+            })
+
+    return results
+
+
+def print_shards_results(results: Dict[str, List[Dict]]):
+    """
+    Imprime a tabela de miss ratios estimados
+
+    Args:
+        results: retorno de shards_compare
+    """
+    first = next(iter(results.values()))[0]
+    print(f"\n{'='*70}")
+    print(f"MISS RATIO APROXIMADO (SHARDS) - taxa {first['rate']:.4f}, "
+          f"{first['sampled_requests']:,.0f} de {first['total_requests']:,} requisições")
+    print(f"{'='*70}")
+    print(f"{'Algoritmo':<15} {'Capacidade':<12} {'Miss ratio':<12} {'± erro':<10}")
+    print("-"*70)
+
+    for algorithm, rows in results.items():
+        for row in rows:
+            print(f"{algorithm:<15} {row['cache_capacity']:<12} "
+                  f"{row['miss_ratio']*100:>7.2f}%    {row['std_error']*100:>6.2f}%")
+
+
+# Execução pela linha de comando
+if __name__ == "__main__":
+    from algorithms.fifo_cache import FIFOCache
+    from algorithms.lru_cache import LRUCache
+    from algorithms.lfu_cache import LFUCache
+    from algorithms.arc_cache import ARCCache
+
+    ALGORITHMS = {'fifo': FIFOCache, 'lru': LRUCache, 'lfu': LFUCache, 'arc': ARCCache}
+
+    parser = argparse.ArgumentParser(
+        description="Estima o miss ratio dos algoritmos com amostragem SHARDS")
+    parser.add_argument("trace", nargs='?',
+                        help="diretório de trace (sem trace: sequência Zipf sintética)")
+    parser.add_argument("--capacidades", type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument("--taxa", type=float, help="taxa de amostragem fixa")
+    parser.add_argument("--max-textos", type=int, help="tamanho fixo da amostra")
+    parser.add_argument("--sais", type=int, default=3, help="amostras independentes")
+    parser.add_argument("--algoritmos", nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+    args = parser.parse_args()
+
+    if args.taxa is None and args.max_textos is None:
+        args.taxa = 0.01
+
+    if args.trace:
+        requests = args.trace
+    else:
+        from simulation.request_generator import RequestGenerator
+        requests = RequestGenerator(total_texts=1_000_000, seed=42).generate_zipf(2_000_000, 0.8)
+
+    results = shards_compare([ALGORITHMS[a] for a in args.algoritmos], requests,
+                             args.capacidades, args.taxa, args.max_textos, args.sais)
+    print_shards_results(results)
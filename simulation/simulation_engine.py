@@ -5,15 +5,38 @@ Simula múltiplos usuários com diferentes padrões de acesso
 Aluno D - Módulo de Simulação
 """
 
+import hashlib
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.append(str(Path(__file__).parent.parent))
 
-from simulation.request_generator import RequestGenerator
-from core.text_loader import TextLoader
+from simulation.request_generator import RequestGenerator, DEFAULT_PATTERNS
+from simulation.event_engine import EventSimulator, DEFAULT_DISK_LATENCY
+from simulation.miss_ratio_curve import lru_miss_ratio_curve
+from simulation.capacity_sweep import find_knee, format_bytes
+from simulation.confidence import leader_comparison
+from simulation.aggregator import (StreamingAggregator, latency_histogram, steady_state_ranking,
+                                   NUM_LATENCY_BUCKETS)
+from core.text_loader import TextLoader, disk_read_time, resolve_disk_profile
+
+# Mínimo de usuários antes de confiar em um intervalo por bootstrap
+MIN_BOOTSTRAP_USERS = 5
+
+# Requisições por bloco em simulate_user: cada bloco alimenta o agregador
+# e, com checkpoint, é seguido de uma consulta ao relógio
+REQUEST_BATCH = 1 << 14
+
+# Aquecimento padrão da varredura de capacidade, em requisições por texto do
+# corpus: sem ele, os misses compulsórios limitam as maiores capacidades
+SWEEP_WARMUP_PER_TEXT = 10
 
 
 class SimulationEngine:
@@ -21,74 +44,366 @@ class SimulationEngine:
     Motor de simulação para testar e comparar algoritmos de cache
     """
     
-    def __init__(self, text_loader: TextLoader):
+    def __init__(self, text_loader: TextLoader, seed: int = 0, keys_only: bool = False,
+                 keep_access_log: bool = True, virtual_clock: bool = False,
+                 disk_profile=None):
         """
         Inicializa o motor de simulação
         
         Args:
             text_loader: instância do carregador de textos
+            seed: semente base; cada usuário recebe um fluxo derivado dela
+            keys_only: simula só com chaves e tamanhos, sem ler os textos;
+                       a sequência de hits e misses é a mesma do modo completo
+            keep_access_log: mantém o log por requisição nos resultados; sem
+                             ele, resumo e gráficos vêm só do agregador
+            virtual_clock: mede o tempo no relógio virtual em vez do relógio
+                           de parede: os caches recebem o loader só de chaves
+                           e cada miss custa o tempo de leitura modelado pelo
+                           perfil de disco (um hit custa zero)
+            disk_profile: perfil de disco do relógio virtual (nome em
+                          DISK_PROFILES ou dicionário); padrão: o perfil do
+                          loader ou, sem ele, DEFAULT_DISK_LATENCY por leitura
         """
         self.loader = text_loader
         self.results = []
+        self.seed = seed
+        self.keys_only = keys_only
+        self.keep_access_log = keep_access_log
+        self.virtual_clock = virtual_clock
+        self.disk_profile = (resolve_disk_profile(disk_profile)
+                             or getattr(text_loader, 'disk_profile', None)
+                             or {'latency': DEFAULT_DISK_LATENCY})
+        
+        # Estatísticas incrementais dos resultados (resumo e relatórios)
+        self.aggregator = StreamingAggregator()
+        
+        # Comparação dos líderes por padrão (simulate_until_confident)
+        self.confidence = {}
+        
+        # Progresso salvo em disco (simulation.checkpoint.SimulationCheckpoint)
+        self.checkpoint = None
+        
+        # Resultados persistentes por célula (simulation.results_store.ResultsStore)
+        self.store = None
+        
+        # Número de textos do corpus (loaders de teste podem não informar)
+        self.total_texts = getattr(text_loader, 'total_texts', 100)
+    
+    def _loader_function(self):
+        """
+        Função de carregamento passada aos caches
+        
+        No modo só de chaves e no relógio virtual, o loader é trocado por uma
+        consulta ao tamanho do texto (TextLoader.load_size), sem leitura de
+        arquivo, strings nem espera pelo disco.
+        """
+        if not self.keys_only and not self.virtual_clock:
+            return self.loader.load_text
+        return self._size_loader()
+    
+    def _size_loader(self):
+        """Loader só de chaves: devolve o tamanho do texto no lugar do conteúdo"""
+        return getattr(self.loader, 'load_size', _unknown_size)
+    
+    def _virtual_read_times_ns(self, max_text_id: int = 0) -> np.ndarray:
+        """
+        Tempo de leitura modelado de cada texto no relógio virtual
+        
+        Usa o tamanho dos textos quando o loader o informa (textos sem
+        tamanho conhecido custam só a latência do perfil).
+        
+        Returns:
+            np.ndarray: array int64 em nanossegundos, indexado pelo número do texto
+        """
+        sizes = np.zeros(max(self.total_texts, max_text_id) + 1, dtype=np.int64)
+        if hasattr(self.loader, 'text_sizes'):
+            known = self.loader.text_sizes()
+            sizes[:len(known)] = known[:len(sizes)]
+        return (disk_read_time(self.disk_profile, sizes) * 1e9).astype(np.int64)
+    
+    @staticmethod
+    def _new_access_log(num_requests: int) -> Dict[str, np.ndarray]:
+        """
+        Cria o log de acessos em colunas NumPy pré-alocadas
+        
+        Colunas: 'request_index' (1..N), 'text_id', 'was_hit' e
+        'latency_ns' (tempo de carregamento em nanossegundos).
+        """
+        return {
+            'request_index': np.arange(1, num_requests + 1, dtype=np.int64),
+            'text_id': np.empty(num_requests, dtype=np.int32),
+            'was_hit': np.empty(num_requests, dtype=bool),
+            'latency_ns': np.empty(num_requests, dtype=np.int64)
+        }
+    
+    def _count_per_text(self, text_ids: np.ndarray, was_hit: np.ndarray,
+                        max_text_id: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Conta hits e misses por texto com np.bincount
+        
+        Returns:
+            tuple: (hits, misses), arrays indexados pelo número do texto
+        """
+        size = max(self.total_texts, max_text_id) + 1
+        text_hits = np.bincount(text_ids[was_hit], minlength=size)
+        text_misses = np.bincount(text_ids[~was_hit], minlength=size)
+        return text_hits, text_misses
+    
+    def _new_totals(self, max_text_id: int = 0) -> Dict:
+        """
+        Acumuladores de uma célula, de tamanho independente do número de requisições
+        
+        Contadores por texto, histograma de latência e as somas do
+        aquecimento e do regime; são atualizados a cada bloco (_add_batch).
+        """
+        size = max(self.total_texts, max_text_id) + 1
+        return {
+            'text_hits': np.zeros(size, dtype=np.int64),
+            'text_misses': np.zeros(size, dtype=np.int64),
+            'latency': np.zeros(NUM_LATENCY_BUCKETS, dtype=np.int64),
+            'warmup_hits': 0,
+            'steady_hits': 0,
+            'steady_latency_ns': 0,
+            'total_latency_ns': 0
+        }
+    
+    def _add_batch(self, totals: Dict, algorithm: str, pattern: str, text_ids: np.ndarray,
+                   was_hit: np.ndarray, latency_ns: np.ndarray, warmup_count: int):
+        """
+        Soma um bloco de requisições aos acumuladores da célula e ao agregador
+        
+        Args:
+            totals: acumuladores da célula (_new_totals)
+            algorithm: nome do algoritmo
+            pattern: padrão de acesso
+            text_ids: números dos textos do bloco
+            was_hit: se cada requisição foi hit
+            latency_ns: latência de cada requisição, em nanossegundos
+            warmup_count: requisições do início do bloco que são de aquecimento
+        """
+        batch_hits, batch_misses = self._count_per_text(text_ids, was_hit,
+                                                        len(totals['text_hits']) - 1)
+        histogram = latency_histogram(latency_ns)
+        
+        totals['text_hits'] += batch_hits
+        totals['text_misses'] += batch_misses
+        totals['latency'] += histogram
+        totals['warmup_hits'] += int(was_hit[:warmup_count].sum())
+        totals['steady_hits'] += int(was_hit[warmup_count:].sum())
+        totals['steady_latency_ns'] += int(latency_ns[warmup_count:].sum())
+        totals['total_latency_ns'] += int(latency_ns.sum())
+        
+        self.aggregator.add_counts(algorithm, pattern, batch_hits, batch_misses, histogram)
     
-    def simulate_user(self, cache, requests: List[int], 
-                     user_id: int, pattern: str) -> Dict:
+    @staticmethod
+    def _warmup_end(warmup, num_requests: int, fill_index: int = None) -> int:
+        """
+        Índice da primeira requisição em regime (após o aquecimento)
+        
+        Args:
+            warmup: número de requisições de aquecimento, ou 'fill' para
+                    aquecer até o cache ficar cheio
+            num_requests: número total de requisições
+            fill_index: requisições processadas quando o cache encheu
+                        (None se não encheu)
+            
+        Raises:
+            ValueError: se o aquecimento for inválido
+        """
+        if warmup == 'fill':
+            return num_requests if fill_index is None else fill_index
+        if isinstance(warmup, str) or warmup < 0:
+            raise ValueError(f"Aquecimento inválido: {warmup}. "
+                             f"Use um número de requisições ou 'fill'")
+        return min(int(warmup), num_requests)
+    
+    @staticmethod
+    def _hot_set_fraction(cache, hot_set: List[int]) -> float:
+        """Fração do hot set que está no cache neste momento"""
+        return sum(1 for text_num in hot_set if cache.is_in_cache(text_num)) / len(hot_set)
+    
+    def simulate_user(self, cache, requests, 
+                     user_id: int, pattern: str,
+                     trace_info: Dict = None, verbose: bool = True,
+                     warmup=0) -> Dict:
         """
         Simula um único usuário acessando textos
         
+        As requisições são processadas em blocos de REQUEST_BATCH: cada bloco
+        alimenta self.aggregator e os acumuladores da célula (contadores por
+        texto, histograma de latência, somas do aquecimento e do regime).
+        Com keep_access_log=False, nenhuma coluna do tamanho da sequência é
+        alocada. Com virtual_clock, latências e tempos vêm do relógio virtual.
+        
         Args:
             cache: instância do algoritmo de cache
-            requests: lista de números de textos a acessar
+            requests: lista ou array de números de textos a acessar
             user_id: identificador do usuário
             pattern: padrão de acesso usado
+            trace_info: metadados da sequência (RequestGenerator.last_trace_info);
+                        com 'hot_set' e 'scan_ends', mede a resistência a varreduras
+            verbose: exibe o progresso
+            warmup: aquecimento antes do regime: número de requisições, ou
+                    'fill' para aquecer até o cache ficar cheio (se nunca
+                    encher, toda a sequência conta como aquecimento e as
+                    métricas em regime ficam NaN, sem dados)
             
         Returns:
-            dict: métricas coletadas durante a simulação
+            dict: métricas coletadas durante a simulação. 'access_log' traz o
+                  log em colunas NumPy (veja _new_access_log; vazio se
+                  keep_access_log=False), 'text_hit_count' / 'text_miss_count'
+                  são arrays indexados pelo número do texto e
+                  'latency_histogram' é o histograma logarítmico das
+                  latências (simulation.aggregator). As métricas 'steady_*' consideram só
+                  as requisições após o aquecimento; os misses do aquecimento
+                  ficam em 'warmup_misses'
+            
+        Raises:
+            ValueError: se o aquecimento for inválido
         """
-        # Limpa o cache antes de começar
-        cache.clear()
+        # Valida o aquecimento antes de simular
+        num_requests = len(requests)
+        self._warmup_end(warmup, num_requests)
         
         # Função wrapper para o loader
-        def load_from_disk(num):
-            return self.loader.load_text(num)
+        load_from_disk = self._loader_function()
         
-        # Coleta de dados
-        access_log = []
-        text_miss_count = {}  # Conta misses por texto
-        text_hit_count = {}   # Conta hits por texto
+        algorithm = cache.__class__.__name__
+        text_ids = np.asarray(requests)
         
-        print(f"  Simulando Usuário {user_id} com padrão '{pattern}'...")
+        # Célula interrompida antes: continua do último retrato do checkpoint
+        cell_key = (algorithm, pattern, user_id)
+        saved = self.checkpoint.take_partial(cell_key) if self.checkpoint else None
         
-        start_time = time.time()
+        if saved:
+            cache = saved['cache']
+            access_log = saved['access_log']
+            totals = saved['totals']
+            start_index = saved['offset']
+            elapsed = saved['elapsed']
+            retention_before = saved['retention_before']
+            retention_after = saved['retention_after']
+            fill_pending = saved['fill_pending']
+            fill_index = saved['fill_index']
+            
+            # Os blocos simulados antes da interrupção entram de uma vez
+            self.aggregator.add_counts(algorithm, pattern, totals['text_hits'],
+                                       totals['text_misses'], totals['latency'])
+        else:
+            # Limpa o cache antes de começar
+            cache.clear()
+            
+            # Log por requisição só se for mantido no resultado
+            access_log = None
+            if self.keep_access_log:
+                access_log = self._new_access_log(num_requests)
+                access_log['text_id'][:] = requests
+            
+            totals = self._new_totals(int(text_ids.max()) if num_requests else 0)
+            start_index = 0
+            elapsed = 0.0
+            retention_before = []
+            retention_after = []
+            
+            # No aquecimento 'fill', registra quando o cache fica cheio
+            fill_pending = warmup == 'fill'
+            fill_index = None
+        
+        if verbose:
+            resumed = f" (retomado na requisição {start_index + 1})" if saved else ""
+            print(f"  Simulando Usuário {user_id} com padrão '{pattern}'{resumed}...")
+        
+        start_time = time.time() - elapsed
+        
+        # Iterar sobre inteiros Python é mais rápido que sobre escalares NumPy
+        if isinstance(requests, np.ndarray):
+            requests = requests.tolist()
         
-        for request_num, text_num in enumerate(requests, 1):
-            # Executa o acesso
-            content, load_time, was_hit = cache.get(text_num, load_from_disk)
-            
-            # Registra o acesso
-            access_log.append({
-                'request_num': request_num,
-                'text_num': text_num,
-                'was_hit': was_hit,
-                'load_time': load_time
-            })
-            
-            # Conta hits e misses por texto
-            if was_hit:
-                text_hit_count[text_num] = text_hit_count.get(text_num, 0) + 1
+        # Pontos onde o hot set é inspecionado (antes e depois de cada varredura)
+        trace_info = trace_info or {}
+        hot_set = [int(t) for t in trace_info.get('hot_set', [])]
+        probe_before = set(trace_info.get('scan_starts', [])) if hot_set else set()
+        probe_after = set(trace_info.get('scan_ends', [])) if hot_set else set()
+        
+        # Sem o log, cada bloco usa as mesmas colunas de tamanho REQUEST_BATCH
+        if access_log is None:
+            batch_hits = np.empty(min(REQUEST_BATCH, num_requests), dtype=bool)
+            batch_latency = np.empty(min(REQUEST_BATCH, num_requests), dtype=np.int64)
+        
+        checkpoint = self.checkpoint
+        
+        # Relógio virtual: um miss custa a leitura modelada do texto, um hit custa zero
+        read_times_ns = (self._virtual_read_times_ns(len(totals['text_hits']) - 1)
+                         if self.virtual_clock else None)
+        
+        for batch_start in range(start_index, num_requests, REQUEST_BATCH):
+            batch_end = min(batch_start + REQUEST_BATCH, num_requests)
+            if access_log is not None:
+                was_hit_column = access_log['was_hit'][batch_start:batch_end]
+                latency_column = access_log['latency_ns'][batch_start:batch_end]
             else:
-                text_miss_count[text_num] = text_miss_count.get(text_num, 0) + 1
+                was_hit_column = batch_hits[:batch_end - batch_start]
+                latency_column = batch_latency[:batch_end - batch_start]
+            
+            for j, text_num in enumerate(requests[batch_start:batch_end]):
+                i = batch_start + j
+                if probe_before and i in probe_before:
+                    retention_before.append(self._hot_set_fraction(cache, hot_set))
+                
+                # Executa o acesso e registra nas colunas do bloco
+                content, load_time, was_hit_column[j] = cache.get(text_num, load_from_disk)
+                latency_column[j] = load_time * 1e9
+                
+                if fill_pending and cache.is_full():
+                    fill_index = i + 1
+                    fill_pending = False
+                
+                if probe_after and i in probe_after:
+                    retention_after.append(self._hot_set_fraction(cache, hot_set))
+            
+            if read_times_ns is not None:
+                latency_column[:] = np.where(was_hit_column, 0,
+                                             read_times_ns[text_ids[batch_start:batch_end]])
+            
+            # Requisições do bloco que ainda são de aquecimento
+            warmup_end = self._warmup_end(warmup, num_requests, fill_index)
+            self._add_batch(totals, algorithm, pattern, text_ids[batch_start:batch_end],
+                            was_hit_column, latency_column,
+                            min(max(warmup_end - batch_start, 0), batch_end - batch_start))
+            
+            if checkpoint and checkpoint.is_due():
+                checkpoint.snapshot(cell_key, {
+                    'cache': cache,
+                    'access_log': access_log,
+                    'totals': totals,
+                    'offset': batch_end,
+                    'elapsed': time.time() - start_time,
+                    'retention_before': retention_before,
+                    'retention_after': retention_after,
+                    'fill_pending': fill_pending,
+                    'fill_index': fill_index
+                })
         
         total_time = time.time() - start_time
         
+        # Separa o aquecimento do regime
+        warmup_end = self._warmup_end(warmup, num_requests, fill_index)
+        steady_requests = num_requests - warmup_end
+        
         # Coleta métricas finais
         metrics = cache.get_metrics()
+        if self.virtual_clock:
+            # O usuário é sequencial: a duração virtual é a soma das latências
+            total_time = totals['total_latency_ns'] / 1e9
+            metrics['total_load_time'] = total_time
+            metrics['avg_load_time'] = total_time / num_requests if num_requests else 0.0
         
         result = {
             'user_id': user_id,
             'pattern': pattern,
-            'algorithm': cache.__class__.__name__,
-            'total_requests': len(requests),
+            'algorithm': algorithm,
+            'total_requests': num_requests,
             'hits': metrics['hits'],
             'misses': metrics['misses'],
             'hit_rate': metrics['hit_rate'],
@@ -96,18 +411,828 @@ class SimulationEngine:
             'avg_load_time': metrics['avg_load_time'],
             'total_load_time': metrics['total_load_time'],
             'simulation_time': total_time,
-            'access_log': access_log,
-            'text_miss_count': text_miss_count,
-            'text_hit_count': text_hit_count
+            'warmup_requests': warmup_end,
+            'warmup_misses': warmup_end - totals['warmup_hits'],
+            'steady_requests': steady_requests,
+            'steady_hits': totals['steady_hits'],
+            'steady_hit_rate': (totals['steady_hits'] / steady_requests * 100
+                                if steady_requests else float('nan')),
+            'steady_avg_load_time': (totals['steady_latency_ns'] / steady_requests / 1e9
+                                     if steady_requests else float('nan')),
+            'access_log': access_log if access_log is not None else self._new_access_log(0),
+            'text_miss_count': totals['text_misses'],
+            'text_hit_count': totals['text_hits'],
+            'latency_histogram': totals['latency']
         }
         
+        if retention_after:
+            result['hot_set_before_scan'] = sum(retention_before) / len(retention_before) * 100
+            result['hot_set_after_scan'] = sum(retention_after) / len(retention_after) * 100
+        
+        # Contadores por texto e latência já foram agregados bloco a bloco
+        self.aggregator.add_result(result, include_counts=False)
+        
+        if verbose:
+            print(f"    ✓ Concluído: {metrics['hits']} hits, "
+                  f"{metrics['misses']} misses ({metrics['hit_rate']:.1f}% hit rate)")
+            if warmup_end and steady_requests:
+                print(f"      Aquecimento: {warmup_end} requisições "
+                      f"({result['warmup_misses']} misses); "
+                      f"regime: {result['steady_hit_rate']:.1f}% hit rate")
+            elif warmup_end:
+                print(f"      ⚠️  Aquecimento tomou as {warmup_end} requisições "
+                      f"(o cache não encheu): sem dados em regime")
+        
+        return result
+    
+    def replay_trace(self, cache, trace, chunk_size: int = 1 << 16,
+                     pattern: str = 'trace', user_id: int = 0) -> Dict:
+        """
+        Reproduz um trace gravado em disco (simulation.trace_store.Trace)
+        
+        O trace é lido em blocos do arquivo mapeado em memória, então o
+        consumo de memória não depende do tamanho do trace. Como traces reais
+        podem ter centenas de milhões de requisições, não é mantido um log
+        por requisição: apenas contadores de hits e misses por texto.
+        
+        Args:
+            cache: instância do algoritmo de cache
+            trace: Trace ou caminho do diretório do trace
+            chunk_size: requisições lidas por bloco
+            pattern: rótulo do padrão nos resultados
+            user_id: identificador usado nos resultados
+            
+        Returns:
+            dict: métricas no mesmo formato de simulate_user
+        """
+        from simulation.trace_store import Trace
+        
+        if not isinstance(trace, Trace):
+            trace = Trace(trace)
+        
+        cache.clear()
+        
+        load_from_disk = self._loader_function()
+        algorithm = cache.__class__.__name__
+        
+        size = max(self.total_texts, trace.max_text_id) + 1
+        text_hits = np.zeros(size, dtype=np.int64)
+        text_misses = np.zeros(size, dtype=np.int64)
+        latency = np.zeros(NUM_LATENCY_BUCKETS, dtype=np.int64)
+        
+        print(f"  Reproduzindo trace {trace.trace_dir} ({len(trace)} requisições)...")
+        
+        read_times_ns = (self._virtual_read_times_ns(trace.max_text_id)
+                         if self.virtual_clock else None)
+        virtual_time = 0.0
+        start_time = time.time()
+        
+        for chunk in trace.iter_chunks(chunk_size):
+            text_ids = chunk['text_ids']
+            was_hit = np.empty(len(text_ids), dtype=bool)
+            load_times = np.empty(len(text_ids), dtype=np.float64)
+            
+            for i, text_num in enumerate(text_ids.tolist()):
+                content, load_times[i], was_hit[i] = cache.get(text_num, load_from_disk)
+            
+            if read_times_ns is not None:
+                load_times = np.where(was_hit, 0, read_times_ns[text_ids]) / 1e9
+                virtual_time += load_times.sum()
+            
+            chunk_hits, chunk_misses = self._count_per_text(text_ids, was_hit, trace.max_text_id)
+            chunk_latency = latency_histogram(load_times * 1e9)
+            text_hits += chunk_hits
+            text_misses += chunk_misses
+            latency += chunk_latency
+            self.aggregator.add_counts(algorithm, pattern, chunk_hits, chunk_misses, chunk_latency)
+        
+        total_time = time.time() - start_time
+        metrics = cache.get_metrics()
+        if read_times_ns is not None:
+            total_time = virtual_time
+            metrics['total_load_time'] = virtual_time
+            metrics['avg_load_time'] = virtual_time / len(trace) if len(trace) else 0.0
+        
+        result = {
+            'user_id': user_id,
+            'pattern': pattern,
+            'algorithm': algorithm,
+            'total_requests': len(trace),
+            'hits': metrics['hits'],
+            'misses': metrics['misses'],
+            'hit_rate': metrics['hit_rate'],
+            'miss_rate': metrics['miss_rate'],
+            'avg_load_time': metrics['avg_load_time'],
+            'total_load_time': metrics['total_load_time'],
+            'simulation_time': total_time,
+            'access_log': self._new_access_log(0),
+            'text_miss_count': text_misses,
+            'text_hit_count': text_hits,
+            'latency_histogram': latency
+        }
+        self.aggregator.add_result(result, include_counts=False)
+        
         print(f"    ✓ Concluído: {metrics['hits']} hits, "
               f"{metrics['misses']} misses ({metrics['hit_rate']:.1f}% hit rate)")
         
         return result
     
+    def replay_trace_all_algorithms(self, algorithms: List, trace,
+                                    cache_capacity: int = 10,
+                                    chunk_size: int = 1 << 16) -> Dict[str, List[Dict]]:
+        """
+        Reproduz o mesmo trace em todos os algoritmos fornecidos
+        
+        Args:
+            algorithms: lista de classes de algoritmos de cache
+            trace: Trace ou caminho do diretório do trace
+            cache_capacity: capacidade do cache
+            chunk_size: requisições lidas por bloco
+            
+        Returns:
+            dict: resultados organizados por algoritmo (um resultado cada)
+        """
+        all_results = {}
+        self.aggregator = StreamingAggregator()
+        
+        for cache_class in algorithms:
+            print(f"\nAlgoritmo: {cache_class.__name__}")
+            cache = cache_class(capacity=cache_capacity)
+            result = self.replay_trace(cache, trace, chunk_size)
+            all_results[cache_class.__name__] = [result]
+        
+        self.results = all_results
+        self.confidence = {}
+        return all_results
+    
+    def simulate_timed(self, cache, requests, arrivals, disk_latency: float = None,
+                       hit_latency: float = 0.0, disk_channels: int = 1,
+                       user_id: int = 0, pattern: str = '',
+                       prefetch_depth: int = 0) -> Dict:
+        """
+        Simula requisições com instantes de chegada e fila no disco lento
+        
+        O tempo é modelado, não medido: a simulação roda no EventSimulator,
+        com relógio virtual. Cada miss ocupa um canal do disco pelo tempo de
+        leitura do texto, o mesmo do relógio virtual de simulate_user
+        (perfil de disco e tamanho do texto), e espera na fila se todos os
+        canais estiverem ocupados. Um hit em um texto cuja leitura ainda
+        está em andamento (delayed hit) espera essa leitura terminar.
+        
+        Args:
+            cache: instância do algoritmo de cache
+            requests: lista ou array de números de textos
+            arrivals: instante de chegada de cada requisição, em segundos
+            disk_latency: tempo de serviço fixo por leitura, em segundos
+                          (padrão: o tempo de leitura de cada texto no
+                          perfil de disco do motor)
+            hit_latency: tempo de resposta de um hit, em segundos
+            disk_channels: número de leituras simultâneas suportadas pelo disco
+            user_id: identificador usado nos resultados
+            pattern: rótulo do padrão nos resultados
+            prefetch_depth: textos seguintes antecipados a cada miss (0 = sem antecipação)
+            
+        Returns:
+            dict: métricas de hit rate e de tempo de resposta (média e percentis)
+        """
+        cache.clear()
+        
+        # O disco é modelado pelo simulador: o loader real (que pode esperar
+        # pelo perfil de disco) nunca é chamado
+        load_from_disk = self._size_loader()
+        
+        read_times = None
+        if disk_latency is None:
+            disk_latency = DEFAULT_DISK_LATENCY
+            read_times = self._virtual_read_times_ns(int(np.max(requests, initial=0))) / 1e9
+        
+        simulator = EventSimulator(cache, load_from_disk, disk_latency, hit_latency,
+                                   disk_channels, prefetch_depth, self.total_texts, read_times)
+        result = simulator.run(requests, arrivals)
+        
+        arrivals = np.asarray(arrivals, dtype=np.float64)
+        duration = arrivals[-1] - arrivals[0] if len(arrivals) > 1 else 0.0
+        
+        result['user_id'] = user_id
+        result['pattern'] = pattern
+        result['offered_load'] = len(arrivals) / duration if duration > 0 else 0.0
+        return result
+    
+    def simulate_latency_study(self, algorithms: List, cache_capacity: int = 10,
+                               num_requests: int = 10000, pattern: str = 'zipf',
+                               arrival_process: str = 'mmpp', rate: float = 100.0,
+                               disk_latency: float = None, disk_channels: int = 1,
+                               arrival_params: Dict = None) -> Dict[str, Dict]:
+        """
+        Compara o tempo de resposta dos algoritmos sob um processo de chegada
+        
+        Todos os algoritmos recebem a mesma sequência e os mesmos instantes.
+        
+        Args:
+            algorithms: lista de classes de algoritmos de cache
+            cache_capacity: capacidade do cache
+            num_requests: número de requisições
+            pattern: padrão de acesso das requisições
+            arrival_process: processo de chegada ('poisson', 'mmpp', 'diurnal')
+            rate: taxa base de chegada (requisições/s)
+            disk_latency: tempo de serviço fixo por leitura, em segundos
+                          (padrão: o tempo de leitura de cada texto no
+                          perfil de disco do motor)
+            disk_channels: leituras simultâneas suportadas pelo disco
+            arrival_params: parâmetros extras de RequestGenerator.generate_arrivals
+            
+        Returns:
+            dict: resultado de simulate_timed por algoritmo
+        """
+        generator = RequestGenerator(self.total_texts, seed=self.seed).for_user(0)
+        requests = generator.generate_user_requests(num_requests, pattern)
+        arrivals = generator.generate_arrivals(num_requests, arrival_process, rate,
+                                               **(arrival_params or {}))
+        
+        if disk_latency is None:
+            mean_read = self._virtual_read_times_ns()[1:self.total_texts + 1].mean() / 1e9
+            disk = f"disco {mean_read*1000:.1f}ms por leitura em média"
+        else:
+            disk = f"disco {disk_latency*1000:.1f}ms"
+        
+        print(f"\n{'='*70}")
+        print(f"TEMPO DE RESPOSTA - padrão '{pattern}', chegadas '{arrival_process}' "
+              f"({rate:.0f} req/s base), {disk}")
+        print(f"{'='*70}")
+        print(f"{'Algoritmo':<15} {'Hit Rate':<10} {'Média':<10} {'p50':<10} "
+              f"{'p99':<10} {'Fila média':<10}")
+        print("-"*70)
+        
+        study = {}
+        for cache_class in algorithms:
+            result = self.simulate_timed(cache_class(capacity=cache_capacity), requests,
+                                         arrivals, disk_latency,
+                                         disk_channels=disk_channels, pattern=pattern)
+            study[cache_class.__name__] = result
+            print(f"{cache_class.__name__:<15} "
+                  f"{result['hit_rate']:>6.2f}%   "
+                  f"{result['mean_response_time']*1000:>7.2f}ms "
+                  f"{result['p50_response_time']*1000:>7.2f}ms "
+                  f"{result['p99_response_time']*1000:>7.2f}ms "
+                  f"{result['mean_queue_delay']*1000:>7.2f}ms")
+        
+        return study
+    
+    def generate_user_trace(self, pattern: str, user_id: int, requests_per_user: int,
+                            cache_capacity: int = 10,
+                            pattern_params: Dict[str, Dict] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Gera a sequência de requisições de um usuário
+        
+        A sequência depende só de (seed, user_id, padrão, parâmetros), então é
+        a mesma em qualquer ordem de execução ou processo.
+        
+        Args:
+            pattern: padrão de acesso
+            user_id: identificador do usuário
+            requests_per_user: número de requisições
+            cache_capacity: capacidade do cache (define o laço padrão do 'loop'
+                            e o tamanho padrão das varreduras do 'scan')
+            pattern_params: parâmetros por padrão, ex.: {'zipf': {'exponent': 1.2}}
+            
+        Returns:
+            tuple: (array de requisições, metadados da sequência)
+        """
+        generator = RequestGenerator(self.total_texts, seed=self.seed).for_user(user_id)
+        params = dict((pattern_params or {}).get(pattern, {}))
+        
+        # Por padrão, o laço cíclico é um pouco maior que a capacidade
+        if pattern == 'loop':
+            params.setdefault('loop_size', cache_capacity + max(1, cache_capacity // 5))
+        
+        # Por padrão, cada varredura lê 5x a capacidade em textos frios e
+        # ocupa no máximo um quarto da sequência (a primeira termina na metade)
+        if pattern == 'scan':
+            cold_texts = self.total_texts - params.get('hot_size', 10)
+            params.setdefault('scan_length',
+                              max(1, min(5 * cache_capacity, cold_texts, requests_per_user // 4)))
+        
+        requests = generator.generate_user_requests(requests_per_user, pattern, **params)
+        return requests, generator.last_trace_info
+    
+    def compute_miss_ratio_curves(self, patterns: List[str] = None, num_users: int = 3,
+                                  requests_per_user: int = 200, cache_capacity: int = 10,
+                                  pattern_params: Dict[str, Dict] = None) -> Dict[str, Dict]:
+        """
+        Calcula a curva de miss ratio do LRU de cada padrão, para todas as capacidades
+        
+        Usa as mesmas sequências de simulate_algorithm (uma passada por
+        usuário, sem simular o cache); a curva do padrão é a média das
+        curvas dos usuários, como o hit rate médio do resumo.
+        
+        Args:
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            num_users: número de usuários por padrão
+            requests_per_user: número de requisições por usuário
+            cache_capacity: capacidade usada para gerar as sequências ('loop')
+            pattern_params: parâmetros por padrão
+            
+        Returns:
+            dict: {padrão: curva} no formato de lru_miss_ratio_curve
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+        curves = {}
+        
+        for pattern in patterns:
+            user_curves = []
+            for user_id in range(1, num_users + 1):
+                requests, _ = self.generate_user_trace(pattern, user_id, requests_per_user,
+                                                       cache_capacity, pattern_params)
+                user_curves.append(lru_miss_ratio_curve(requests, self.total_texts))
+            
+            curve = dict(user_curves[0])
+            curve['miss_ratio'] = np.mean([c['miss_ratio'] for c in user_curves], axis=0)
+            curve['hit_rate'] = (1 - curve['miss_ratio']) * 100
+            curves[pattern] = curve
+        
+        return curves
+    
+    def cell_config(self, algorithm: str, pattern: str, user_id: int,
+                    cache_capacity: int = 10, requests_per_user: int = 200,
+                    pattern_params: Dict[str, Dict] = None, warmup=0) -> Dict:
+        """
+        Configuração que determina o resultado de uma célula
+        
+        É a chave das células no ResultsStore: duas células com a mesma
+        configuração têm os mesmos hits e misses, os mesmos tempos no
+        relógio virtual (perfil de disco e corpus) e os mesmos campos
+        (com ou sem log de acessos).
+        
+        Returns:
+            dict: configuração serializável em JSON
+        """
+        return {
+            'algorithm': algorithm,
+            'pattern': pattern,
+            'user_id': user_id,
+            'cache_capacity': cache_capacity,
+            'requests_per_user': requests_per_user,
+            'pattern_params': (pattern_params or {}).get(pattern, {}),
+            'warmup': warmup,
+            'seed': self.seed,
+            'total_texts': self.total_texts,
+            'keys_only': self.keys_only,
+            'virtual_clock': self.virtual_clock,
+            'keep_access_log': self.keep_access_log,
+            'disk_profile': self.disk_profile,
+            'corpus': self._corpus_id()
+        }
+    
+    def _corpus_id(self):
+        """
+        Identidade do corpus: hash do tamanho dos textos ou, sem ele, o
+        diretório do loader (None para loaders que não informam nenhum)
+        """
+        if not hasattr(self, '_corpus'):
+            if hasattr(self.loader, 'text_sizes'):
+                sizes = np.ascontiguousarray(self.loader.text_sizes(), dtype='<i8')
+                self._corpus = hashlib.sha256(sizes.tobytes()).hexdigest()[:16]
+            elif hasattr(self.loader, 'texts_dir'):
+                self._corpus = str(self.loader.texts_dir)
+            else:
+                self._corpus = None
+        return self._corpus
+    
+    def simulate_cell(self, cache_class, pattern: str, user_id: int,
+                      cache_capacity: int = 10, requests_per_user: int = 200,
+                      pattern_params: Dict[str, Dict] = None,
+                      verbose: bool = True, warmup=0) -> Dict:
+        """
+        Simula uma célula da grade (algoritmo, padrão, usuário, capacidade)
+        
+        Args:
+            cache_class: classe do algoritmo de cache
+            pattern: padrão de acesso
+            user_id: identificador do usuário
+            cache_capacity: capacidade do cache
+            requests_per_user: número de requisições
+            pattern_params: parâmetros por padrão
+            verbose: exibe o progresso
+            warmup: aquecimento (número de requisições ou 'fill')
+            
+        Returns:
+            dict: métricas de simulate_user
+        """
+        # Célula já simulada em outra execução com a mesma configuração
+        if self.store is not None:
+            cell_config = self.cell_config(cache_class.__name__, pattern, user_id, cache_capacity,
+                                           requests_per_user, pattern_params, warmup)
+            stored = self.store.get(cell_config)
+            if stored is not None:
+                if verbose:
+                    print(f"  Usuário {user_id} com padrão '{pattern}': lido do banco de resultados")
+                self.aggregator.add_result(stored)
+                return stored
+        
+        cell_key = (cache_class.__name__, pattern, user_id)
+        if self.checkpoint and self.checkpoint.is_done(cell_key):
+            if verbose:
+                print(f"  Usuário {user_id} com padrão '{pattern}': concluído no checkpoint")
+            self.aggregator.add_result(self.checkpoint.completed[cell_key])
+            return self.checkpoint.completed[cell_key]
+        
+        # Cria nova instância do cache para cada usuário
+        cache = cache_class(capacity=cache_capacity)
+        requests, trace_info = self.generate_user_trace(pattern, user_id, requests_per_user,
+                                                        cache_capacity, pattern_params)
+        result = self.simulate_user(cache, requests, user_id, pattern, trace_info, verbose,
+                                    warmup)
+        
+        if self.checkpoint:
+            self.checkpoint.record(cell_key, result)
+        if self.store is not None:
+            self.store.put(cell_config, result)
+        return result
+    
+    def simulate_all_algorithms_parallel(self, algorithms: List,
+                                         cache_capacity: int = 10,
+                                         num_users: int = 3,
+                                         requests_per_user: int = 200,
+                                         patterns: List[str] = None,
+                                         pattern_params: Dict[str, Dict] = None,
+                                         max_workers: int = None,
+                                         warmup=0) -> Dict[str, List[Dict]]:
+        """
+        Simula a grade algoritmos × padrões × usuários em vários processos
+        
+        Cada célula é simulada por um worker de um ProcessPoolExecutor, que
+        devolve o resultado em formato compacto (log de acessos em colunas).
+        Como as sequências dependem só de (seed, usuário, padrão), os
+        resultados juntados são os mesmos da execução serial, na mesma ordem
+        (exceto os tempos medidos no relógio). Com self.checkpoint ou
+        self.store, cada célula concluída é registrada, e as já concluídas
+        não são simuladas.
+        
+        Args:
+            algorithms: lista de classes de algoritmos de cache
+            cache_capacity: capacidade do cache
+            num_users: número de usuários por padrão
+            requests_per_user: número de requisições por usuário
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            pattern_params: parâmetros por padrão
+            max_workers: número de processos (padrão: número de CPUs)
+            warmup: aquecimento (número de requisições ou 'fill')
+            
+        Returns:
+            dict: resultados organizados por algoritmo
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+        cells = [(cache_class, pattern, user_id, cache_capacity, requests_per_user, pattern_params,
+                  warmup)
+                 for cache_class in algorithms
+                 for pattern in patterns
+                 for user_id in range(1, num_users + 1)]
+        
+        # Células já concluídas (checkpoint ou banco de resultados) não são simuladas de novo
+        finished = dict(self.checkpoint.completed) if self.checkpoint else {}
+        cell_keys = [(cell[0].__name__, cell[1], cell[2]) for cell in cells]
+        cell_configs = {key: self.cell_config(*key, cache_capacity, requests_per_user,
+                                              pattern_params, warmup)
+                        for key in cell_keys}
+        if self.store is not None:
+            for key in cell_keys:
+                stored = None if key in finished else self.store.get(cell_configs[key])
+                if stored is not None:
+                    finished[key] = stored
+        pending = [cell for cell, key in zip(cells, cell_keys) if key not in finished]
+        
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        
+        print(f"\n🚀 Simulando {len(pending)} células em {workers} processos...")
+        start_time = time.time()
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.loader, self.seed, self.keys_only,
+                                           self.keep_access_log, self.virtual_clock,
+                                           self.disk_profile)) as executor:
+            for cell, result in zip(pending, executor.map(_simulate_cell, pending,
+                                                          chunksize=chunksize)):
+                key = (cell[0].__name__, cell[1], cell[2])
+                finished[key] = result
+                if self.checkpoint:
+                    self.checkpoint.record(key, result)
+                if self.store is not None:
+                    self.store.put(cell_configs[key], result)
+        
+        all_results = {cache_class.__name__: [] for cache_class in algorithms}
+        self.aggregator = StreamingAggregator()
+        for key in cell_keys:
+            all_results[key[0]].append(finished[key])
+            self.aggregator.add_result(finished[key])
+        
+        print(f"✅ Grade concluída em {time.time() - start_time:.2f}s")
+        
+        self.results = all_results
+        self.confidence = {}
+        return all_results
+    
+    def mean_text_size(self) -> float:
+        """
+        Tamanho médio dos textos em bytes, para converter orçamentos de memória
+        
+        Returns:
+            float: tamanho médio, ou 0.0 se o loader não informar os tamanhos
+        """
+        if not hasattr(self.loader, 'text_sizes'):
+            return 0.0
+        sizes = self.loader.text_sizes()[1:]
+        return float(sizes.mean()) if len(sizes) else 0.0
+    
+    def simulate_capacity_sweep(self, algorithms: List, capacities: List[int] = None,
+                                byte_budgets: List[int] = None, num_users: int = 3,
+                                requests_per_user: int = 200, patterns: List[str] = None,
+                                pattern_params: Dict[str, Dict] = None,
+                                trace_capacity: int = 10,
+                                max_workers: int = None, warmup: int = None) -> Dict:
+        """
+        Simula cada algoritmo em várias capacidades, em vários processos
+        
+        As sequências de cada (padrão, usuário) são geradas uma única vez e
+        enviadas a todos os workers, então todas as capacidades veem as
+        mesmas requisições. Cada sequência tem `warmup` requisições de
+        aquecimento seguidas das requests_per_user medidas: a curva usa
+        só os hits em regime, sem os misses compulsórios do cache vazio.
+        Cada célula (algoritmo, capacidade, padrão, usuário) roda só com
+        chaves e devolve apenas o número de hits em regime. Com
+        self.checkpoint, as células concluídas são registradas e puladas ao
+        retomar.
+        
+        Args:
+            algorithms: lista de classes de algoritmos de cache
+            capacities: capacidades a avaliar, em textos
+                        (padrão: 20 pontos de 1 ao total de textos)
+            byte_budgets: orçamentos de memória em bytes; se informados,
+                          substituem capacities (convertidos pelo tamanho médio)
+            num_users: número de usuários por padrão
+            requests_per_user: número de requisições por usuário
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            pattern_params: parâmetros por padrão
+            trace_capacity: capacidade usada para gerar as sequências ('loop'),
+                            fixa para que a carga não mude com a capacidade
+            max_workers: número de processos (padrão: número de CPUs)
+            warmup: requisições de aquecimento antes das medidas (padrão:
+                    SWEEP_WARMUP_PER_TEXT por texto do corpus; 0 desativa).
+                    'fill' não é aceito: as maiores capacidades nunca enchem
+            
+        Returns:
+            dict: 'capacities', 'warmup', 'bytes' (ou None), 'mean_text_size', 'patterns',
+                  'hit_rates' ({alg: {padrão: array}}), 'overall' ({alg: array},
+                  média dos padrões), 'knees' ({alg: capacidade do joelho ou None})
+                  e 'pattern_knees' ({alg: {padrão: joelho}})
+            
+        Raises:
+            ValueError: se houver orçamentos em bytes e o loader não informar
+                        o tamanho dos textos, se algum orçamento não couber
+                        nem um texto médio ou se o aquecimento for inválido
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+        mean_size = self.mean_text_size()
+        
+        if warmup is None:
+            warmup = SWEEP_WARMUP_PER_TEXT * self.total_texts
+        if isinstance(warmup, str) or warmup < 0:
+            raise ValueError(f"Aquecimento inválido: {warmup}. "
+                             f"Use um número de requisições (0 desativa)")
+        warmup = int(warmup)
+        
+        if byte_budgets is not None:
+            if not mean_size:
+                raise ValueError("O loader não informa o tamanho dos textos; "
+                                 "use capacidades em número de textos")
+            too_small = [budget for budget in byte_budgets if budget < mean_size]
+            if too_small:
+                raise ValueError(f"Orçamentos menores que um texto médio "
+                                 f"({format_bytes(mean_size)}): "
+                                 f"{', '.join(format_bytes(b) for b in too_small)}")
+            capacities = [budget // mean_size for budget in byte_budgets]
+            if len(set(capacities)) < len(capacities):
+                print(f"⚠️  Orçamentos diferentes dão a mesma capacidade e são avaliados uma "
+                      f"vez (capacidades: {', '.join(str(int(c)) for c in capacities)})")
+        if capacities is None:
+            capacities = np.linspace(1, self.total_texts, 20).round()
+        capacities = np.unique(np.maximum(np.asarray(capacities, dtype=np.int64), 1))
+        
+        traces = {(pattern, user_id): self.generate_user_trace(
+                      pattern, user_id, warmup + requests_per_user, trace_capacity,
+                      pattern_params)[0]
+                  for pattern in patterns
+                  for user_id in range(1, num_users + 1)}
+        
+        # Maiores capacidades primeiro: são as células mais lentas
+        cells = [(cache_class, int(capacity), pattern, user_id)
+                 for capacity in capacities[::-1]
+                 for cache_class in algorithms
+                 for pattern, user_id in traces]
+        
+        # Células já concluídas em um checkpoint não são simuladas de novo
+        completed = self.checkpoint.completed if self.checkpoint else {}
+        finished = {key[1:]: hits for key, hits in completed.items() if key[0] == 'sweep'}
+        cell_keys = [(cache_class.__name__, capacity, pattern, user_id)
+                     for cache_class, capacity, pattern, user_id in cells]
+        pending = [cell for cell, key in zip(cells, cell_keys) if key not in finished]
+        
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        
+        print(f"\n📐 Varrendo {len(capacities)} capacidades × {len(algorithms)} algoritmos "
+              f"({len(pending)} de {len(cells)} células) em {workers} processos, "
+              f"com {warmup} requisições de aquecimento...")
+        start_time = time.time()
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker,
+                                 initargs=(traces, warmup)) as executor:
+            for cell, hits in zip(pending, executor.map(_sweep_cell, pending,
+                                                        chunksize=chunksize)):
+                key = (cell[0].__name__,) + cell[1:]
+                finished[key] = hits
+                if self.checkpoint:
+                    self.checkpoint.record(('sweep',) + key, hits)
+        
+        hit_rates = {cls.__name__: {p: np.zeros(len(capacities)) for p in patterns}
+                     for cls in algorithms}
+        index = {int(capacity): i for i, capacity in enumerate(capacities)}
+        
+        for algorithm, capacity, pattern, user_id in cell_keys:
+            hit_rates[algorithm][pattern][index[capacity]] += \
+                finished[algorithm, capacity, pattern, user_id] \
+                / (len(traces[pattern, user_id]) - warmup) * 100 / num_users
+        
+        print(f"✅ Varredura concluída em {time.time() - start_time:.2f}s")
+        
+        overall = {alg: np.mean(list(curves.values()), axis=0)
+                   for alg, curves in hit_rates.items()}
+        
+        return {
+            'capacities': capacities,
+            'warmup': warmup,
+            'bytes': capacities * mean_size if mean_size else None,
+            'mean_text_size': mean_size,
+            'patterns': list(patterns),
+            'hit_rates': hit_rates,
+            'overall': overall,
+            'knees': {alg: find_knee(capacities, curve) for alg, curve in overall.items()},
+            'pattern_knees': {alg: {p: find_knee(capacities, curve) for p, curve in curves.items()}
+                              for alg, curves in hit_rates.items()}
+        }
+    
+    def simulate_shared_cache(self, cache_class, cache_capacity: int = 10,
+                              num_users: int = 8, requests_per_user: int = 200,
+                              pattern: str = 'zipf', mode: str = 'threads',
+                              pattern_params: Dict[str, Dict] = None,
+                              arrival_rate: float = 10.0, verbose: bool = True) -> Dict:
+        """
+        Simula vários usuários acessando UMA instância compartilhada do cache
+        
+        Modos:
+        - 'threads': uma thread por usuário; o cache (que não é thread-safe)
+          é protegido por um lock e o tempo de espera pelo lock é medido.
+          A leitura de um miss acontece fora do lock: a política é
+          atualizada com a entrada sem conteúdo, que é preenchida quando a
+          leitura termina; quem pede o texto nesse meio-tempo espera a
+          leitura em curso em vez de ler de novo
+        - 'interleaved': as sequências dos usuários recebem instantes de
+          chegada Poisson (arrival_rate req/s por usuário) e são intercaladas
+          em ordem de tempo virtual; o resultado é determinístico
+        
+        Args:
+            cache_class: classe do algoritmo de cache
+            cache_capacity: capacidade do cache compartilhado
+            num_users: número de usuários simultâneos
+            requests_per_user: número de requisições por usuário
+            pattern: padrão de acesso de todos os usuários
+            mode: 'threads' ou 'interleaved'
+            pattern_params: parâmetros por padrão
+            arrival_rate: taxa de chegada por usuário no modo 'interleaved'
+            verbose: exibe o resultado
+            
+        Returns:
+            dict: hit rate agregado e por usuário, vazão e espera pelo lock
+            
+        Raises:
+            ValueError: se o modo for inválido
+        """
+        if mode not in ('threads', 'interleaved'):
+            raise ValueError(f"Modo inválido: {mode}. Use 'threads' ou 'interleaved'")
+        
+        cache = cache_class(capacity=cache_capacity)
+        cache.clear()
+        
+        load_from_disk = self._loader_function()
+        
+        user_ids = list(range(1, num_users + 1))
+        traces = [self.generate_user_trace(pattern, user_id, requests_per_user,
+                                           cache_capacity, pattern_params)[0]
+                  for user_id in user_ids]
+        
+        user_hits = np.zeros(num_users, dtype=np.int64)
+        user_requests = np.array([len(t) for t in traces], dtype=np.int64)
+        lock_wait = np.zeros(num_users, dtype=np.float64)
+        virtual_duration = 0.0
+        
+        start_time = time.perf_counter()
+        
+        if mode == 'threads':
+            lock = threading.Lock()
+            in_flight = {}     # Texto -> Event da leitura em curso
+            
+            def run_user(index: int):
+                hits = 0
+                waited = 0.0
+                for text_num in traces[index].tolist():
+                    t0 = time.perf_counter()
+                    with lock:
+                        waited += time.perf_counter() - t0
+                        content, load_time, was_hit = cache.get(text_num, _pending_content)
+                        reading = in_flight.get(text_num)
+                        if reading is None and not was_hit:
+                            in_flight[text_num] = threading.Event()
+                    hits += was_hit
+                    
+                    if reading is not None:
+                        # Outro usuário já está lendo este texto
+                        reading.wait()
+                    elif not was_hit:
+                        content, load_time = load_from_disk(text_num)
+                        t0 = time.perf_counter()
+                        with lock:
+                            waited += time.perf_counter() - t0
+                            # Sem efeito se o texto saiu do cache durante a leitura
+                            cache._replace_content(text_num, content)
+                            in_flight.pop(text_num).set()
+                user_hits[index] = hits
+                lock_wait[index] = waited
+            
+            threads = [threading.Thread(target=run_user, args=(i,)) for i in range(num_users)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        else:
+            arrivals = [RequestGenerator(self.total_texts, seed=self.seed).for_user(user_id)
+                        .generate_arrivals(len(trace), 'poisson', arrival_rate)
+                        for user_id, trace in zip(user_ids, traces)]
+            
+            all_arrivals = np.concatenate(arrivals)
+            all_texts = np.concatenate(traces)
+            all_users = np.repeat(np.arange(num_users), user_requests)
+            order = np.argsort(all_arrivals, kind='stable')
+            
+            was_hit = np.empty(len(order), dtype=bool)
+            for i, text_num in enumerate(all_texts[order].tolist()):
+                content, load_time, was_hit[i] = cache.get(text_num, load_from_disk)
+            
+            user_hits = np.bincount(all_users[order][was_hit], minlength=num_users)
+            if len(all_arrivals):
+                virtual_duration = float(all_arrivals.max())
+        
+        total_time = time.perf_counter() - start_time
+        metrics = cache.get_metrics()
+        total_requests = int(user_requests.sum())
+        
+        result = {
+            'mode': mode,
+            'algorithm': cache_class.__name__,
+            'pattern': pattern,
+            'num_users': num_users,
+            'total_requests': total_requests,
+            'hits': metrics['hits'],
+            'misses': metrics['misses'],
+            'hit_rate': metrics['hit_rate'],
+            'per_user': [
+                {'user_id': user_id,
+                 'requests': int(user_requests[i]),
+                 'hits': int(user_hits[i]),
+                 'hit_rate': user_hits[i] / user_requests[i] * 100 if user_requests[i] else 0}
+                for i, user_id in enumerate(user_ids)
+            ],
+            'simulation_time': total_time,
+            'throughput': total_requests / total_time if total_time > 0 else 0.0,
+            'lock_wait_total': float(lock_wait.sum()),
+            'lock_wait_mean': float(lock_wait.sum() / total_requests) if total_requests else 0.0,
+            'virtual_duration': virtual_duration
+        }
+        
+        if verbose:
+            rates = [u['hit_rate'] for u in result['per_user']]
+            print(f"  {cache_class.__name__:<12} [{mode}] {num_users} usuários: "
+                  f"{result['hit_rate']:.1f}% hit rate "
+                  f"(usuários: {min(rates):.1f}%-{max(rates):.1f}%), "
+                  f"{result['throughput']:,.0f} req/s, "
+                  f"espera no lock {result['lock_wait_mean']*1e6:.1f}µs/req")
+        
+        return result
+    
     def simulate_algorithm(self, cache_class, cache_capacity: int = 10,
-                          num_users: int = 3, requests_per_user: int = 200) -> List[Dict]:
+                          num_users: int = 3, requests_per_user: int = 200,
+                          patterns: List[str] = None,
+                          pattern_params: Dict[str, Dict] = None,
+                          warmup=0) -> List[Dict]:
         """
         Simula um algoritmo com múltiplos usuários e padrões
         
@@ -116,6 +1241,9 @@ class SimulationEngine:
             cache_capacity: capacidade do cache
             num_users: número de usuários a simular por padrão
             requests_per_user: número de requisições por usuário
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            pattern_params: parâmetros por padrão, ex.: {'zipf': {'exponent': 1.2}}
+            warmup: aquecimento (número de requisições ou 'fill')
             
         Returns:
             list: lista de resultados de todas as simulações
@@ -125,22 +1253,15 @@ class SimulationEngine:
         print(f"Simulando algoritmo: {algorithm_name}")
         print(f"{'='*70}")
         
-        patterns = ['random', 'poisson', 'weighted']
+        patterns = patterns or DEFAULT_PATTERNS
         results = []
         
         for pattern in patterns:
             print(f"\nPadrão de acesso: {pattern.upper()}")
             
             for user_id in range(1, num_users + 1):
-                # Cria nova instância do cache para cada usuário
-                cache = cache_class(capacity=cache_capacity)
-                
-                # Gera requisições para este usuário
-                generator = RequestGenerator(total_texts=100, seed=user_id * 100)
-                requests = generator.generate_user_requests(requests_per_user, pattern)
-                
-                # Simula o usuário
-                result = self.simulate_user(cache, requests, user_id, pattern)
+                result = self.simulate_cell(cache_class, pattern, user_id, cache_capacity,
+                                            requests_per_user, pattern_params, warmup=warmup)
                 results.append(result)
         
         print(f"\n✓ Simulação de {algorithm_name} concluída!")
@@ -151,7 +1272,10 @@ class SimulationEngine:
     def simulate_all_algorithms(self, algorithms: List, 
                                cache_capacity: int = 10,
                                num_users: int = 3, 
-                               requests_per_user: int = 200) -> Dict[str, List[Dict]]:
+                               requests_per_user: int = 200,
+                               patterns: List[str] = None,
+                               pattern_params: Dict[str, Dict] = None,
+                               warmup=0) -> Dict[str, List[Dict]]:
         """
         Simula todos os algoritmos fornecidos
         
@@ -160,6 +1284,9 @@ class SimulationEngine:
             cache_capacity: capacidade do cache
             num_users: número de usuários por padrão
             requests_per_user: número de requisições por usuário
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            pattern_params: parâmetros por padrão, ex.: {'zipf': {'exponent': 1.2}}
+            warmup: aquecimento (número de requisições ou 'fill')
             
         Returns:
             dict: resultados organizados por algoritmo
@@ -171,17 +1298,24 @@ class SimulationEngine:
         print(f"  Capacidade do cache: {cache_capacity} textos")
         print(f"  Usuários por padrão: {num_users}")
         print(f"  Requisições por usuário: {requests_per_user}")
-        print(f"  Padrões de acesso: random, poisson, weighted")
+        patterns = patterns or DEFAULT_PATTERNS
+        print(f"  Padrões de acesso: {', '.join(patterns)}")
         print(f"  Algoritmos: {', '.join([alg.__name__ for alg in algorithms])}")
+        if warmup:
+            print(f"  Aquecimento: {'até o cache encher' if warmup == 'fill' else f'{warmup} requisições'}")
         
         all_results = {}
+        self.aggregator = StreamingAggregator()
         
         for cache_class in algorithms:
             results = self.simulate_algorithm(
                 cache_class, 
                 cache_capacity, 
                 num_users, 
-                requests_per_user
+                requests_per_user,
+                patterns,
+                pattern_params,
+                warmup
             )
             all_results[cache_class.__name__] = results
         
@@ -191,40 +1325,149 @@ class SimulationEngine:
         
         # Salva resultados
         self.results = all_results
+        self.confidence = {}
         
         return all_results
     
+    def simulate_until_confident(self, algorithms: List, cache_capacity: int = 10,
+                                 requests_per_user: int = 200, patterns: List[str] = None,
+                                 pattern_params: Dict[str, Dict] = None,
+                                 target_width: float = 2.0, min_users: int = 5,
+                                 max_users: int = 30, batch_size: int = 3,
+                                 confidence: float = 0.95, warmup=0) -> Dict[str, List[Dict]]:
+        """
+        Simula usuários (sementes) até o ranking de cada padrão ficar claro
+        
+        Para cada padrão, simula min_users usuários em todos os algoritmos e
+        calcula o intervalo de confiança por bootstrap da diferença de hit
+        rate entre os dois primeiros (pareado por usuário). Enquanto o
+        intervalo for mais largo que target_width pontos percentuais, simula
+        mais batch_size usuários, até max_users. Padrões com um vencedor
+        claro param cedo; o esforço vai para os padrões ainda indecisos.
+        
+        Args:
+            algorithms: lista de classes de algoritmos de cache
+            cache_capacity: capacidade do cache
+            requests_per_user: número de requisições por usuário
+            patterns: padrões de acesso (padrão: random, poisson, weighted)
+            pattern_params: parâmetros por padrão
+            target_width: largura máxima do intervalo, em pontos percentuais
+            min_users: usuários simulados antes da primeira avaliação (pelo
+                       menos MIN_BOOTSTRAP_USERS: com menos amostras o bootstrap
+                       subestima a largura do intervalo)
+            max_users: limite de usuários por padrão
+            batch_size: usuários acrescentados a cada rodada
+            confidence: nível de confiança do intervalo
+            warmup: aquecimento (número de requisições ou 'fill'); a
+                    comparação usa o hit rate em regime, ou o da sequência
+                    inteira se nenhum usuário tiver requisições em regime
+            
+        Returns:
+            dict: resultados organizados por algoritmo, no formato de
+                  simulate_all_algorithms; a comparação dos líderes de cada
+                  padrão fica em self.confidence
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+        min_users = min(max(min_users, MIN_BOOTSTRAP_USERS), max_users)
+        all_results = {cache_class.__name__: [] for cache_class in algorithms}
+        self.confidence = {}
+        self.aggregator = StreamingAggregator()
+        
+        print("\n" + "🎲"*35)
+        print("SIMULAÇÃO COM REPETIÇÃO ADAPTATIVA")
+        print("🎲"*35)
+        print(f"\nMeta: IC{confidence*100:.0f}% da diferença entre os líderes com largura "
+              f"≤ {target_width:.1f} pp ({min_users} a {max_users} usuários por padrão)")
+        
+        for pattern in patterns:
+            samples = {cache_class.__name__: [] for cache_class in algorithms}
+            full_samples = {cache_class.__name__: [] for cache_class in algorithms}
+            num_users = 0
+            
+            while True:
+                batch = min(min_users if num_users == 0 else batch_size, max_users - num_users)
+                for user_id in range(num_users + 1, num_users + batch + 1):
+                    for cache_class in algorithms:
+                        result = self.simulate_cell(cache_class, pattern, user_id, cache_capacity,
+                                                    requests_per_user, pattern_params,
+                                                    verbose=False, warmup=warmup)
+                        all_results[cache_class.__name__].append(result)
+                        samples[cache_class.__name__].append(result['steady_hit_rate'])
+                        full_samples[cache_class.__name__].append(result['hit_rate'])
+                num_users += batch
+                
+                # Usuários sem regime ficam fora; sem nenhum, compara a sequência inteira
+                steady = leader_comparison(samples, confidence)
+                comparison = (steady if steady['num_samples']
+                              else leader_comparison(full_samples, confidence))
+                if comparison['width'] <= target_width or num_users >= max_users or batch == 0:
+                    break
+            
+            comparison['num_users'] = num_users
+            comparison['converged'] = comparison['width'] <= target_width
+            self.confidence[pattern] = comparison
+            
+            status = "✓" if comparison['converged'] else "⚠️  limite de usuários atingido,"
+            if steady['num_samples'] < num_users:
+                print(f"  ⚠️  {pattern}: {num_users - steady['num_samples']} usuário(s) "
+                      f"sem requisições em regime (o cache não encheu no aquecimento)")
+            print(f"  {pattern:<10} {num_users:>3} usuários {status} "
+                  f"{comparison['leader']} - {comparison['runner_up']}: "
+                  f"{comparison['difference']:+.2f} pp "
+                  f"[{comparison['ci_low']:+.2f}, {comparison['ci_high']:+.2f}]")
+        
+        self.results = all_results
+        return all_results
+    
     def get_summary_statistics(self) -> Dict:
         """
         Calcula estatísticas resumidas dos resultados
         
+        As estatísticas vêm do agregador incremental (self.aggregator),
+        alimentado durante a simulação; resultados atribuídos diretamente a
+        self.results (ex.: lidos do banco) são agregados na primeira chamada.
+        
         Returns:
-            dict: estatísticas por algoritmo e padrão
+            dict: estatísticas por algoritmo e padrão (veja
+                  StreamingAggregator.summary)
         """
         if not self.results:
             return {}
         
-        summary = {}
+        if not self.aggregator.groups:
+            self.aggregator = StreamingAggregator.from_results(self.results)
         
-        for algorithm, results in self.results.items():
-            summary[algorithm] = {}
-            
-            # Agrupa por padrão
-            patterns = set(r['pattern'] for r in results)
+        return self.aggregator.summary()
+    
+    def leader_comparisons(self, summary: Dict = None) -> Dict[str, Dict]:
+        """
+        Compara os dois melhores algoritmos de cada padrão
+        
+        Usa a comparação da repetição adaptativa (self.confidence) quando
+        houver; senão, calcula o IC por bootstrap sobre o hit rate de cada
+        usuário (em regime, se houver aquecimento e dados em regime; veja
+        steady_state_ranking).
+        
+        Args:
+            summary: estatísticas resumidas (padrão: get_summary_statistics)
             
-            for pattern in patterns:
-                pattern_results = [r for r in results if r['pattern'] == pattern]
-                
-                summary[algorithm][pattern] = {
-                    'avg_hit_rate': sum(r['hit_rate'] for r in pattern_results) / len(pattern_results),
-                    'avg_miss_rate': sum(r['miss_rate'] for r in pattern_results) / len(pattern_results),
-                    'avg_load_time': sum(r['avg_load_time'] for r in pattern_results) / len(pattern_results),
-                    'total_hits': sum(r['hits'] for r in pattern_results),
-                    'total_misses': sum(r['misses'] for r in pattern_results),
-                    'num_users': len(pattern_results)
-                }
+        Returns:
+            dict: {padrão: resultado de leader_comparison}
+        """
+        if summary is None:
+            summary = self.get_summary_statistics()
         
-        return summary
+        comparisons = {}
+        for pattern in dict.fromkeys(p for data in summary.values() for p in data):
+            if pattern in self.confidence:
+                comparisons[pattern] = self.confidence[pattern]
+                continue
+            samples_key = ('user_steady_hit_rates' if steady_state_ranking(summary, pattern)
+                           else 'user_hit_rates')
+            samples = {algorithm: patterns_data[pattern][samples_key]
+                       for algorithm, patterns_data in summary.items() if pattern in patterns_data}
+            comparisons[pattern] = leader_comparison(samples)
+        return comparisons
     
     def print_summary(self):
         """Exibe um resumo dos resultados"""
@@ -238,30 +1481,179 @@ class SimulationEngine:
         print("RESUMO DOS RESULTADOS")
         print("="*70)
         
-        patterns = ['random', 'poisson', 'weighted']
+        patterns = dict.fromkeys(p for data in summary.values() for p in data)
+        
+        # Com aquecimento, o ranking usa o hit rate em regime
+        has_warmup = any(stats['total_warmup_requests'] for data in summary.values()
+                         for stats in data.values())
+        comparisons = self.leader_comparisons(summary)
         
         for pattern in patterns:
+            steady = steady_state_ranking(summary, pattern)
+            rank_key = 'avg_steady_hit_rate' if steady else 'avg_hit_rate'
+            ci_key = 'steady_hit_rate_ci' if steady else 'hit_rate_ci'
+            
             print(f"\n{'='*70}")
             print(f"Padrão: {pattern.upper()}")
             print(f"{'='*70}")
-            print(f"{'Algoritmo':<15} {'Hit Rate':<12} {'Avg Time':<12} {'Hits':<10} {'Misses':<10}")
+            if has_warmup:
+                print(f"{'Algoritmo':<15} {'Hit Rate':<10} {'HR regime':<10} {'± IC95':<8} "
+                      f"{'Avg Time':<10} {'T regime':<10} {'Misses aq.':<10}")
+            else:
+                print(f"{'Algoritmo':<15} {'Hit Rate':<10} {'± IC95':<9} {'Avg Time':<12} "
+                      f"{'Hits':<10} {'Misses':<10}")
             print("-"*70)
             
             for algorithm, patterns_data in summary.items():
-                if pattern in patterns_data:
-                    data = patterns_data[pattern]
+                if pattern not in patterns_data:
+                    continue
+                data = patterns_data[pattern]
+                low, high = data[ci_key]
+                half_width = f"±{(high - low) / 2:.2f}"
+                if has_warmup:
+                    steady_rate = (f"{data['avg_steady_hit_rate']:>6.2f}%"
+                                   if data['num_steady_users'] else f"{'-':>7}")
+                    steady_time = (f"{data['avg_steady_load_time']:>8.4f}s"
+                                   if data['num_steady_users'] else f"{'-':>9}")
+                    print(f"{algorithm:<15} "
+                          f"{data['avg_hit_rate']:>6.2f}%   "
+                          f"{steady_rate}   "
+                          f"{half_width:<8} "
+                          f"{data['avg_load_time']:>8.4f}s "
+                          f"{steady_time}  "
+                          f"{data['total_warmup_misses']:<10}")
+                else:
                     print(f"{algorithm:<15} "
-                          f"{data['avg_hit_rate']:>6.2f}%     "
+                          f"{data['avg_hit_rate']:>6.2f}%   "
+                          f"{half_width:<9} "
                           f"{data['avg_load_time']:>8.4f}s    "
                           f"{data['total_hits']:<10} "
                           f"{data['total_misses']:<10}")
             
-            # Determina o melhor algoritmo para este padrão
-            best_algo = max(summary.items(), 
-                           key=lambda x: x[1].get(pattern, {}).get('avg_hit_rate', 0))
-            if pattern in best_algo[1]:
-                print(f"\n🏆 Melhor: {best_algo[0]} "
-                      f"({best_algo[1][pattern]['avg_hit_rate']:.2f}% hit rate)")
+            without_steady = sum(data[pattern]['num_users'] - data[pattern]['num_steady_users']
+                                 for data in summary.values() if pattern in data)
+            if has_warmup and without_steady:
+                print(f"⚠️  {without_steady} célula(s) sem requisições em regime (o cache não "
+                      f"encheu no aquecimento): fora das médias em regime"
+                      + ("" if steady else "; o ranking usa o hit rate da sequência inteira"))
+            
+            # Percentis do histograma de latência do agregador
+            latencies = " · ".join(
+                f"{algorithm} {patterns_data[pattern]['p50_load_time']*1000:.2f}/"
+                f"{patterns_data[pattern]['p99_load_time']*1000:.2f}"
+                for algorithm, patterns_data in summary.items() if pattern in patterns_data)
+            print(f"⏱️  Latência p50/p99 (ms): {latencies}")
+            
+            # Determina o melhor algoritmo e se a vantagem é estatisticamente clara
+            comparison = comparisons[pattern]
+            best = comparison['leader']
+            label = "hit rate em regime" if steady else "hit rate"
+            print(f"\n🏆 Melhor: {best} ({summary[best][pattern][rank_key]:.2f}% {label}, "
+                  f"{summary[best][pattern]['num_users']} usuários)")
+            
+            if comparison['runner_up'] != best:
+                interval = (f"{comparison['difference']:+.2f} pp, "
+                            f"IC{comparison['confidence']*100:.0f}% [{comparison['ci_low']:+.2f}, {comparison['ci_high']:+.2f}]")
+                if comparison['separated']:
+                    print(f"   Vantagem sobre {comparison['runner_up']}: {interval}")
+                else:
+                    print(f"⚖️  Empate estatístico com {comparison['runner_up']}: {interval}")
+        
+        self.print_scan_resistance(summary)
+    
+    def print_scan_resistance(self, summary: Dict):
+        """
+        Exibe quanto do hot set cada algoritmo mantém após as varreduras
+        
+        Args:
+            summary: estatísticas resumidas (get_summary_statistics)
+        """
+        scan_patterns = dict.fromkeys(
+            pattern for data in summary.values()
+            for pattern, stats in data.items() if 'avg_hot_set_after_scan' in stats)
+        
+        for pattern in scan_patterns:
+            print(f"\n{'='*70}")
+            print(f"RESISTÊNCIA A VARREDURAS - Padrão: {pattern.upper()}")
+            print(f"{'='*70}")
+            print(f"{'Algoritmo':<15} {'Hot set antes':<15} {'Hot set depois':<16} {'Retido':<10}")
+            print("-"*70)
+            
+            for algorithm, patterns_data in summary.items():
+                data = patterns_data.get(pattern, {})
+                if 'avg_hot_set_after_scan' not in data:
+                    continue
+                before = data['avg_hot_set_before_scan']
+                after = data['avg_hot_set_after_scan']
+                kept = after / before * 100 if before > 0 else 0
+                print(f"{algorithm:<15} "
+                      f"{before:>6.1f}%         "
+                      f"{after:>6.1f}%          "
+                      f"{kept:>6.1f}%")
+            
+            best_algo = max(
+                (item for item in summary.items() if 'avg_hot_set_after_scan' in item[1].get(pattern, {})),
+                key=lambda x: x[1][pattern]['avg_hot_set_after_scan'])
+            print(f"\n🛡️  Mais resistente: {best_algo[0]} "
+                  f"({best_algo[1][pattern]['avg_hot_set_after_scan']:.1f}% do hot set após a varredura)")
+
+
+def _unknown_size(text_number: int) -> Tuple[int, float]:
+    """Consulta de tamanho para loaders que não informam o tamanho dos textos"""
+    return 0, 0.0
+
+
+def _pending_content(text_number: int) -> Tuple[None, float]:
+    """Loader do cache compartilhado: a leitura real acontece fora do lock"""
+    return None, 0.0
+
+
+# Motor de cada processo do simulate_all_algorithms_parallel
+_worker_engine = None
+
+
+def _init_worker(text_loader, seed: int, keys_only: bool = False, keep_access_log: bool = True,
+                 virtual_clock: bool = False, disk_profile=None):
+    """Cria o motor de simulação do processo worker"""
+    global _worker_engine
+    _worker_engine = SimulationEngine(text_loader, seed, keys_only, keep_access_log,
+                                      virtual_clock, disk_profile)
+
+
+def _simulate_cell(cell: tuple) -> Dict:
+    """Simula uma célula no worker"""
+    cache_class, pattern, user_id, cache_capacity, requests_per_user, pattern_params, warmup = cell
+    return _worker_engine.simulate_cell(cache_class, pattern, user_id, cache_capacity,
+                                        requests_per_user, pattern_params, verbose=False,
+                                        warmup=warmup)
+
+
+# Sequências compartilhadas pelos workers do simulate_capacity_sweep
+_worker_traces = None
+_worker_warmup = 0
+
+
+def _init_sweep_worker(traces: Dict, warmup: int = 0):
+    """Recebe as sequências geradas uma única vez pelo processo principal"""
+    global _worker_traces, _worker_warmup
+    _worker_traces = traces
+    _worker_warmup = warmup
+
+
+def _sweep_cell(cell: tuple) -> int:
+    """
+    Simula uma célula da varredura só com chaves e devolve o número de
+    hits após as requisições de aquecimento
+    """
+    cache_class, capacity, pattern, user_id = cell
+    cache = cache_class(capacity=capacity)
+    requests = _worker_traces[pattern, user_id].tolist()
+    for text_num in requests[:_worker_warmup]:
+        cache.get(text_num, _unknown_size)
+    warmup_hits = cache.hits
+    for text_num in requests[_worker_warmup:]:
+        cache.get(text_num, _unknown_size)
+    return cache.hits - warmup_hits
 
 
 # Teste do motor de simulação
@@ -296,6 +1688,13 @@ if __name__ == "__main__":
     # Exibe resumo
     engine.print_summary()
     
+    # Cache compartilhado: as leituras acontecem fora do lock, então a vazão
+    # cresce com o número de usuários
+    print("\nCache compartilhado (threads):")
+    for num_users in (1, 4):
+        engine.simulate_shared_cache(LRUCache, cache_capacity=5, num_users=num_users,
+                                     requests_per_user=50)
+    
     print("\n" + "="*70)
     print("Teste concluído! ✅")
     print("="*70)
\ No newline at end of file
@@ -7,11 +7,17 @@ Aluno D - Módulo de Simulação
 
 import sys
 from pathlib import Path
+from typing import Dict, List
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from simulation.simulation_engine import SimulationEngine
+from simulation.simulation_engine import SimulationEngine, MIN_BOOTSTRAP_USERS
+from simulation.aggregator import steady_state_ranking
+from simulation.request_generator import DEFAULT_PATTERNS
 from simulation.report_generator import ReportGenerator
+from simulation.capacity_sweep import print_capacity_sweep
+from simulation.checkpoint import SimulationCheckpoint
+from simulation.results_store import ResultsStore
 from core.text_loader import TextLoader
 from algorithms.fifo_cache import FIFOCache
 from algorithms.lru_cache import LRUCache
@@ -19,10 +25,37 @@ from algorithms.lfu_cache import LFUCache
 from algorithms.arc_cache import ARCCache
 
 
+# Descrição de cada padrão na recomendação por cenário
+PATTERN_SCENARIOS = {
+    'random': 'acesso ALEATÓRIO (navegação exploratória)',
+    'poisson': 'acesso com POISSON (padrão com concentração)',
+    'weighted': 'acesso PONDERADO (documentos favoritos)',
+    'zipf': 'acesso ZIPF (popularidade realista, cauda longa)',
+    'drifting': 'HOTSPOT MÓVEL (interesse que se desloca aos poucos)',
+    'phases': 'acesso em FASES (popularidade muda ao longo do dia)',
+    'scan': 'HOT SET com VARREDURAS (exportações em lote)',
+    'loop': 'LAÇO CÍCLICO maior que o cache'
+}
+
+
 def run_simulation_mode(loader: TextLoader, 
                        cache_capacity: int = 10,
                        num_users: int = 3,
-                       requests_per_user: int = 200):
+                       requests_per_user: int = 200,
+                       patterns: List[str] = None,
+                       pattern_params: Dict[str, Dict] = None,
+                       parallel: bool = False,
+                       max_workers: int = None,
+                       keys_only: bool = False,
+                       warmup=0,
+                       target_ci_width: float = None,
+                       max_users: int = 30,
+                       checkpoint_path: str = None,
+                       resume: bool = True,
+                       checkpoint_interval: float = 60.0,
+                       store_path: str = None,
+                       keep_access_log: bool = True,
+                       virtual_clock: bool = False):
     """
     Executa o modo de simulação completo
     
@@ -31,18 +64,55 @@ def run_simulation_mode(loader: TextLoader,
         cache_capacity: capacidade do cache
         num_users: número de usuários por padrão
         requests_per_user: número de requisições por usuário
+        patterns: padrões de acesso (padrão: random, poisson, weighted)
+        pattern_params: parâmetros por padrão, ex.: {'zipf': {'exponent': 1.2}}
+        parallel: distribui a grade de simulação em vários processos
+        max_workers: número de processos no modo paralelo (padrão: CPUs)
+        keys_only: simula só com chaves e tamanhos, sem ler os textos
+                   (mesmos hits e misses; tempos de carregamento ficam zerados)
+        warmup: aquecimento de cada usuário antes do regime: número de
+                requisições, ou 'fill' para aquecer até o cache encher.
+                Os misses do aquecimento são reportados à parte e o
+                ranking usa o hit rate em regime
+        target_ci_width: se informado, simula usuários até o IC95% da
+                         diferença entre os dois melhores algoritmos de cada
+                         padrão ter no máximo essa largura (em pontos
+                         percentuais); num_users vira o mínimo por padrão
+        max_users: limite de usuários por padrão com target_ci_width
+        checkpoint_path: arquivo onde o progresso é salvo periodicamente e
+                         ao interromper (Ctrl+C); None desativa o checkpoint
+        resume: continua de um checkpoint existente com a mesma configuração
+        checkpoint_interval: intervalo mínimo entre gravações, em segundos
+        store_path: banco SQLite de resultados (ResultsStore); células já
+                    salvas com a mesma configuração não são simuladas de
+                    novo, e resumo, gráficos e recomendação são lidos do banco
+        keep_access_log: mantém o log por requisição em cada resultado; resumo
+                         e gráficos usam só o agregador incremental, então
+                         False economiza memória (e espaço no banco)
+        virtual_clock: tempos de carregamento no relógio virtual: os textos
+                       não são lidos e cada miss custa a leitura modelada pelo
+                       perfil de disco do loader, em vez do tempo de parede
     """
+    patterns = patterns or DEFAULT_PATTERNS
+
     print("\n" + "🎯"*35)
     print("MODO DE SIMULAÇÃO ATIVADO")
     print("🎯"*35)
     
-    print("""
+    if target_ci_width:
+        users_line = (f"Simular de {min(max(num_users, MIN_BOOTSTRAP_USERS), max_users)} a {max_users} usuários "
+                      f"por padrão (IC95% ≤ {target_ci_width:g} pp)")
+    else:
+        users_line = f"Simular {num_users} usuários para cada algoritmo"
+    patterns_line = f"Testar {len(patterns)} padrões de acesso diferentes"
+    
+    print(f"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║                    SISTEMA DE ANÁLISE DE CACHE                   ║
 ║                                                                  ║
 ║  Este modo irá:                                                  ║
-║  • Simular 3 usuários para cada algoritmo                        ║
-║  • Testar 3 padrões de acesso diferentes                         ║
+║  • {users_line:<62}║
+║  • {patterns_line:<62}║
 ║  • Medir cache hits, misses e tempos de carregamento             ║
 ║  • Gerar relatórios visuais comparativos                         ║
 ║                                                                  ║
@@ -59,34 +129,93 @@ def run_simulation_mode(loader: TextLoader,
 ╚══════════════════════════════════════════════════════════════════╝
     """)
     
+    if patterns != DEFAULT_PATTERNS:
+        print(f"Padrões selecionados: {', '.join(patterns)}\n")
+    
     input("Pressione ENTER para iniciar a simulação...")
     
     # Inicializa componentes
     print("\n📊 Inicializando simulação...")
-    engine = SimulationEngine(loader)
+    engine = SimulationEngine(loader, keys_only=keys_only, keep_access_log=keep_access_log,
+                              virtual_clock=virtual_clock)
     
     # Define algoritmos a serem testados
     algorithms = [FIFOCache, LRUCache, LFUCache, ARCCache]
     
+    run_config = {
+        'mode': 'simulation',
+        'algorithms': [alg.__name__ for alg in algorithms],
+        'cache_capacity': cache_capacity,
+        'num_users': num_users,
+        'requests_per_user': requests_per_user,
+        'patterns': list(patterns),
+        'pattern_params': pattern_params,
+        'warmup': warmup,
+        'target_ci_width': target_ci_width,
+        'max_users': max_users,
+        'keys_only': keys_only,
+        'virtual_clock': virtual_clock,
+        'seed': engine.seed,
+        'total_texts': engine.total_texts
+    }
+    
+    # Progresso em disco: só é retomado pela mesma configuração
+    if checkpoint_path:
+        engine.checkpoint = SimulationCheckpoint.open(checkpoint_path, run_config,
+                                                      checkpoint_interval, resume)
+    
+    # Banco de resultados: células já simuladas são reaproveitadas
+    store = ResultsStore(store_path) if store_path else None
+    engine.store = store
+    
     # Executa simulação
     try:
-        results = engine.simulate_all_algorithms(
-            algorithms,
-            cache_capacity=cache_capacity,
-            num_users=num_users,
-            requests_per_user=requests_per_user
-        )
-        
-        # Exibe resumo textual
-        engine.print_summary()
+        if target_ci_width:
+            results = engine.simulate_until_confident(
+                algorithms,
+                cache_capacity=cache_capacity,
+                requests_per_user=requests_per_user,
+                patterns=patterns,
+                pattern_params=pattern_params,
+                target_width=target_ci_width,
+                min_users=num_users,
+                max_users=max_users,
+                warmup=warmup
+            )
+        elif parallel:
+            results = engine.simulate_all_algorithms_parallel(
+                algorithms,
+                cache_capacity=cache_capacity,
+                num_users=num_users,
+                requests_per_user=requests_per_user,
+                patterns=patterns,
+                pattern_params=pattern_params,
+                max_workers=max_workers,
+                warmup=warmup
+            )
+        else:
+            results = engine.simulate_all_algorithms(
+                algorithms,
+                cache_capacity=cache_capacity,
+                num_users=num_users,
+                requests_per_user=requests_per_user,
+                patterns=patterns,
+                pattern_params=pattern_params,
+                warmup=warmup
+            )
         
-        # Gera relatórios visuais
-        print("\n📈 Gerando relatórios visuais...")
-        report_gen = ReportGenerator(output_dir="docs")
-        report_gen.generate_full_report(results)
+        # Registra a execução e passa a ler os resultados do banco
+        if store is not None:
+            cell_configs = [engine.cell_config(algorithm, r['pattern'], r['user_id'],
+                                               cache_capacity, requests_per_user,
+                                               pattern_params, warmup)
+                            for algorithm, algorithm_results in results.items()
+                            for r in algorithm_results]
+            run_hash = store.save_run(run_config, cell_configs, engine.confidence)
+            engine.results = store.load_run(run_hash)
+            print(f"\n💾 Resultados salvos em {store.path} (execução {run_hash[:12]})")
         
-        # Análise e recomendação
-        print_recommendation(engine.get_summary_statistics())
+        generate_reports(engine, run_config)
         
         print("\n" + "="*70)
         print("✅ SIMULAÇÃO CONCLUÍDA COM SUCESSO!")
@@ -97,21 +226,112 @@ def run_simulation_mode(loader: TextLoader,
         print("  3. Configure o algoritmo escolhido para uso em produção")
         print("="*70)
         
+        if engine.checkpoint:
+            engine.checkpoint.remove()
+        
     except KeyboardInterrupt:
         print("\n\n⚠️  Simulação interrompida pelo usuário.")
-        print("Dados parciais podem ter sido salvos.")
+        print_checkpoint_status(engine.checkpoint)
     except Exception as e:
         print(f"\n\n❌ Erro durante a simulação: {e}")
         import traceback
         traceback.print_exc()
 
 
-def print_recommendation(summary: dict):
+def generate_reports(engine: SimulationEngine, run_config: Dict, output_dir: str = "docs"):
+    """
+    Exibe o resumo, gera os gráficos e imprime a recomendação de uma execução
+    
+    Args:
+        engine: motor com os resultados em engine.results
+        run_config: configuração da execução (run_simulation_mode)
+        output_dir: diretório dos gráficos
+    """
+    # Exibe resumo textual
+    engine.print_summary()
+    
+    # Gera relatórios visuais
+    print("\n📈 Gerando relatórios visuais...")
+    report_gen = ReportGenerator(output_dir=output_dir, pattern_params=run_config['pattern_params'])
+    report_gen.generate_full_report(engine.aggregator)
+    
+    # Curvas de miss ratio: todas as capacidades em uma passada por sequência
+    curves = engine.compute_miss_ratio_curves(
+        run_config['patterns'], run_config['num_users'], run_config['requests_per_user'],
+        run_config['cache_capacity'], run_config['pattern_params'])
+    report_gen.generate_miss_ratio_curves(curves, run_config['cache_capacity'])
+    
+    # Análise e recomendação
+    summary = engine.get_summary_statistics()
+    print_recommendation(summary, run_config['cache_capacity'],
+                         comparisons=engine.leader_comparisons(summary))
+
+
+def report_from_store(store_path: str = "results/resultados.db", run_hash: str = None,
+                      output_dir: str = "docs"):
+    """
+    Refaz resumo, gráficos e recomendação de uma execução salva, sem simular
+    
+    Args:
+        store_path: banco SQLite de resultados
+        run_hash: identificador (ou prefixo) da execução; padrão: a mais recente
+        output_dir: diretório dos gráficos
+    """
+    store = ResultsStore(store_path)
+    runs = {run['run_hash']: run for run in store.list_runs()}
+    
+    try:
+        results = store.load_run(run_hash)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return
+    
+    run_hash = next(h for h in runs if run_hash is None or h.startswith(run_hash))
+    run_config = runs[run_hash]['config']
+    print(f"📂 Execução {run_hash[:12]} lida de {store.path}")
+    
+    # Motor só para o resumo e as curvas (as sequências são regeneradas pela semente)
+    engine = SimulationEngine(None, seed=run_config['seed'])
+    engine.total_texts = run_config['total_texts']
+    engine.results = results
+    # ICs da repetição adaptativa, com o número de usuários de cada padrão
+    engine.confidence = runs[run_hash]['confidence']
+    
+    generate_reports(engine, run_config, output_dir)
+    store.close()
+
+
+def print_checkpoint_status(checkpoint: SimulationCheckpoint):
+    """
+    Salva o checkpoint após uma interrupção e informa o que foi preservado
+    
+    Args:
+        checkpoint: checkpoint da execução (None se desativado)
+    """
+    if checkpoint is None:
+        print("Nenhum progresso foi salvo (use checkpoint_path para poder retomar).")
+        return
+    
+    checkpoint.save()
+    in_progress = " e a célula em andamento" if checkpoint.partial else ""
+    print(f"💾 Progresso salvo em {checkpoint.path}: "
+          f"{len(checkpoint.completed)} células concluídas{in_progress}.")
+    print("   Execute novamente com a mesma configuração para continuar.")
+
+
+def print_recommendation(summary: dict, cache_capacity: int = None, knees: dict = None,
+                         comparisons: dict = None):
     """
     Analisa resultados e imprime recomendação de algoritmo
     
     Args:
         summary: estatísticas resumidas dos resultados
+        cache_capacity: capacidade usada na simulação
+        knees: capacidade do joelho por algoritmo (varredura de capacidade);
+               sem ela, a recomendação não sugere outra capacidade
+        comparisons: comparação dos líderes por padrão
+                     (SimulationEngine.leader_comparisons); padrões em empate
+                     estatístico não contam como vitória de ninguém
     """
     print("\n" + "="*70)
     print("🎯 ANÁLISE E RECOMENDAÇÃO")
@@ -121,6 +341,16 @@ def print_recommendation(summary: dict):
         print("Sem dados suficientes para recomendação.")
         return
     
+    # Com aquecimento, compara os algoritmos pelo hit rate em regime
+    has_warmup = any(data.get('total_warmup_requests') for patterns_data in summary.values()
+                     for data in patterns_data.values())
+    # Padrões sem dados em regime (o cache não encheu no aquecimento) usam o
+    # hit rate da sequência inteira
+    patterns = dict.fromkeys(p for data in summary.values() for p in data)
+    rank_keys = {pattern: ('avg_steady_hit_rate' if steady_state_ranking(summary, pattern)
+                           else 'avg_hit_rate')
+                 for pattern in patterns}
+    
     # Calcula hit rate médio geral de cada algoritmo
     overall_performance = {}
     
@@ -129,7 +359,7 @@ def print_recommendation(summary: dict):
         count = 0
         
         for pattern, data in patterns_data.items():
-            total_hit_rate += data['avg_hit_rate']
+            total_hit_rate += data[rank_keys[pattern]]
             count += 1
         
         if count > 0:
@@ -139,7 +369,14 @@ def print_recommendation(summary: dict):
     sorted_algos = sorted(overall_performance.items(), 
                          key=lambda x: x[1], reverse=True)
     
-    print("\n📊 Ranking Geral (Hit Rate Médio):\n")
+    if has_warmup:
+        print("\n📊 Ranking Geral (Hit Rate Médio em regime, sem o aquecimento):\n")
+        without_steady = [pattern for pattern, key in rank_keys.items() if key == 'avg_hit_rate']
+        if without_steady:
+            print(f"⚠️  Sem dados em regime em {', '.join(without_steady)} (o cache não encheu "
+                  f"no aquecimento): esses padrões entram com o hit rate da sequência inteira\n")
+    else:
+        print("\n📊 Ranking Geral (Hit Rate Médio):\n")
     
     medals = ["🥇", "🥈", "🥉", "  "]
     
@@ -154,23 +391,44 @@ def print_recommendation(summary: dict):
     print("💡 RECOMENDAÇÕES POR CENÁRIO:")
     print("-"*70)
     
-    best_by_pattern = {}
-    for pattern in ['random', 'poisson', 'weighted']:
+    print()
+    winners = set()
+    for i, pattern in enumerate(patterns, 1):
+        rank_key = rank_keys[pattern]
         best = max(summary.items(),
-                  key=lambda x: x[1].get(pattern, {}).get('avg_hit_rate', 0))
-        best_by_pattern[pattern] = (best[0], 
-                                    best[1].get(pattern, {}).get('avg_hit_rate', 0))
+                  key=lambda x: x[1].get(pattern, {}).get(rank_key, 0))
+        best_hit_rate = best[1].get(pattern, {}).get(rank_key, 0)
+        scenario = PATTERN_SCENARIOS.get(pattern, f"padrão '{pattern}'")
+        
+        # Só um líder separado dos demais pelo IC conta como vencedor do padrão
+        comparison = (comparisons or {}).get(pattern)
+        if comparison is None:
+            winners.add(best[0])
+        elif comparison['separated']:
+            winners.add(comparison['leader'])
+        print(f"{i}. Para {scenario}:")
+        if comparison is None or comparison['runner_up'] == comparison['leader']:
+            print(f"   → Melhor: {best[0]} ({best_hit_rate:.1f}% hit rate)")
+        else:
+            # Mesmo critério do resumo: vantagem só com o IC longe de zero
+            leader = comparison['leader']
+            leader_hit_rate = summary[leader][pattern][rank_key]
+            interval = (f"{comparison['difference']:+.2f} pp, "
+                        f"IC{comparison['confidence']*100:.0f}% "
+                        f"[{comparison['ci_low']:+.2f}, {comparison['ci_high']:+.2f}]")
+            if comparison['separated']:
+                print(f"   → Melhor: {leader} ({leader_hit_rate:.1f}% hit rate; "
+                      f"{interval} sobre {comparison['runner_up']})")
+            else:
+                print(f"   → ⚖️  Empate estatístico entre {leader} e {comparison['runner_up']} "
+                      f"({leader_hit_rate:.1f}% hit rate; {interval})")
+        print()
     
-    print(f"""
-1. Para acesso ALEATÓRIO (navegação exploratória):
-   → Melhor: {best_by_pattern['random'][0]} ({best_by_pattern['random'][1]:.1f}% hit rate)
-   
-2. Para acesso com POISSON (padrão com concentração):
-   → Melhor: {best_by_pattern['poisson'][0]} ({best_by_pattern['poisson'][1]:.1f}% hit rate)
-   
-3. Para acesso PONDERADO (documentos favoritos):
-   → Melhor: {best_by_pattern['weighted'][0]} ({best_by_pattern['weighted'][1]:.1f}% hit rate)
-    """)
+    if len(winners) > 1:
+        print(f"🔀 Nenhum algoritmo vence em todos os padrões ({', '.join(sorted(winners))}).")
+        print("   Se a carga muda ao longo do dia, considere o AdaptiveCache")
+        print("   (algorithms/adaptive_cache.py), que troca de política sozinho.")
+        print()
     
     print("-"*70)
     print("🏆 RECOMENDAÇÃO FINAL PARA 'TEXTO É VIDA':")
@@ -180,7 +438,7 @@ def print_recommendation(summary: dict):
     
     print(f"""
 Algoritmo Recomendado: {best_overall[0]}
-Hit Rate Médio: {best_overall[1]:.2f}%
+Hit Rate Médio{' em regime' if has_warmup else ''}: {best_overall[1]:.2f}%
 
 Justificativa:
 • Advogados tendem a revisitar documentos importantes (padrão ponderado)
@@ -190,14 +448,115 @@ Justificativa:
 {get_algorithm_description(best_overall[0])}
 
 Configuração Sugerida:
-• Capacidade do cache: 10 textos (balança memória e performance)
-• Considere aumentar para 15-20 se houver memória disponível
+{get_capacity_advice(best_overall[0], cache_capacity, knees)}
 • Monitore métricas em produção para ajustes
     """)
     
     print("="*70)
 
 
+def get_capacity_advice(algorithm_name: str, cache_capacity: int = None,
+                        knees: dict = None) -> str:
+    """Retorna a sugestão de capacidade, baseada no joelho da curva quando houver"""
+    knee = (knees or {}).get(algorithm_name)
+    if knee is not None:
+        return (f"• Capacidade do cache: {knee} textos (joelho da curva do {algorithm_name}:\n"
+                f"  acima disso cada texto a mais rende pouco hit rate)")
+    
+    advice = f"• Capacidade simulada: {cache_capacity} textos\n" if cache_capacity else ""
+    return advice + ("• Para dimensionar o cache, use a varredura de capacidade\n"
+                     "  (opção -2 do menu), que mede o hit rate em cada tamanho")
+
+
+def run_capacity_sweep_mode(loader: TextLoader,
+                            capacities: List[int] = None,
+                            byte_budgets: List[int] = None,
+                            num_users: int = 3,
+                            requests_per_user: int = 200,
+                            patterns: List[str] = None,
+                            pattern_params: Dict[str, Dict] = None,
+                            trace_capacity: int = 10,
+                            max_workers: int = None,
+                            checkpoint_path: str = None,
+                            resume: bool = True,
+                            checkpoint_interval: float = 60.0,
+                            warmup: int = None) -> Dict:
+    """
+    Executa a varredura de capacidade e recomenda um tamanho por política
+    
+    Args:
+        loader: instância do TextLoader
+        capacities: capacidades a avaliar, em textos (padrão: 1 ao total de textos)
+        byte_budgets: orçamentos de memória em bytes (substituem capacities)
+        num_users: número de usuários por padrão
+        requests_per_user: número de requisições por usuário
+        patterns: padrões de acesso (padrão: random, poisson, weighted)
+        pattern_params: parâmetros por padrão
+        trace_capacity: capacidade usada para gerar as sequências ('loop')
+        max_workers: número de processos (padrão: CPUs)
+        checkpoint_path: arquivo onde as células concluídas são salvas;
+                         None desativa o checkpoint
+        resume: continua de um checkpoint existente com a mesma configuração
+        checkpoint_interval: intervalo mínimo entre gravações, em segundos
+        warmup: requisições de aquecimento antes das medidas (padrão:
+                SWEEP_WARMUP_PER_TEXT por texto do corpus; 0 desativa)
+        
+    Returns:
+        dict: resultado de SimulationEngine.simulate_capacity_sweep
+              (None se a varredura for interrompida)
+    """
+    print("\n" + "📐"*35)
+    print("VARREDURA DE CAPACIDADE")
+    print("📐"*35)
+    
+    engine = SimulationEngine(loader)
+    algorithms = [FIFOCache, LRUCache, LFUCache, ARCCache]
+    
+    if checkpoint_path:
+        engine.checkpoint = SimulationCheckpoint.open(checkpoint_path, {
+            'mode': 'capacity_sweep',
+            'algorithms': [alg.__name__ for alg in algorithms],
+            'capacities': None if capacities is None else [int(c) for c in capacities],
+            'byte_budgets': None if byte_budgets is None else [float(b) for b in byte_budgets],
+            'num_users': num_users,
+            'requests_per_user': requests_per_user,
+            'patterns': patterns,
+            'pattern_params': pattern_params,
+            'trace_capacity': trace_capacity,
+            'warmup': warmup,
+            'seed': engine.seed,
+            'total_texts': engine.total_texts
+        }, checkpoint_interval, resume)
+    
+    try:
+        sweep = engine.simulate_capacity_sweep(
+            algorithms,
+            capacities=capacities,
+            byte_budgets=byte_budgets,
+            num_users=num_users,
+            requests_per_user=requests_per_user,
+            patterns=patterns,
+            pattern_params=pattern_params,
+            trace_capacity=trace_capacity,
+            max_workers=max_workers,
+            warmup=warmup
+        )
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Varredura interrompida pelo usuário.")
+        print_checkpoint_status(engine.checkpoint)
+        return None
+    
+    if engine.checkpoint:
+        engine.checkpoint.remove()
+    
+    print_capacity_sweep(sweep)
+    
+    report_gen = ReportGenerator(output_dir="docs")
+    report_gen.generate_capacity_sweep(sweep)
+    
+    return sweep
+
+
 def get_algorithm_description(algorithm_name: str) -> str:
     """Retorna descrição do algoritmo"""
     descriptions = {
@@ -0,0 +1,383 @@
+"""
+Armazenamento compacto de traces de acesso
+Importa traces de CSV e de logs de acesso para um formato binário
+mapeado em memória, que pode ser reproduzido pelo SimulationEngine
+
+Formato (um diretório por trace):
+- trace.json: metadados (número de requisições, colunas presentes, origem)
+- text_ids.i32: números dos textos (int32 little-endian)
+- timestamps.f64: instante de cada requisição em segundos (opcional)
+- user_ids.i32: usuário de cada requisição (opcional)
+
+Aluno D - Módulo de Simulação
+"""
+
+import argparse
+import csv
+import json
+import re
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+TRACE_META_FILE = "trace.json"
+TRACE_COLUMNS = {
+    'text_ids': ("text_ids.i32", "<i4"),
+    'timestamps': ("timestamps.f64", "<f8"),
+    'user_ids': ("user_ids.i32", "<i4"),
+}
+
+# Common Log Format com o número do texto no caminho. O usuário é identificado
+# pelo endereço do cliente (primeiro campo, 10.0.0.1 no exemplo), não pelo
+# authuser (terceiro), que na maioria dos logs é só "-":
+# 10.0.0.1 - ana [10/Oct/2025:13:55:36 -0300] "GET /texts/texto_42.txt HTTP/1.1" 200 6120
+DEFAULT_LOG_PATTERN = (
+    r'^(?P<user>\S+) \S+ \S+ \[(?P<ts>[^\]]+)\] '
+    r'"\S+ \S*?(?P<text>\d+)(?:\.txt)?(?:[?#]\S*)? [^"]*"'
+)
+LOG_TIME_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+
+
+class TraceWriter:
+    """
+    Grava um trace em blocos, sem precisar mantê-lo inteiro em memória
+    """
+
+    def __init__(self, output_dir: str, with_timestamps: bool = False,
+                 with_users: bool = False, source: str = ""):
+        """
+        Args:
+            output_dir: diretório do trace (criado se não existir)
+            with_timestamps: se o trace terá a coluna de instantes
+            with_users: se o trace terá a coluna de usuários
+            source: descrição da origem (gravada nos metadados)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.source = source
+        self.num_requests = 0
+        self.max_text_id = 0
+
+        columns = ['text_ids']
+        if with_timestamps:
+            columns.append('timestamps')
+        if with_users:
+            columns.append('user_ids')
+
+        self._files = {
+            name: open(self.output_dir / TRACE_COLUMNS[name][0], "wb")
+            for name in columns
+        }
+
+    def append(self, text_ids, timestamps=None, user_ids=None):
+        """
+        Acrescenta um bloco de requisições ao trace
+
+        Args:
+            text_ids: números dos textos
+            timestamps: instantes em segundos (obrigatório se o trace tiver a coluna)
+            user_ids: usuários (obrigatório se o trace tiver a coluna)
+
+        Raises:
+            ValueError: se faltar uma coluna ou os tamanhos forem diferentes
+        """
+        blocks = {'text_ids': text_ids, 'timestamps': timestamps, 'user_ids': user_ids}
+
+        for name, file in self._files.items():
+            if blocks[name] is None:
+                raise ValueError(f"Coluna '{name}' obrigatória neste trace")
+            block = np.asarray(blocks[name], dtype=TRACE_COLUMNS[name][1])
+            if len(block) != len(text_ids):
+                raise ValueError(f"Coluna '{name}' com tamanho diferente de text_ids")
+            file.write(block.tobytes())
+
+        if len(text_ids):
+            self.max_text_id = max(self.max_text_id, int(np.max(text_ids)))
+        self.num_requests += len(text_ids)
+
+    def close(self):
+        """Fecha os arquivos e grava os metadados"""
+        if not self._files:
+            return
+        for file in self._files.values():
+            file.close()
+
+        meta = {
+            'format_version': 1,
+            'num_requests': self.num_requests,
+            'max_text_id': self.max_text_id,
+            'columns': list(self._files),
+            'source': self.source,
+        }
+        with open(self.output_dir / TRACE_META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Trace:
+    """
+    Trace gravado em disco, com colunas mapeadas em memória
+
+    As colunas são np.memmap: só as páginas efetivamente lidas são
+    carregadas, então traces com centenas de milhões de requisições
+    podem ser percorridos em blocos com memória constante.
+    """
+
+    def __init__(self, trace_dir: str):
+        """
+        Args:
+            trace_dir: diretório criado por TraceWriter / import_csv / import_access_log
+
+        Raises:
+            FileNotFoundError: se o diretório não contiver um trace
+        """
+        self.trace_dir = Path(trace_dir)
+        meta_path = self.trace_dir / TRACE_META_FILE
+        if not meta_path.exists():
+            raise FileNotFoundError(f"Trace não encontrado em '{trace_dir}'")
+
+        with open(meta_path, encoding="utf-8") as f:
+            self.meta = json.load(f)
+
+        self.num_requests = self.meta['num_requests']
+        self.max_text_id = self.meta['max_text_id']
+        self.text_ids = self._open_column('text_ids')
+        self.timestamps = self._open_column('timestamps')
+        self.user_ids = self._open_column('user_ids')
+
+    def _open_column(self, name: str) -> Optional[np.ndarray]:
+        """Mapeia uma coluna em memória (None se o trace não a tiver)"""
+        if name not in self.meta['columns']:
+            return None
+        filename, dtype = TRACE_COLUMNS[name]
+        if self.num_requests == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.trace_dir / filename, dtype=dtype, mode="r",
+                         shape=(self.num_requests,))
+
+    def __len__(self) -> int:
+        return self.num_requests
+
+    def iter_chunks(self, chunk_size: int = 1 << 16, start: int = 0) -> Iterator[Dict]:
+        """
+        Percorre o trace em blocos
+
+        Args:
+            chunk_size: número de requisições por bloco
+            start: índice da primeira requisição
+
+        Yields:
+            dict: {'start': índice inicial, 'text_ids': array, 'timestamps': array ou None,
+                   'user_ids': array ou None}
+        """
+        for begin in range(start, self.num_requests, chunk_size):
+            end = min(begin + chunk_size, self.num_requests)
+            yield {
+                'start': begin,
+                'text_ids': np.asarray(self.text_ids[begin:end]),
+                'timestamps': None if self.timestamps is None
+                              else np.asarray(self.timestamps[begin:end]),
+                'user_ids': None if self.user_ids is None
+                            else np.asarray(self.user_ids[begin:end]),
+            }
+
+    def __repr__(self) -> str:
+        return (f"Trace('{self.trace_dir}', requests={self.num_requests}, "
+                f"columns={self.meta['columns']})")
+
+
+def _parse_timestamp(value: str, time_format: str = None) -> float:
+    """Converte um instante (número, ISO 8601 ou time_format) em segundos"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if time_format:
+        return datetime.strptime(value, time_format).timestamp()
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _user_index(users: Dict[str, int], value: str) -> int:
+    """Mapeia o identificador de um usuário para um inteiro sequencial"""
+    if value not in users:
+        users[value] = len(users)
+    return users[value]
+
+
+def import_csv(csv_path: str, output_dir: str, text_column: str = 'text_id',
+               timestamp_column: str = None, user_column: str = None,
+               time_format: str = None, chunk_size: int = 1 << 20) -> Trace:
+    """
+    Importa um trace de um arquivo CSV com cabeçalho
+
+    Args:
+        csv_path: arquivo CSV de entrada
+        output_dir: diretório do trace de saída
+        text_column: coluna com o número do texto
+        timestamp_column: coluna com o instante (opcional)
+        user_column: coluna com o usuário (opcional; qualquer string)
+        time_format: formato strptime dos instantes, se não forem numéricos/ISO
+        chunk_size: requisições acumuladas antes de cada gravação
+
+    Returns:
+        Trace: trace importado
+    """
+    users = {}
+    text_ids, timestamps, user_ids = [], [], []
+
+    with open(csv_path, newline="", encoding="utf-8") as f, \
+            TraceWriter(output_dir, timestamp_column is not None, user_column is not None,
+                        source=f"csv:{csv_path}") as writer:
+
+        def flush():
+            writer.append(text_ids,
+                          timestamps if timestamp_column else None,
+                          user_ids if user_column else None)
+            text_ids.clear()
+            timestamps.clear()
+            user_ids.clear()
+
+        for row in csv.DictReader(f):
+            text_ids.append(int(row[text_column]))
+            if timestamp_column:
+                timestamps.append(_parse_timestamp(row[timestamp_column], time_format))
+            if user_column:
+                user_ids.append(_user_index(users, row[user_column]))
+
+            if len(text_ids) >= chunk_size:
+                flush()
+
+        flush()
+
+    return Trace(output_dir)
+
+
+def import_access_log(log_path: str, output_dir: str, pattern: str = DEFAULT_LOG_PATTERN,
+                      time_format: str = LOG_TIME_FORMAT,
+                      chunk_size: int = 1 << 20) -> Trace:
+    """
+    Importa um trace de um log de acesso
+
+    Cada linha é casada com a expressão regular `pattern`, que deve ter o
+    grupo nomeado `text` e, opcionalmente, `ts` (instante) e `user`.
+    Linhas que não casam (ex.: outras rotas) são ignoradas.
+
+    Args:
+        log_path: arquivo de log de entrada
+        output_dir: diretório do trace de saída
+        pattern: expressão regular das linhas (padrão: Common Log Format,
+                com o endereço do cliente como usuário)
+        time_format: formato strptime do grupo `ts`
+        chunk_size: requisições acumuladas antes de cada gravação
+
+    Returns:
+        Trace: trace importado
+    """
+    regex = re.compile(pattern)
+    has_ts = 'ts' in regex.groupindex
+    has_user = 'user' in regex.groupindex
+
+    users = {}
+    text_ids, timestamps, user_ids = [], [], []
+    skipped = 0
+
+    with open(log_path, encoding="utf-8", errors="replace") as f, \
+            TraceWriter(output_dir, has_ts, has_user, source=f"log:{log_path}") as writer:
+
+        def flush():
+            writer.append(text_ids,
+                          timestamps if has_ts else None,
+                          user_ids if has_user else None)
+            text_ids.clear()
+            timestamps.clear()
+            user_ids.clear()
+
+        for line in f:
+            match = regex.search(line)
+            if match is None:
+                skipped += 1
+                continue
+
+            text_ids.append(int(match.group('text')))
+            if has_ts:
+                timestamps.append(_parse_timestamp(match.group('ts'), time_format))
+            if has_user:
+                user_ids.append(_user_index(users, match.group('user')))
+
+            if len(text_ids) >= chunk_size:
+                flush()
+
+        flush()
+
+    if skipped:
+        print(f"⚠️  {skipped} linhas ignoradas (não casaram com o padrão)")
+
+    return Trace(output_dir)
+
+
+def save_requests(requests, output_dir: str, source: str = "generated") -> Trace:
+    """
+    Grava uma sequência gerada (ex.: RequestGenerator) como trace
+
+    Args:
+        requests: lista ou array de números de textos
+        output_dir: diretório do trace de saída
+        source: descrição da origem
+
+    Returns:
+        Trace: trace gravado
+    """
+    with TraceWriter(output_dir, source=source) as writer:
+        writer.append(np.asarray(requests, dtype=np.int32))
+    return Trace(output_dir)
+
+
+# Execução pela linha de comando
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa e inspeciona traces de acesso")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    csv_parser = subparsers.add_parser("import-csv", help="importa um CSV")
+    csv_parser.add_argument("entrada")
+    csv_parser.add_argument("saida")
+    csv_parser.add_argument("--text-column", default="text_id")
+    csv_parser.add_argument("--timestamp-column")
+    csv_parser.add_argument("--user-column")
+    csv_parser.add_argument("--time-format")
+
+    log_parser = subparsers.add_parser("import-log", help="importa um log de acesso")
+    log_parser.add_argument("entrada")
+    log_parser.add_argument("saida")
+    log_parser.add_argument("--pattern", default=DEFAULT_LOG_PATTERN)
+    log_parser.add_argument("--time-format", default=LOG_TIME_FORMAT)
+
+    info_parser = subparsers.add_parser("info", help="mostra um resumo do trace")
+    info_parser.add_argument("trace")
+
+    args = parser.parse_args()
+
+    if args.command == "import-csv":
+        trace = import_csv(args.entrada, args.saida, args.text_column,
+                           args.timestamp_column, args.user_column, args.time_format)
+    elif args.command == "import-log":
+        trace = import_access_log(args.entrada, args.saida, args.pattern, args.time_format)
+    else:
+        trace = Trace(args.trace)
+
+    print(f"✅ {trace}")
+    print(f"  Requisições: {len(trace)}")
+    print(f"  Maior número de texto: {trace.max_text_id}")
+    print(f"  Colunas: {', '.join(trace.meta['columns'])}")
+    print(f"  Origem: {trace.meta['source']}")
@@ -0,0 +1,26 @@
+"""
+Configuração comum dos testes (pytest)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+class MemoryLoader:
+    """Loader em memória: sem disco, conteúdo e tempo determinísticos"""
+
+    def __init__(self, total_texts: int = 100):
+        self.total_texts = total_texts
+
+    def load_text(self, text_number: int):
+        return f"Conteúdo do texto {text_number}", 0.0
+
+
+@pytest.fixture
+def memory_loader():
+    """Loader em memória com 100 textos"""
+    return MemoryLoader()
@@ -0,0 +1,82 @@
+"""
+Testes do cache adaptativo (políticas sombra)
+"""
+
+import numpy as np
+
+from algorithms.adaptive_cache import AdaptiveCache
+from core.cache_interface import RECENT_LOAD_TIMES
+
+
+def _requests(num_requests: int = 5000):
+    rng = np.random.default_rng(0)
+    return np.where(rng.random(num_requests) < 0.7, rng.integers(1, 9, num_requests),
+                    rng.integers(1, 101, num_requests)).tolist()
+
+
+def test_sombras_nao_registram_tempos(memory_loader):
+    """Só o AdaptiveCache registra tempos; as políticas internas guardam só metadados"""
+    cache = AdaptiveCache(capacity=10, window=200)
+    requests = _requests()
+    for text_number in requests:
+        cache.get(text_number, memory_loader.load_text)
+
+    assert cache.load_count == len(requests)
+    assert len(cache.load_times) <= RECENT_LOAD_TIMES
+    for policy in cache.policies.values():
+        assert policy.load_count == 0
+        assert len(policy.load_times) == 0
+        assert policy.total_requests == len(requests)
+
+
+def test_prefetch_nao_conta_na_janela(memory_loader):
+    """Antecipações entram nas políticas, mas não nos hit rates da janela"""
+    cache = AdaptiveCache(capacity=10, window=1000)
+    for text_number in [1, 2, 3]:
+        cache.get(text_number, memory_loader.load_text)
+    window_hits = dict(cache.window_hits)
+    metrics = cache.get_metrics()
+
+    assert cache.prefetch(50, memory_loader.load_text)
+    assert not cache.prefetch(50, memory_loader.load_text)
+
+    assert cache.window_requests == 3
+    assert cache.window_hits == window_hits
+    assert cache.get_metrics()['total_requests'] == metrics['total_requests']
+    assert cache.get_metrics()['hits'] == metrics['hits']
+    for policy in cache.policies.values():
+        assert policy.is_in_cache(50)
+        assert policy.total_requests == 3
+
+    # O texto antecipado é servido pela política ativa
+    content, _, was_hit = cache.get(50, memory_loader.load_text)
+    assert was_hit and content == memory_loader.load_text(50)[0]
+
+
+def test_armazenamento_compartilhado_segue_as_politicas():
+    """Ao lado de outra política no MultiPolicyCache, as referências batem com o que cada uma guarda"""
+    from collections import Counter
+
+    from algorithms.lru_cache import LRUCache
+    from core.multi_policy import MultiPolicyCache
+
+    # Hot set estável e depois um laço maior que o cache: força trocas de política
+    rng = np.random.default_rng(0)
+    hot_phase = np.where(rng.random(4000) < 0.7, rng.integers(1, 9, 4000),
+                         rng.integers(1, 101, 4000))
+    loop_phase = np.tile(np.arange(1, 13), 350)
+    requests = np.concatenate([hot_phase, loop_phase, hot_phase]).tolist()
+
+    adaptive = AdaptiveCache(capacity=10, window=500)
+    multi = MultiPolicyCache([adaptive, LRUCache(capacity=10)],
+                             lambda text_number: (f"Texto {text_number}", 0.0))
+
+    for text_number in requests:
+        multi.get(text_number)
+        held = Counter(adaptive.keys()) + Counter(multi.policies[1].keys())
+        assert multi.store.refcounts == dict(held)
+
+    assert adaptive.switches
+    # Textos herdados sem conteúdo não contam como residentes
+    assert all(adaptive.active.peek(t) is not None for t in adaptive.keys())
+    assert adaptive.size() == len(adaptive.keys())
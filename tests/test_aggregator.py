@@ -0,0 +1,109 @@
+"""
+Testes do agregador incremental alimentado pelo motor
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from simulation.aggregator import StreamingAggregator
+from simulation.simulation_engine import SimulationEngine, REQUEST_BATCH
+
+
+def _simulate(loader, keep_access_log: bool, warmup):
+    engine = SimulationEngine(loader, keep_access_log=keep_access_log)
+    results = engine.simulate_all_algorithms([LRUCache, LFUCache], cache_capacity=10, num_users=2,
+                                             requests_per_user=REQUEST_BATCH * 2 + 100,
+                                             patterns=['zipf', 'scan'], warmup=warmup)
+    return engine, results
+
+
+@pytest.mark.parametrize('warmup', [0, 500, 'fill'])
+def test_sem_log_tem_mesmos_resultados(memory_loader, warmup):
+    """keep_access_log=False não aloca o log e não muda contadores nem métricas de regime"""
+    full_engine, full = _simulate(memory_loader, True, warmup)
+    lean_engine, lean = _simulate(memory_loader, False, warmup)
+
+    for algorithm in full:
+        for with_log, without_log in zip(full[algorithm], lean[algorithm]):
+            assert len(without_log['access_log']['was_hit']) == 0
+            assert len(with_log['access_log']['was_hit']) == with_log['total_requests']
+            for key in ('hits', 'warmup_requests', 'warmup_misses', 'steady_hits',
+                        'steady_hit_rate', 'hot_set_after_scan'):
+                assert with_log.get(key) == without_log.get(key)
+            assert np.array_equal(with_log['text_hit_count'], without_log['text_hit_count'])
+            assert np.array_equal(with_log['text_miss_count'], without_log['text_miss_count'])
+
+            # Os acumuladores por bloco batem com o log completo
+            log = with_log['access_log']
+            steady = log['was_hit'][with_log['warmup_requests']:]
+            assert with_log['steady_hits'] == int(steady.sum())
+            assert with_log['latency_histogram'].sum() == with_log['total_requests']
+
+
+def test_agregador_por_bloco_igual_ao_dos_resultados(memory_loader):
+    """Alimentar o agregador por bloco não conta nada duas vezes"""
+    engine, results = _simulate(memory_loader, False, 'fill')
+    rebuilt = StreamingAggregator.from_results(results)
+
+    for algorithm in results:
+        streamed_hits, streamed_misses = engine.aggregator.text_counts(algorithm)
+        hits, misses = rebuilt.text_counts(algorithm)
+        assert np.array_equal(streamed_hits, hits)
+        assert np.array_equal(streamed_misses, misses)
+
+    streamed = engine.get_summary_statistics()
+    expected = rebuilt.summary()
+    for algorithm in expected:
+        for pattern, stats in expected[algorithm].items():
+            for key in ('total_hits', 'total_misses', 'num_users', 'user_steady_hit_rates',
+                        'total_warmup_misses'):
+                assert streamed[algorithm][pattern][key] == stats[key]
+            assert (engine.aggregator.groups[algorithm][pattern].latency.sum()
+                    == rebuilt.groups[algorithm][pattern].latency.sum())
+
+
+def test_sem_regime_fica_fora_das_medias(memory_loader):
+    """Se o cache nunca enche, as métricas em regime são NaN, não zero"""
+    engine = SimulationEngine(memory_loader)
+    results = engine.simulate_all_algorithms([LRUCache, LFUCache], cache_capacity=150,
+                                             num_users=2, requests_per_user=200,
+                                             patterns=['zipf'], warmup='fill')
+    for result in results['LRUCache']:
+        assert result['steady_requests'] == 0
+        assert np.isnan(result['steady_hit_rate']) and np.isnan(result['steady_avg_load_time'])
+
+    summary = engine.get_summary_statistics()
+    stats = summary['LRUCache']['zipf']
+    assert stats['num_steady_users'] == 0 and np.isnan(stats['avg_steady_hit_rate'])
+    assert stats['avg_hit_rate'] > 0
+
+    # A comparação dos líderes usa o hit rate da sequência inteira
+    comparison = engine.leader_comparisons(summary)['zipf']
+    assert comparison['num_samples'] == 2 and not np.isnan(comparison['difference'])
+
+
+def test_usuario_sem_regime_sai_do_par():
+    """Um usuário sem regime sai das médias e da comparação pareada"""
+    from simulation.confidence import leader_comparison
+
+    aggregator = StreamingAggregator()
+    for algorithm, steady_rates in (('LRUCache', [40.0, float('nan'), 50.0]),
+                                    ('LFUCache', [30.0, 20.0, 35.0])):
+        for steady_rate in steady_rates:
+            aggregator.add_result({'algorithm': algorithm, 'pattern': 'zipf', 'hits': 0,
+                                   'misses': 0, 'hit_rate': 10.0, 'miss_rate': 90.0,
+                                   'avg_load_time': 0.0, 'warmup_requests': 10,
+                                   'steady_hit_rate': steady_rate,
+                                   'steady_avg_load_time': 0.0}, include_counts=False)
+
+    stats = aggregator.summary()['LRUCache']['zipf']
+    assert stats['num_steady_users'] == 2 and stats['avg_steady_hit_rate'] == 45.0
+    low, high = stats['steady_hit_rate_ci']
+    assert 40.0 <= low <= high <= 50.0
+
+    comparison = leader_comparison({'LRUCache': [40.0, float('nan'), 50.0],
+                                    'LFUCache': [30.0, 20.0, 35.0]})
+    assert comparison['num_samples'] == 2
+    assert comparison['leader'] == 'LRUCache' and comparison['difference'] == 12.5
@@ -0,0 +1,70 @@
+"""
+Testes da varredura de capacidade e da detecção de joelho
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.lru_cache import LRUCache
+from simulation.capacity_sweep import find_knee
+from simulation.simulation_engine import SimulationEngine
+
+
+CAPACITIES = np.arange(1, 101)
+
+
+def test_joelho_da_curva_concava():
+    """Uma curva que satura rápido tem joelho antes da metade"""
+    concave = 100 * (1 - np.exp(-CAPACITIES / 12))
+    assert 15 <= find_knee(CAPACITIES, concave) <= 35
+
+
+def test_curva_linear_nao_tem_joelho():
+    """Com ganho constante por texto (acesso uniforme), não há joelho"""
+    assert find_knee(CAPACITIES, CAPACITIES.astype(float)) is None
+    assert find_knee(CAPACITIES, np.full(100, 50.0)) is None
+
+
+def test_joelho_do_degrau():
+    """No laço cíclico, o joelho é a capacidade em que o laço cabe"""
+    step = np.where(CAPACITIES >= 30, 95.0, 0.0)
+    assert find_knee(CAPACITIES, step) == 30
+
+
+class SizedLoader:
+    """Loader em memória que informa o tamanho dos textos (1KB cada)"""
+
+    total_texts = 100
+
+    def text_sizes(self):
+        return np.full(self.total_texts + 1, 1024, dtype=np.int64)
+
+
+def test_aquecimento_tira_os_misses_compulsorios(memory_loader):
+    """Com aquecimento, o cache do tamanho do corpus acerta quase tudo"""
+    engine = SimulationEngine(memory_loader)
+    kwargs = dict(capacities=[10, 100], num_users=2, requests_per_user=200,
+                  patterns=['random'], max_workers=1)
+    cold = engine.simulate_capacity_sweep([LRUCache], warmup=0, **kwargs)
+    warm = engine.simulate_capacity_sweep([LRUCache], **kwargs)
+
+    assert warm['warmup'] > 0
+    assert cold['overall']['LRUCache'][-1] < 70
+    assert warm['overall']['LRUCache'][-1] > 99
+    # A capacidade pequena não muda de ordem de grandeza
+    assert abs(warm['overall']['LRUCache'][0] - cold['overall']['LRUCache'][0]) < 5
+
+
+def test_orcamento_menor_que_um_texto(capsys):
+    """Orçamentos que não cabem um texto são rejeitados; repetidos são avisados"""
+    engine = SimulationEngine(SizedLoader())
+    with pytest.raises(ValueError, match="menores que um texto"):
+        engine.simulate_capacity_sweep([LRUCache], byte_budgets=[512, 10 * 1024])
+    with pytest.raises(ValueError, match="Aquecimento"):
+        engine.simulate_capacity_sweep([LRUCache], warmup='fill')
+
+    sweep = engine.simulate_capacity_sweep([LRUCache], byte_budgets=[10 * 1024, 10 * 1024 + 100,
+                                                                     20 * 1024],
+                                           num_users=1, patterns=['random'], max_workers=1)
+    assert list(sweep['capacities']) == [10, 20]
+    assert 'mesma capacidade' in capsys.readouterr().out
@@ -0,0 +1,106 @@
+"""
+Testes dos checkpoints: retomar uma simulação interrompida dá o mesmo resultado
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.lru_cache import LRUCache
+from algorithms.arc_cache import ARCCache
+from simulation.checkpoint import SimulationCheckpoint
+from simulation.simulation_engine import SimulationEngine, REQUEST_BATCH
+
+ALGORITHMS = [LRUCache, ARCCache]
+GRID = dict(cache_capacity=10, num_users=2, requests_per_user=REQUEST_BATCH * 2 + 500,
+            patterns=['random', 'zipf'], warmup='fill')
+CONFIG = {'grade': 'teste'}
+
+
+class Interrupted(Exception):
+    """Interrupção simulada no meio da simulação"""
+
+
+class InterruptingLoader:
+    """Loader em memória que interrompe a simulação após `limit` leituras"""
+
+    total_texts = 100
+
+    def __init__(self, limit: int = None):
+        self.limit = limit
+        self.loads = 0
+
+    def load_text(self, text_number: int):
+        self.loads += 1
+        if self.loads == self.limit:
+            raise Interrupted()
+        return f"Conteúdo do texto {text_number}", 0.0
+
+
+def _comparable(results):
+    """Campos determinísticos dos resultados (sem tempos medidos)"""
+    return [(r['algorithm'], r['pattern'], r['user_id'], r['hits'], r['misses'],
+             r['warmup_requests'], r['warmup_misses'], r['steady_hits'],
+             r['text_hit_count'].tolist(), r['text_miss_count'].tolist(),
+             int(r['latency_histogram'].sum()), r['access_log']['was_hit'].tolist())
+            for algorithm_results in results.values() for r in algorithm_results]
+
+
+@pytest.mark.parametrize('keep_access_log', [True, False])
+def test_retomar_igual_a_execucao_sem_interrupcao(tmp_path, keep_access_log):
+    """Interrupções no meio das células não mudam resultados nem agregados"""
+    reference = SimulationEngine(InterruptingLoader(), keep_access_log=keep_access_log)
+    expected = reference.simulate_all_algorithms(ALGORITHMS, **GRID)
+
+    path = tmp_path / "sim.ckpt"
+    partials = []
+    # Primeira interrupção logo após o primeiro bloco da primeira célula
+    for limit in (int(REQUEST_BATCH * 1.2), REQUEST_BATCH * 3, REQUEST_BATCH * 5, None):
+        engine = SimulationEngine(InterruptingLoader(limit), keep_access_log=keep_access_log)
+        engine.checkpoint = SimulationCheckpoint.open(path, CONFIG, interval=0)
+        try:
+            results = engine.simulate_all_algorithms(ALGORITHMS, **GRID)
+        except Interrupted:
+            partials.append(engine.checkpoint.partial is not None)
+            engine.checkpoint.save()
+            continue
+        break
+
+    assert partials and partials[0]
+    assert _comparable(results) == _comparable(expected)
+
+    # O agregador do motor retomado também bate com o da execução contínua
+    summary = engine.get_summary_statistics()
+    expected_summary = reference.get_summary_statistics()
+    for algorithm in expected_summary:
+        for pattern, stats in expected_summary[algorithm].items():
+            for key in ('total_hits', 'total_misses', 'user_steady_hit_rates',
+                        'total_warmup_misses'):
+                assert summary[algorithm][pattern][key] == stats[key]
+        hits, misses = engine.aggregator.text_counts(algorithm)
+        expected_hits, expected_misses = reference.aggregator.text_counts(algorithm)
+        assert np.array_equal(hits, expected_hits)
+        assert np.array_equal(misses, expected_misses)
+
+
+def test_configuracao_diferente_comeca_do_zero(tmp_path):
+    """Um checkpoint só é retomado pela mesma configuração"""
+    path = tmp_path / "sim.ckpt"
+    checkpoint = SimulationCheckpoint.open(path, CONFIG)
+    checkpoint.record(('LRUCache', 'random', 1), {'hits': 1})
+    checkpoint.save()
+
+    assert SimulationCheckpoint.open(path, CONFIG).is_done(('LRUCache', 'random', 1))
+    assert not SimulationCheckpoint.open(path, {'grade': 'outra'}).completed
+    assert not SimulationCheckpoint.open(path, CONFIG, resume=False).completed
+
+
+def test_retrato_e_consumido_uma_vez(tmp_path):
+    """O retrato da célula em andamento só é devolvido para a mesma célula, uma vez"""
+    checkpoint = SimulationCheckpoint(tmp_path / "sim.ckpt", CONFIG)
+    state = {'offset': 10, 'cache': LRUCache(capacity=3)}
+    checkpoint.snapshot(('LRUCache', 'random', 1), state)
+    state['offset'] = 20
+
+    assert checkpoint.take_partial(('LRUCache', 'random', 2)) is None
+    assert checkpoint.take_partial(('LRUCache', 'random', 1))['offset'] == 10
+    assert checkpoint.take_partial(('LRUCache', 'random', 1)) is None
@@ -0,0 +1,119 @@
+"""
+Testes dos intervalos de confiança e da repetição adaptativa
+"""
+
+import numpy as np
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from simulation.confidence import bootstrap_ci, leader_comparison
+from simulation.simulation_engine import SimulationEngine, MIN_BOOTSTRAP_USERS
+
+
+def test_bootstrap_contem_a_media():
+    """O intervalo contém a média e estreita com mais amostras"""
+    rng = np.random.default_rng(0)
+    few = rng.normal(40, 5, size=10)
+    many = rng.normal(40, 5, size=1000)
+
+    mean, low, high = bootstrap_ci(few)
+    assert low <= mean <= high
+    assert bootstrap_ci(many)[2] - bootstrap_ci(many)[1] < high - low
+    assert bootstrap_ci([42.0]) == (42.0, 42.0, 42.0)
+
+
+def test_diferenca_pareada_separa_lideres():
+    """Uma vantagem constante sobre uma carga variável aparece como separada"""
+    rng = np.random.default_rng(1)
+    load = rng.normal(40, 8, size=10)
+    comparison = leader_comparison({'A': load, 'B': load + 1.5 + rng.normal(0, 0.1, size=10)})
+
+    assert comparison['leader'] == 'B'
+    assert comparison['separated']
+    assert comparison['ci_low'] <= comparison['difference'] <= comparison['ci_high']
+
+
+def test_repeticao_adaptativa_respeita_limites(memory_loader):
+    """simulate_until_confident simula entre o mínimo e o máximo de usuários"""
+    engine = SimulationEngine(memory_loader)
+    results = engine.simulate_until_confident([FIFOCache, LRUCache], cache_capacity=10,
+                                              requests_per_user=300, patterns=['random'],
+                                              target_width=0.0, min_users=1, max_users=8)
+
+    assert engine.confidence['random']['num_users'] == 8
+    assert not engine.confidence['random']['converged']
+    assert [r['user_id'] for r in results['LRUCache']] == list(range(1, 9))
+
+    # Com uma meta folgada, para no mínimo confiável de usuários
+    engine.simulate_until_confident([FIFOCache, LRUCache], cache_capacity=10,
+                                    requests_per_user=300, patterns=['random'],
+                                    target_width=100.0, min_users=1, max_users=8)
+    assert engine.confidence['random']['num_users'] == MIN_BOOTSTRAP_USERS
+
+
+def test_empate_nao_conta_como_vitoria(memory_loader, capsys):
+    """Um padrão em que todos empatam não sugere trocar de política"""
+    from simulation.simulation_mode import print_recommendation
+
+    engine = SimulationEngine(memory_loader)
+    engine.simulate_all_algorithms([FIFOCache, LRUCache], cache_capacity=10, num_users=3,
+                                   requests_per_user=200, patterns=['loop', 'zipf'])
+    summary = engine.get_summary_statistics()
+    comparisons = engine.leader_comparisons(summary)
+
+    # No laço todos ficam em 0%: a FIFO só "vence" pela ordem do dicionário
+    assert not comparisons['loop']['separated']
+    assert comparisons['zipf']['separated'] and comparisons['zipf']['leader'] == 'LRUCache'
+
+    capsys.readouterr()
+    print_recommendation(summary, 10, comparisons=comparisons)
+    assert 'Nenhum algoritmo vence' not in capsys.readouterr().out
+
+
+def test_recomendacao_mostra_empate_e_intervalo(memory_loader, capsys):
+    """A recomendação por cenário usa o mesmo IC do resumo"""
+    from simulation.simulation_mode import print_recommendation
+
+    engine = SimulationEngine(memory_loader)
+    engine.simulate_all_algorithms([FIFOCache, LRUCache], cache_capacity=10, num_users=3,
+                                   requests_per_user=200, patterns=['loop', 'zipf'])
+    summary = engine.get_summary_statistics()
+
+    capsys.readouterr()
+    print_recommendation(summary, 10, comparisons=engine.leader_comparisons(summary))
+    output = capsys.readouterr().out
+
+    assert 'Empate estatístico entre FIFOCache e LRUCache' in output
+    assert 'Melhor: FIFOCache' not in output
+    assert 'sobre FIFOCache' in output and 'IC95%' in output
+
+
+def test_confianca_salva_com_a_execucao(memory_loader, tmp_path):
+    """Os ICs da repetição adaptativa voltam com a execução salva"""
+    import sqlite3
+
+    from simulation.results_store import ResultsStore
+
+    engine = SimulationEngine(memory_loader)
+    engine.simulate_until_confident([FIFOCache, LRUCache], cache_capacity=10,
+                                    requests_per_user=300, patterns=['random'],
+                                    target_width=100.0, min_users=1, max_users=8)
+
+    # Banco de uma versão anterior, sem a coluna de confiança
+    path = tmp_path / "resultados.db"
+    connection = sqlite3.connect(str(path))
+    connection.execute("CREATE TABLE runs (run_hash TEXT PRIMARY KEY, config TEXT NOT NULL, "
+                       "cells TEXT NOT NULL, created_at REAL NOT NULL)")
+    connection.execute("INSERT INTO runs VALUES ('antiga', '{}', '[]', 0)")
+    connection.commit()
+    connection.close()
+
+    store = ResultsStore(path)
+    store.save_run({'seed': 42}, [], engine.confidence)
+    runs = {run['run_hash']: run for run in store.list_runs()}
+    store.close()
+
+    assert runs.pop('antiga')['confidence'] == {}
+    (saved,) = runs.values()
+    assert saved['confidence'] == engine.confidence
+    assert saved['confidence']['random']['num_users'] == MIN_BOOTSTRAP_USERS
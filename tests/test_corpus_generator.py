@@ -0,0 +1,34 @@
+"""
+Testes do gerador de corpus sintético
+"""
+
+from core.text_loader import open_loader
+from simulation.corpus_generator import CorpusGenerator
+
+
+def _generator(num_texts: int = 30, seed: int = 5) -> CorpusGenerator:
+    return CorpusGenerator(num_texts=num_texts, distribution='lognormal', mean_words=40,
+                           seed=seed)
+
+
+def test_mesma_semente_mesmo_corpus():
+    """A mesma semente gera os mesmos textos, mesmo com outro número de textos"""
+    texts = [_generator().generate_text(k) for k in range(1, 31)]
+
+    assert texts == [_generator().generate_text(k) for k in range(1, 31)]
+    assert texts[:10] == [_generator(num_texts=10).generate_text(k) for k in range(1, 11)]
+    assert texts != [_generator(seed=6).generate_text(k) for k in range(1, 31)]
+
+
+def test_txt_e_packed_iguais(tmp_path):
+    """Os dois formatos gravam os mesmos textos e o mesmo total de bytes"""
+    generator = _generator()
+    written = {formato: generator.write(str(tmp_path / formato), formato)
+               for formato in ('txt', 'packed')}
+    assert written['txt'] == written['packed']
+
+    txt, packed = open_loader(str(tmp_path / 'txt')), open_loader(str(tmp_path / 'packed'))
+    assert txt.total_texts == packed.total_texts == 30
+    for text_number in range(1, 31):
+        assert txt.load_text(text_number)[0] == packed.load_text(text_number)[0]
+    assert list(txt.text_sizes()) == list(packed.text_sizes())
@@ -0,0 +1,72 @@
+"""
+Testes da divisão do texto original em partes (divide_textos)
+"""
+
+import numpy as np
+import pytest
+
+from core.text_loader import PACKED_INDEX_FILE, PackedTextWriter, open_loader
+from divide_textos import dividir_texto
+
+# Bloco pequeno: várias palavras ficam cortadas entre um bloco e o seguinte
+TAMANHO_BLOCO = 777
+PALAVRAS_POR_TEXTO = 50
+
+
+@pytest.fixture
+def entrada(tmp_path):
+    """Texto com palavras de tamanhos variados, acentos e espaços repetidos"""
+    rng = np.random.default_rng(0)
+    letras = list("abcdefghijklmnopqrstuvwxyzáéíóúçã")
+    palavras = ["".join(rng.choice(letras, size=rng.integers(1, 15))) for _ in range(1234)]
+    separadores = rng.choice([" ", "  ", "\n", " \n\t"], size=len(palavras))
+    caminho = tmp_path / "original.txt"
+    caminho.write_text("".join(p + s for p, s in zip(palavras, separadores)), encoding="utf-8")
+    return caminho, palavras
+
+
+def _textos(pasta):
+    loader = open_loader(str(pasta))
+    return [loader.load_text(n)[0] for n in range(1, loader.total_texts + 1)]
+
+
+def test_txt_e_packed_iguais_ao_original(entrada, tmp_path):
+    """As partes, nos dois formatos, reproduzem a sequência de palavras do original"""
+    caminho, palavras = entrada
+    for formato in ("txt", "packed"):
+        gerados = dividir_texto(caminho, tmp_path / formato, PALAVRAS_POR_TEXTO,
+                                formato=formato, num_workers=3, tamanho_bloco=TAMANHO_BLOCO)
+        assert gerados == -(-len(palavras) // PALAVRAS_POR_TEXTO)
+
+    txt, packed = _textos(tmp_path / "txt"), _textos(tmp_path / "packed")
+    assert txt == packed
+    assert [len(texto.split()) for texto in txt[:-1]] == [PALAVRAS_POR_TEXTO] * (len(txt) - 1)
+    assert " ".join(txt).split() == palavras
+
+
+def test_num_textos_trunca(entrada, tmp_path):
+    """Com num_textos, só as primeiras partes são geradas"""
+    caminho, palavras = entrada
+    gerados = dividir_texto(caminho, tmp_path, PALAVRAS_POR_TEXTO, num_textos=3,
+                            formato="packed", tamanho_bloco=TAMANHO_BLOCO)
+
+    textos = _textos(tmp_path)
+    assert gerados == len(textos) == 3
+    assert " ".join(textos).split() == palavras[:3 * PALAVRAS_POR_TEXTO]
+
+
+def test_falha_na_escrita_nao_grava_indice(entrada, tmp_path, monkeypatch):
+    """Se uma gravação falha, o índice não é escrito (nem um antigo sobrevive)"""
+    caminho, _ = entrada
+    dividir_texto(caminho, tmp_path, PALAVRAS_POR_TEXTO, formato="packed",
+                  tamanho_bloco=TAMANHO_BLOCO)
+    assert (tmp_path / PACKED_INDEX_FILE).exists()
+
+    def falha(self, offset, data):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(PackedTextWriter, "write_at", falha)
+    with pytest.raises(OSError, match="disco cheio"):
+        dividir_texto(caminho, tmp_path, PALAVRAS_POR_TEXTO, formato="packed",
+                      tamanho_bloco=TAMANHO_BLOCO)
+    assert not (tmp_path / PACKED_INDEX_FILE).exists()
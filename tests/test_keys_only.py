@@ -0,0 +1,63 @@
+"""
+Testes do modo só de chaves (TextLoader.load_size)
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+from algorithms.adaptive_cache import AdaptiveCache
+from core.text_loader import open_loader
+from simulation.corpus_generator import CorpusGenerator
+from simulation.simulation_engine import SimulationEngine
+
+ALGORITHMS = [FIFOCache, LRUCache, LFUCache, ARCCache, AdaptiveCache]
+
+
+@pytest.fixture(scope='module', params=['txt', 'packed'])
+def corpus_dir(request, tmp_path_factory):
+    """Corpus sintético pequeno, nos dois formatos do TextLoader"""
+    directory = tmp_path_factory.mktemp(f"corpus_{request.param}")
+    CorpusGenerator(num_texts=60, distribution='lognormal', mean_words=40,
+                    seed=1).write(str(directory), request.param)
+    return directory
+
+
+@pytest.mark.parametrize('cache_class', ALGORITHMS)
+@pytest.mark.parametrize('pattern', ['random', 'zipf', 'scan', 'loop'])
+def test_mesma_sequencia_de_hits_e_misses(corpus_dir, cache_class, pattern):
+    """O modo só de chaves reproduz exatamente os hits e misses do modo completo"""
+    full = SimulationEngine(open_loader(str(corpus_dir)), seed=3)
+    keys_only = SimulationEngine(open_loader(str(corpus_dir)), seed=3, keys_only=True)
+
+    requests, trace_info = full.generate_user_trace(pattern, 1, 3000, 8)
+    full_result = full.simulate_user(cache_class(capacity=8), requests, 1, pattern,
+                                     trace_info, verbose=False)
+    keys_result = keys_only.simulate_user(cache_class(capacity=8), requests, 1, pattern,
+                                          trace_info, verbose=False)
+
+    assert np.array_equal(full_result['access_log']['was_hit'],
+                          keys_result['access_log']['was_hit'])
+    assert full_result['hits'] == keys_result['hits']
+    assert np.array_equal(full_result['text_miss_count'], keys_result['text_miss_count'])
+
+
+def test_load_size_devolve_o_tamanho_do_texto(corpus_dir):
+    """load_size devolve o tamanho em bytes do conteúdo que load_text leria"""
+    loader = open_loader(str(corpus_dir))
+    for text_number in (1, 30, loader.total_texts):
+        content, _ = loader.load_text(text_number)
+        assert loader.load_size(text_number)[0] == len(content.encode('utf-8'))
+
+
+@pytest.mark.parametrize('text_number', [0, -1, -60, 61, 1000, 2.0])
+def test_load_size_valida_como_load_text(corpus_dir, text_number):
+    """Números inválidos levantam o mesmo ValueError nos dois loaders"""
+    loader = open_loader(str(corpus_dir))
+    with pytest.raises(ValueError):
+        loader.load_text(text_number)
+    with pytest.raises(ValueError):
+        loader.load_size(text_number)
@@ -0,0 +1,80 @@
+"""
+Testes da curva de miss ratio exata do LRU (distâncias de pilha)
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.lru_cache import LRUCache
+from simulation.miss_ratio_curve import (StackDistanceAnalyzer, lru_miss_ratio_curve,
+                                         trace_miss_ratio_curve)
+from simulation.request_generator import RequestGenerator
+from simulation.trace_store import save_requests
+
+
+def _brute_force_miss_ratio(requests, capacity: int) -> float:
+    """Miss ratio simulando um LRUCache com a capacidade dada"""
+    cache = LRUCache(capacity=capacity)
+    for text_number in requests:
+        cache.get(text_number, lambda n: ("", 0.0))
+    return cache.misses / len(requests)
+
+
+def _brute_force_distances(requests):
+    """Distâncias de pilha com uma pilha LRU explícita (0 = primeiro acesso)"""
+    stack = []
+    distances = []
+    for text_number in requests:
+        if text_number in stack:
+            depth = len(stack) - stack.index(text_number)
+            stack.remove(text_number)
+        else:
+            depth = 0
+        stack.append(text_number)
+        distances.append(depth)
+    return distances
+
+
+@pytest.mark.parametrize('pattern', ['random', 'zipf', 'scan', 'loop', 'phases'])
+def test_curva_igual_ao_lru_simulado(pattern):
+    """Cada ponto da curva é o miss ratio de um LRU com aquela capacidade"""
+    generator = RequestGenerator(60, seed=5).for_user(1)
+    requests = generator.generate_user_requests(2000, pattern).tolist()
+
+    curve = lru_miss_ratio_curve(requests, max_capacity=60)
+
+    for capacity, miss_ratio in zip(curve['capacities'], curve['miss_ratio']):
+        assert miss_ratio == pytest.approx(_brute_force_miss_ratio(requests, int(capacity)))
+    assert curve['cold_misses'] == len(set(requests))
+    assert curve['unique_texts'] == len(set(requests))
+
+
+def test_distancias_iguais_a_pilha_explicita():
+    """A árvore de Fenwick dá as mesmas distâncias que uma pilha LRU"""
+    requests = np.random.default_rng(2).integers(1, 30, size=1500).tolist()
+    analyzer = StackDistanceAnalyzer(len(requests))
+    assert analyzer.update(requests).tolist() == _brute_force_distances(requests)
+
+
+def test_blocos_e_trace_iguais_a_uma_passada(tmp_path):
+    """Processar em blocos ou a partir de um trace não muda a curva"""
+    requests = np.random.default_rng(3).zipf(1.3, size=5000) % 200 + 1
+    whole = lru_miss_ratio_curve(requests, max_capacity=100)
+
+    analyzer = StackDistanceAnalyzer(len(requests))
+    for start in range(0, len(requests), 777):
+        analyzer.update(requests[start:start + 777])
+    chunked = analyzer.miss_ratio_curve(100)
+
+    trace = save_requests(requests, tmp_path / "trace")
+    from_trace = trace_miss_ratio_curve(trace, max_capacity=100, chunk_size=1000)
+
+    assert np.array_equal(whole['miss_ratio'], chunked['miss_ratio'])
+    assert np.array_equal(whole['miss_ratio'], from_trace['miss_ratio'])
+
+
+def test_sequencia_maior_que_a_informada():
+    """update() recusa mais requisições do que as informadas"""
+    analyzer = StackDistanceAnalyzer(3)
+    with pytest.raises(ValueError):
+        analyzer.update([1, 2, 3, 4])
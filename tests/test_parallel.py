@@ -0,0 +1,44 @@
+"""
+Testes da simulação paralela da grade (simulate_all_algorithms_parallel)
+"""
+
+import numpy as np
+
+from algorithms.arc_cache import ARCCache
+from algorithms.lru_cache import LRUCache
+from simulation.simulation_engine import SimulationEngine
+
+# Campos que não dependem do relógio de parede
+DETERMINISTIC_KEYS = ('user_id', 'pattern', 'algorithm', 'total_requests', 'hits', 'misses',
+                      'hit_rate', 'warmup_requests', 'warmup_misses', 'steady_hits',
+                      'hot_set_before_scan', 'hot_set_after_scan')
+
+
+def test_paralelo_igual_ao_serial(memory_loader):
+    """Os resultados juntados dos workers são os mesmos da execução serial, na mesma ordem"""
+    kwargs = dict(cache_capacity=10, num_users=2, requests_per_user=400,
+                  patterns=['zipf', 'scan', 'loop'], warmup='fill')
+    serial_engine = SimulationEngine(memory_loader, seed=7)
+    serial = serial_engine.simulate_all_algorithms([LRUCache, ARCCache], **kwargs)
+    parallel_engine = SimulationEngine(memory_loader, seed=7)
+    parallel = parallel_engine.simulate_all_algorithms_parallel([LRUCache, ARCCache],
+                                                                max_workers=2, **kwargs)
+
+    assert list(parallel) == list(serial)
+    for algorithm in serial:
+        assert len(parallel[algorithm]) == len(serial[algorithm])
+        for expected, result in zip(serial[algorithm], parallel[algorithm]):
+            for key in DETERMINISTIC_KEYS:
+                assert result.get(key) == expected.get(key), key
+            for column in ('request_index', 'text_id', 'was_hit'):
+                assert np.array_equal(result['access_log'][column],
+                                      expected['access_log'][column])
+            assert np.array_equal(result['text_hit_count'], expected['text_hit_count'])
+            assert np.array_equal(result['text_miss_count'], expected['text_miss_count'])
+
+    serial_summary = serial_engine.get_summary_statistics()
+    parallel_summary = parallel_engine.get_summary_statistics()
+    for algorithm, patterns in serial_summary.items():
+        for pattern, stats in patterns.items():
+            for key in ('total_hits', 'total_misses', 'user_steady_hit_rates'):
+                assert parallel_summary[algorithm][pattern][key] == stats[key]
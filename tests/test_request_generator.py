@@ -0,0 +1,81 @@
+"""
+Testes do gerador de requisições
+"""
+
+import pytest
+
+from simulation.request_generator import PATTERNS, RequestGenerator, pattern_display_name
+
+
+def test_nomes_padrao_dos_padroes():
+    """Sem parâmetros, os nomes usam os valores padrão dos geradores"""
+    assert pattern_display_name('zipf') == 'Zipf (s=1.0)'
+    assert pattern_display_name('poisson') == 'Poisson (λ=30)'
+    assert pattern_display_name('weighted') == 'Ponderado (30-40: 43%)'
+    assert pattern_display_name('phases') == 'Fases (4)'
+    assert pattern_display_name('trace') == 'Trace'
+
+
+@pytest.mark.parametrize('exponent', [0.6, 1.2, 1.25, 2])
+def test_nome_do_zipf_usa_o_expoente(exponent):
+    """O nome do Zipf mostra o expoente realmente usado"""
+    assert pattern_display_name('zipf', {'exponent': exponent}) == f"Zipf (s={float(exponent)})"
+
+
+def test_todos_os_padroes_tem_nome():
+    """Todo padrão aceito tem um nome exibível"""
+    for pattern in PATTERNS:
+        assert pattern_display_name(pattern)
+
+
+def test_mesma_semente_mesma_sequencia():
+    """A sequência de um usuário depende só da semente e do usuário"""
+    first = RequestGenerator(100, seed=7).for_user(3).generate_user_requests(500, 'zipf')
+    second = RequestGenerator(100, seed=7).for_user(3).generate_user_requests(500, 'zipf')
+    other = RequestGenerator(100, seed=7).for_user(4).generate_user_requests(500, 'zipf')
+    assert (first == second).all()
+    assert not (first == other).all()
+
+
+def test_varreduras_nao_tocam_o_hot_set():
+    """As varreduras leem só textos frios, então não renovam o hot set"""
+    generator = RequestGenerator(100, seed=3)
+    requests = generator.generate_scan(2000, hot_size=10, scan_length=60, scan_every=100)
+    info = generator.last_trace_info
+    hot_set = set(info['hot_set'].tolist())
+
+    assert len(info['scan_ends']) > 0
+    for first, last in zip(info['scan_starts'], info['scan_ends']):
+        assert not hot_set & set(requests[first:last + 1].tolist())
+
+
+@pytest.mark.parametrize('hot_size', [0, 100, 150])
+def test_hot_set_invalido(hot_size):
+    """O hot set precisa deixar textos frios para as varreduras"""
+    with pytest.raises(ValueError, match='hot_size'):
+        RequestGenerator(100, seed=0).generate_scan(200, hot_size=hot_size)
+
+
+def test_grade_padrao_mede_resistencia_a_varreduras(memory_loader, capsys):
+    """Com os parâmetros padrão do menu, há varreduras completas e a seção é exibida"""
+    from algorithms.fifo_cache import FIFOCache
+    from algorithms.lfu_cache import LFUCache
+    from algorithms.lru_cache import LRUCache
+    from simulation.simulation_engine import SimulationEngine
+
+    engine = SimulationEngine(memory_loader)
+    engine.simulate_all_algorithms([FIFOCache, LRUCache, LFUCache], cache_capacity=10,
+                                   num_users=3, requests_per_user=200, patterns=['scan'])
+    summary = engine.get_summary_statistics()
+
+    for algorithm in ('FIFOCache', 'LRUCache', 'LFUCache'):
+        assert 'avg_hot_set_after_scan' in summary[algorithm]['scan']
+    # A varredura expulsa o hot set do LRU, mas não o do LFU
+    assert summary['LRUCache']['scan']['avg_hot_set_after_scan'] == 0
+    assert summary['LFUCache']['scan']['avg_hot_set_after_scan'] > 0
+
+    capsys.readouterr()
+    engine.print_scan_resistance(summary)
+    output = capsys.readouterr().out
+    assert 'RESISTÊNCIA A VARREDURAS' in output
+    assert 'LFUCache' in output
@@ -0,0 +1,86 @@
+"""
+Testes do armazenamento de resultados (ResultsStore)
+"""
+
+import numpy as np
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from simulation.results_store import ResultsStore
+from simulation.simulation_engine import SimulationEngine
+
+
+def _grid(engine):
+    return engine.simulate_all_algorithms([FIFOCache, LRUCache], cache_capacity=10, num_users=2,
+                                          requests_per_user=200, patterns=['zipf', 'random'])
+
+
+def _cell_hashes(store):
+    return {row[0] for row in store.connection.execute("SELECT cell_hash FROM cells")}
+
+
+def test_celula_volta_igual(memory_loader, tmp_path):
+    """Uma célula salva volta com as mesmas métricas e o mesmo log de acessos"""
+    engine = SimulationEngine(memory_loader)
+    result = engine.simulate_cell(LRUCache, 'zipf', 1, verbose=False)
+    config = engine.cell_config('LRUCache', 'zipf', 1)
+
+    store = ResultsStore(tmp_path / "resultados.db")
+    store.put(config, result)
+    assert config in store
+    stored = store.get(config)
+    store.close()
+
+    assert stored['hits'] == result['hits'] and stored['hit_rate'] == result['hit_rate']
+    for column, values in result['access_log'].items():
+        assert np.array_equal(stored['access_log'][column], values)
+    assert np.array_equal(stored['text_hit_count'], result['text_hit_count'])
+
+
+def test_so_celulas_faltantes_sao_simuladas(memory_loader, tmp_path):
+    """Uma nova execução lê do banco as células salvas e simula só as que faltam"""
+    store = ResultsStore(tmp_path / "resultados.db")
+    engine = SimulationEngine(memory_loader)
+    engine.store = store
+    first = _grid(engine)
+    assert store.num_cells() == 8
+
+    missing = sorted(_cell_hashes(store))[0]
+    with store.connection:
+        store.connection.execute("DELETE FROM cells WHERE cell_hash = ?", (missing,))
+
+    simulated = []
+    engine = SimulationEngine(memory_loader)
+    engine.store = store
+    simulate_user = engine.simulate_user
+
+    def counting_simulate_user(*args, **kwargs):
+        simulated.append(args)
+        return simulate_user(*args, **kwargs)
+
+    engine.simulate_user = counting_simulate_user
+    second = _grid(engine)
+
+    assert len(simulated) == 1 and missing in _cell_hashes(store)
+    for algorithm in first:
+        assert [r['hits'] for r in second[algorithm]] == [r['hits'] for r in first[algorithm]]
+    store.close()
+
+
+def test_configuracoes_diferentes_nao_reaproveitam(memory_loader, tmp_path):
+    """Perfil de disco e log de acessos fazem parte da chave da célula"""
+    store = ResultsStore(tmp_path / "resultados.db")
+    for kwargs in ({'virtual_clock': True, 'disk_profile': 'ssd'},
+                   {'virtual_clock': True, 'disk_profile': 'hdd'},
+                   {'virtual_clock': True, 'disk_profile': 'hdd', 'keep_access_log': False}):
+        engine = SimulationEngine(memory_loader, **kwargs)
+        engine.store = store
+        engine.simulate_cell(LRUCache, 'zipf', 1, verbose=False)
+    assert store.num_cells() == 3
+
+    ssd, hdd = (store.get(SimulationEngine(memory_loader, virtual_clock=True, disk_profile=profile)
+                          .cell_config('LRUCache', 'zipf', 1))
+                for profile in ('ssd', 'hdd'))
+    assert hdd['avg_load_time'] > ssd['avg_load_time']
+    assert len(hdd['access_log']['was_hit']) == 200
+    store.close()
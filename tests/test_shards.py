@@ -0,0 +1,77 @@
+"""
+Testes da amostragem espacial (SHARDS)
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+from simulation.shards import ShardsSampler, hash_keys, shards_compare
+from simulation.trace_store import save_requests
+
+ALGORITHMS = [FIFOCache, LRUCache, LFUCache, ARCCache]
+CAPACITIES = [1, 5, 20, 80]
+
+
+def _requests(size: int = 20_000):
+    return np.random.default_rng(4).zipf(1.2, size=size) % 500 + 1
+
+
+def _exact_miss_ratio(cache_class, requests, capacity: int) -> float:
+    """Miss ratio da simulação completa, sem amostragem"""
+    cache = cache_class(capacity=capacity)
+    for text_number in requests.tolist():
+        cache.get(text_number, lambda n: ("", 0.0))
+    return cache.misses / len(requests)
+
+
+def test_taxa_um_igual_a_simulacao_exata():
+    """Com rate=1.0 a amostra é o trace inteiro e o miss ratio é o exato"""
+    requests = _requests()
+    results = shards_compare(ALGORITHMS, requests, CAPACITIES, rate=1.0, num_salts=2)
+
+    for cache_class in ALGORITHMS:
+        for capacity, result in zip(CAPACITIES, results[cache_class.__name__]):
+            assert result['rate'] == 1.0
+            assert result['sampled_requests'] == len(requests)
+            assert result['scaled_capacity'] == [capacity, capacity]
+            assert result['miss_ratio'] == _exact_miss_ratio(cache_class, requests, capacity)
+            assert result['std_error'] == 0.0
+
+
+def test_amostra_guarda_todos_os_acessos_dos_textos(tmp_path):
+    """Um texto amostrado entra com todas as requisições, na ordem original"""
+    requests = _requests()
+    sample = ShardsSampler(rate=0.1, salt=1).sample(requests, chunk_size=3000)
+
+    chosen = np.unique(sample['requests'])
+    expected = requests[np.isin(requests, chosen)]
+    assert np.array_equal(sample['requests'], expected)
+    assert (hash_keys(chosen, 1) < np.uint64(int(0.1 * 2 ** 64))).all()
+
+    # Mesmo resultado lendo de um trace em disco
+    trace = save_requests(requests, tmp_path / "trace")
+    from_trace = ShardsSampler(rate=0.1, salt=1).sample(trace, chunk_size=3000)
+    assert np.array_equal(sample['requests'], from_trace['requests'])
+
+
+def test_tamanho_fixo_limita_textos_distintos():
+    """Com max_keys, a amostra tem no máximo max_keys textos distintos"""
+    requests = _requests()
+    sample = ShardsSampler(max_keys=50).sample(requests, chunk_size=4096)
+    assert len(np.unique(sample['requests'])) == 50
+
+    everything = ShardsSampler(max_keys=10_000).sample(requests)
+    assert everything['rate'] == 1.0
+    assert np.array_equal(everything['requests'], requests)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'rate': 0.1, 'max_keys': 10}, {'rate': 0},
+                                    {'rate': 1.5}, {'max_keys': 0}])
+def test_parametros_invalidos(kwargs):
+    """Exatamente um entre rate e max_keys, dentro dos limites"""
+    with pytest.raises(ValueError):
+        ShardsSampler(**kwargs)
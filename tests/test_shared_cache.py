@@ -0,0 +1,44 @@
+"""
+Testes do cache compartilhado entre usuários (simulate_shared_cache)
+"""
+
+import time
+
+from algorithms.lru_cache import LRUCache
+from simulation.simulation_engine import SimulationEngine
+
+
+class SlowLoader:
+    """Loader em memória que espera um tempo fixo por leitura, como um disco lento"""
+
+    def __init__(self, total_texts: int = 100, latency: float = 0.004):
+        self.total_texts = total_texts
+        self.latency = latency
+
+    def load_text(self, text_number: int):
+        time.sleep(self.latency)
+        return f"Conteúdo do texto {text_number}", self.latency
+
+
+def test_leitura_fora_do_lock_escala_com_usuarios():
+    """Com leituras lentas, mais usuários atendem mais requisições por segundo"""
+    engine = SimulationEngine(SlowLoader())
+    single = engine.simulate_shared_cache(LRUCache, num_users=1, requests_per_user=60,
+                                          pattern='random', verbose=False)
+    many = engine.simulate_shared_cache(LRUCache, num_users=8, requests_per_user=60,
+                                        pattern='random', verbose=False)
+
+    assert many['throughput'] > 3 * single['throughput']
+    # A espera pelo lock não inclui as leituras dos outros usuários
+    assert many['lock_wait_mean'] < SlowLoader().latency / 4
+
+
+def test_hits_por_usuario_somam_o_total(memory_loader):
+    """Os hits por usuário somam os hits do cache compartilhado, nos dois modos"""
+    engine = SimulationEngine(memory_loader)
+    for mode in ('threads', 'interleaved'):
+        result = engine.simulate_shared_cache(LRUCache, num_users=4, requests_per_user=200,
+                                              pattern='zipf', mode=mode, verbose=False)
+        assert sum(u['hits'] for u in result['per_user']) == result['hits']
+        assert sum(u['requests'] for u in result['per_user']) == result['total_requests']
+        assert result['hits'] + result['misses'] == result['total_requests']
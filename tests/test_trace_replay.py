@@ -0,0 +1,79 @@
+"""
+Testes da reprodução de traces e das métricas de tempo dos caches
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.arc_cache import ARCCache
+from core.cache_interface import RECENT_LOAD_TIMES
+from simulation.simulation_engine import SimulationEngine
+from simulation.trace_store import save_requests
+
+ALGORITHMS = [FIFOCache, LRUCache, LFUCache, ARCCache]
+
+
+@pytest.mark.parametrize('cache_class', ALGORITHMS)
+def test_replay_trace_nao_acumula_tempos(tmp_path, memory_loader, cache_class):
+    """Um trace grande não faz load_times crescer com o número de requisições"""
+    requests = np.random.default_rng(0).integers(1, 201, size=200_000)
+    trace = save_requests(requests, tmp_path / "trace")
+
+    cache = cache_class(capacity=20)
+    result = SimulationEngine(memory_loader).replay_trace(cache, trace, chunk_size=1 << 14)
+
+    assert len(cache.load_times) <= RECENT_LOAD_TIMES
+    assert cache.load_count == len(requests)
+    assert result['hits'] + result['misses'] == len(requests)
+    assert result['total_load_time'] == pytest.approx(cache.total_load_time)
+
+
+@pytest.mark.parametrize('cache_class', ALGORITHMS)
+def test_metricas_de_tempo_iguais_a_soma_dos_gets(memory_loader, cache_class):
+    """avg_load_time e total_load_time continuam sendo a média e a soma dos get()"""
+    cache = cache_class(capacity=5)
+    times = [cache.get(text_number, memory_loader.load_text)[1]
+             for text_number in [1, 2, 3, 1, 4, 5, 6, 2, 7, 1]]
+
+    metrics = cache.get_metrics()
+    assert metrics['total_load_time'] == pytest.approx(sum(times))
+    assert metrics['avg_load_time'] == pytest.approx(sum(times) / len(times))
+    assert list(cache.load_times) == times
+
+
+@pytest.mark.parametrize('cache_class', ALGORITHMS)
+def test_prefetch_nao_altera_metricas(memory_loader, cache_class):
+    """prefetch() admite o texto sem mudar contadores nem tempos"""
+    cache = cache_class(capacity=5)
+    for text_number in [1, 2, 3]:
+        cache.get(text_number, memory_loader.load_text)
+    before = cache.get_metrics()
+    recent = list(cache.load_times)
+
+    assert cache.prefetch(4, memory_loader.load_text)
+
+    assert cache.is_in_cache(4)
+    assert cache.get_metrics() == {**before, 'current_size': before['current_size'] + 1}
+    assert list(cache.load_times) == recent
+
+
+def test_log_identifica_usuario_pelo_cliente(tmp_path):
+    """No padrão CLF, o usuário é o endereço do cliente, não o authuser"""
+    from simulation.trace_store import import_access_log
+
+    log_path = tmp_path / "access.log"
+    log_path.write_text(
+        '10.0.0.1 - - [10/Oct/2025:13:55:36 -0300] "GET /texts/texto_42.txt HTTP/1.1" 200 6120\n'
+        '10.0.0.2 - - [10/Oct/2025:13:55:37 -0300] "GET /texts/texto_7.txt HTTP/1.1" 200 512\n'
+        '10.0.0.1 - ana [10/Oct/2025:13:55:38 -0300] "GET /texts/texto_9 HTTP/1.1" 200 80\n'
+        '10.0.0.1 - - [10/Oct/2025:13:55:39 -0300] "GET /index.html HTTP/1.1" 200 80\n',
+        encoding="utf-8")
+    trace = import_access_log(str(log_path), str(tmp_path / "trace"))
+
+    chunk = next(trace.iter_chunks())
+    assert list(chunk['text_ids']) == [42, 7, 9]
+    assert list(chunk['user_ids']) == [0, 1, 0]
+    assert np.allclose(np.diff(chunk['timestamps']), [1.0, 1.0])
@@ -0,0 +1,101 @@
+"""
+Testes do relógio virtual do motor de simulação
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from algorithms.lru_cache import LRUCache
+from core.text_loader import disk_read_time, open_loader
+from simulation.corpus_generator import CorpusGenerator
+from simulation.request_generator import RequestGenerator
+from simulation.simulation_engine import SimulationEngine
+
+# Perfil lento o bastante para que uma única espera real fosse percebida
+SLOW_DISK = {'latency': 0.05, 'bandwidth': 1e6}
+
+
+@pytest.fixture(scope='module')
+def slow_loader(tmp_path_factory):
+    """Loader de um corpus sintético com disco lento (cada leitura real espera)"""
+    directory = tmp_path_factory.mktemp("corpus_lento")
+    CorpusGenerator(num_texts=40, distribution='lognormal', mean_words=40,
+                    seed=2).write(str(directory), 'txt')
+    return open_loader(str(directory), disk_profile=SLOW_DISK)
+
+
+def test_grade_no_relogio_virtual_nao_espera_o_disco(slow_loader):
+    """Com virtual_clock, os misses custam a leitura modelada e nada espera de verdade"""
+    engine = SimulationEngine(slow_loader, virtual_clock=True, keep_access_log=True)
+
+    start = time.perf_counter()
+    results = engine.simulate_all_algorithms([LRUCache], cache_capacity=5, num_users=2,
+                                             requests_per_user=300, patterns=['zipf'])
+    assert time.perf_counter() - start < 300 * SLOW_DISK['latency']
+
+    sizes = slow_loader.text_sizes()
+    for result in results['LRUCache']:
+        log = result['access_log']
+        expected = np.where(log['was_hit'], 0.0,
+                            disk_read_time(SLOW_DISK, sizes[log['text_id']]))
+        assert np.allclose(log['latency_ns'] / 1e9, expected)
+        assert result['simulation_time'] == pytest.approx(expected.sum())
+        assert result['avg_load_time'] == pytest.approx(expected.mean())
+
+
+def test_relogio_virtual_tem_os_mesmos_hits(slow_loader):
+    """O relógio virtual muda só os tempos, não a sequência de hits e misses"""
+    wall = SimulationEngine(slow_loader, keys_only=True)
+    virtual = SimulationEngine(slow_loader, virtual_clock=True)
+
+    requests, trace_info = wall.generate_user_trace('zipf', 1, 500, 5)
+    wall_result = wall.simulate_user(LRUCache(5), requests, 1, 'zipf', trace_info, verbose=False)
+    virtual_result = virtual.simulate_user(LRUCache(5), requests, 1, 'zipf', trace_info,
+                                           verbose=False)
+
+    assert np.array_equal(wall_result['access_log']['was_hit'],
+                          virtual_result['access_log']['was_hit'])
+
+
+def test_simulate_timed_nao_usa_o_loader_real(slow_loader):
+    """O EventSimulator modela o disco; o loader com perfil lento nunca é chamado"""
+    engine = SimulationEngine(slow_loader)
+    generator = RequestGenerator(slow_loader.total_texts, seed=0)
+    requests = generator.generate_user_requests(500, 'zipf')
+    arrivals = generator.generate_arrivals(500, 'poisson', rate=100)
+
+    start = time.perf_counter()
+    result = engine.simulate_timed(LRUCache(5), requests, arrivals, disk_latency=0.01)
+    assert time.perf_counter() - start < result['misses'] * SLOW_DISK['latency']
+    assert result['mean_response_time'] > 0
+
+
+def test_simulate_timed_usa_o_perfil_do_motor(slow_loader):
+    """Sem fila, simulate_timed e simulate_user dão o mesmo tempo por requisição"""
+    engine = SimulationEngine(slow_loader, virtual_clock=True)
+    requests, trace_info = engine.generate_user_trace('zipf', 1, 300, 5)
+    user = engine.simulate_user(LRUCache(5), requests, 1, 'zipf', trace_info, verbose=False)
+
+    # Chegadas bem espaçadas: nenhuma leitura espera na fila
+    arrivals = np.arange(len(requests), dtype=np.float64) * 10
+    timed = engine.simulate_timed(LRUCache(5), requests, arrivals)
+
+    assert timed['mean_queue_delay'] == 0.0
+    assert timed['mean_response_time'] == pytest.approx(user['avg_load_time'])
+    latency_ns = user['access_log']['latency_ns']
+    assert np.allclose(timed['response_times'], latency_ns / 1e9)
+
+
+def test_fila_do_disco_atende_em_ordem():
+    """Com um canal, leituras enfileiradas terminam uma após a outra, na ordem de chegada"""
+    from simulation.event_engine import EventSimulator
+
+    read_times = np.array([0.0, 1.0, 2.0, 3.0])
+    simulator = EventSimulator(LRUCache(3), lambda text: (text, 0.0), read_times=read_times)
+    result = simulator.run([1, 2, 3], [0.0, 0.0, 0.0])
+
+    assert np.allclose(result['response_times'], [1.0, 3.0, 6.0])
+    assert result['virtual_time'] == pytest.approx(6.0)
+    assert result['disk_utilization'] == pytest.approx(1.0)